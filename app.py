@@ -1,13 +1,14 @@
 import streamlit as st
+import os
 import time
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from models import (
     CandidateProfile, JobDescription, InterviewConfig, 
     Difficulty, InterviewStatus
 )
 from engine import InterviewEngine
+from dashboard import get_artifacts
+from live_scoring import LiveScorer
+from live_panels import timer_panel, trace_panel
 
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="Hack2Hire Elite - AI Interview Simulation", layout="wide", page_icon="👔")
@@ -127,6 +128,15 @@ if 'interview_started' not in st.session_state:
 if 'interview_finished' not in st.session_state:
     st.session_state.interview_finished = False
 
+
+@st.cache_resource
+def get_archive():
+    """FEATURE: One write-behind session archive per server process (opt-in via INTERVIEW_ARCHIVE_PATH)."""
+    from archive import ARCHIVE_PATH_ENV, SessionArchive
+    path = os.environ.get(ARCHIVE_PATH_ENV)
+    return SessionArchive(path) if path else None
+
+
 # --- HEADER SECTION ---
 st.markdown('<h1 class="main-header">Hack2Hire Elite 💼</h1>', unsafe_allow_html=True)
 st.markdown('<p style="color: #64748b; font-size: 1.2rem; font-weight: 500; margin-top: -10px;">Deterministic Executive Performance Engine</p>', unsafe_allow_html=True)
@@ -195,6 +205,12 @@ if not st.session_state.interview_started:
 elif st.session_state.interview_finished:
     # --- RESULT DASHBOARD ---
     result = st.session_state.engine.generate_final_report()
+    archive = get_archive()
+    if archive is not None and st.session_state.get("archived_engine") is not st.session_state.engine:
+        # Queued for the archive's writer thread; the dashboard never waits on disk
+        archive.submit(st.session_state.engine)
+        st.session_state.archived_engine = st.session_state.engine
+    artifacts = get_artifacts(result)
     
     st.markdown('<div class="glass-card">', unsafe_allow_html=True)
     st.markdown(f"# {result.hiring_readiness}")
@@ -202,14 +218,7 @@ elif st.session_state.interview_finished:
     c1, c2, c3 = st.columns([1, 1, 1])
     with c1:
         # Gauge for Score
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number",
-            value = result.final_score,
-            title = {'text': "Readiness Score (%)"},
-            gauge = {'axis': {'range': [0, 100]}, 'bar': {'color': "#60a5fa"}}
-        ))
-        fig.update_layout(height=250, margin=dict(t=30, b=0, l=30, r=30), paper_bgcolor='rgba(0,0,0,0)', font_color='white')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(artifacts.gauge, use_container_width=True)
         
     with c2:
         # Confidence Metric
@@ -231,11 +240,7 @@ elif st.session_state.interview_finished:
         cc1, cc2 = st.columns(2)
         with cc1:
             st.markdown("### 🕸️ Skill Radar")
-            df_radar = pd.DataFrame(list(result.skill_breakdown.items()), columns=['Skill', 'Score'])
-            fig_r = px.line_polar(df_radar, r='Score', theta='Skill', line_close=True)
-            fig_r.update_traces(fill='toself', line_color='#f472b6', marker=dict(size=8))
-            fig_r.update_layout(paper_bgcolor='rgba(0,0,0,0)', polar=dict(bgcolor='rgba(0,0,0,0)'), font_color='white')
-            st.plotly_chart(fig_r, use_container_width=True)
+            st.plotly_chart(artifacts.radar, use_container_width=True)
         with cc2:
             st.markdown("### 🏗️ Analysis")
             st.success("✅ **Strengths:** " + ", ".join(result.strengths if result.strengths else ["None detected"]))
@@ -245,18 +250,10 @@ elif st.session_state.interview_finished:
             
     with t2:
         st.markdown("### 📅 Interview Decision History")
-        for i, res in enumerate(result.timeline):
-            st.markdown(f"""
-            <div class="timeline-item">
-                <div class="timeline-dot"></div>
-                <b>STEP {i+1}: {res.question.skill} ({res.difficulty_at_time.value.upper()})</b><br>
-                <small style="color: #64748b;">Score: {res.score.overall:.1f}% | Time: {res.response.time_taken:.1f}s | State: {res.state_at_time}</small><br>
-                <p style="margin-top: 5px; font-size: 0.9rem;">"{res.feedback}"</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(artifacts.timeline_html, unsafe_allow_html=True)
 
     st.markdown("### 🔍 Root Cause / Decision Trace")
-    log_html = "<br>".join(st.session_state.engine.engine_logs)
+    log_html = st.session_state.engine.trace.render_html()
     st.markdown(f'<div class="log-container">{log_html}</div>', unsafe_allow_html=True)
     
     if st.button("🔄 Reset System"):
@@ -297,43 +294,41 @@ else:
     </div>
     """, unsafe_allow_html=True)
 
-    # Form
-    with st.form("answer_form", clear_on_submit=True):
-        st.markdown("<p class='engine-thinking'>⚙️ ENGINE IS MONITORING ARTICULATION...</p>", unsafe_allow_html=True)
-        ans = st.text_area("Candidate Response", placeholder="Provide a structured technical explanation...", height=300)
-        cbtn, cmsg = st.columns([1, 3])
-        with cbtn:
-            submitted = st.form_submit_button("⏩ Submit Response")
-        with cmsg:
-            st.markdown(f"<p style='margin-top: 10px; color: #64748b;'>Engine state: <b>{engine.state.value}</b></p>", unsafe_allow_html=True)
-            
-        if submitted:
-            time_spent = time.time() - st.session_state.start_time
-            st.session_state.current_question = engine.process_response(q, ans, time_spent)
-            st.session_state.start_time = time.time()
-            if st.session_state.current_question is None:
-                st.session_state.interview_finished = True
-            st.rerun()
-
-    # Dynamic Timer Logic
-    elapsed = time.time() - st.session_state.start_time
-    remaining = max(0, q.time_limit - elapsed)
-    
-    tc1, tc2 = st.columns([4, 1])
-    with tc1:
-        st.progress(min(1.0, elapsed/q.time_limit))
-    with tc2:
-        if remaining <= 10 and remaining > 0:
-            st.markdown(f"<p class='timer-warning'>⚠️ {int(remaining)}s</p>", unsafe_allow_html=True)
-        elif remaining == 0:
-            st.markdown("<p class='timer-warning'>⏱️ TIME EXCEEDED</p>", unsafe_allow_html=True)
-        else:
-            st.markdown(f"<p style='color: #64748b; font-weight: 700;'>⏱️ {int(remaining)}s</p>", unsafe_allow_html=True)
+    # Answer input sits outside a form so every rerun sees the current text for live scoring;
+    # the per-question key gives each question a fresh, empty text area
+    st.markdown("<p class='engine-thinking'>⚙️ ENGINE IS MONITORING ARTICULATION...</p>", unsafe_allow_html=True)
+    ans = st.text_area(
+        "Candidate Response", placeholder="Provide a structured technical explanation...", height=300,
+        key=f"answer_{engine.current_question_index}_{q.id}"
+    )
+    # FEATURE: Incremental live scoring (only the edited part of the answer is re-analyzed)
+    scorer = st.session_state.get("live_scorer")
+    if scorer is None or scorer.question is not q:
+        scorer = st.session_state.live_scorer = LiveScorer(q)
+    live_stats = scorer.update(ans)
+    cbtn, cmsg = st.columns([1, 3])
+    with cbtn:
+        submitted = st.button("⏩ Submit Response")
+    with cmsg:
+        provisional = engine._score_components(q, ans, time.time() - st.session_state.start_time, live_stats)
+        st.markdown(
+            f"<p style='margin-top: 10px; color: #64748b;'>Engine state: <b>{engine.state.value}</b> | "
+            f"Live accuracy: <b>{provisional.accuracy:.0f}%</b> | Clarity: <b>{provisional.clarity:.0f}%</b> | "
+            f"Words: <b>{live_stats.words}</b></p>",
+            unsafe_allow_html=True
+        )
+        
+    if submitted:
+        time_spent = time.time() - st.session_state.start_time
+        st.session_state.current_question = engine.process_response(q, ans, time_spent, live_stats)
+        st.session_state.start_time = time.time()
+        if st.session_state.current_question is None:
+            st.session_state.interview_finished = True
+        st.rerun()
 
-    with st.expander("🛠️ Decision Trace (BETA)"):
-        st.markdown('<p style="font-family: Courier; color: #10b981;">Engine internal logs are generated on every transition.</p>', unsafe_allow_html=True)
-        log_h = "<br>".join(engine.engine_logs)
-        st.markdown(f'<div class="log-container">{log_h}</div>', unsafe_allow_html=True)
+    # Dynamic Timer Logic: the countdown ticks client-side, the trace is a fragment (see live_panels.py)
+    timer_panel(q.time_limit)
+    trace_panel(engine.trace)
         
     if st.button("⏹️ Manual Override / Terminate"):
         engine.state = InterviewStatus.EARLY_TERMINATED
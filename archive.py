@@ -0,0 +1,353 @@
+"""Durable SQLite archive of finished interviews.
+
+Three tables hold what a session leaves behind:
+
+    sessions  one row per interview: candidate, status, scores, finish time, the
+              profile/JD/config and the InterviewResult summary (JSON)
+    answers   one row per answered question: the question as asked, the answer,
+              every score dimension and the feedback
+    traces    the structured decision trace of the session (JSON events)
+
+submit() takes an uncompressed engine snapshot (see snapshot.py) and queues
+it. A service request or a Streamlit rerun therefore never waits on the
+report, the row serialization or the disk. Later reads of the live engine,
+such as its memoized report, cannot race the writer. A writer thread drains
+the queue, restores each snapshot against the engine's own bank index,
+builds the rows and commits up to `batch_size` sessions per transaction. A
+session that fails to build or write is counted in `failed` and logged, and
+the writer carries on. The queue holds at most `max_pending` sessions. While
+the disk cannot keep up, further submissions are dropped, counted in
+`dropped` and logged, rather than blocking callers or growing memory without
+limit. After the first
+session of a batch arrives it waits at most `linger` seconds for more. The
+database runs in WAL mode with synchronous=NORMAL, so a commit costs no fsync
+and readers in other threads or processes never block the writer. A power
+loss can drop the last few commits but never corrupts the file.
+
+Indexes cover the usual lookups: sessions by candidate, by status and by
+finish date, and answers by question id and by skill.
+
+    archive = SessionArchive("interviews.db")
+    archive.submit(engine)                 # returns the session id immediately
+    archive.sessions(candidate="Alex", since=time.time() - 86400)
+    archive.load_result(session_id)        # InterviewResult with its timeline
+"""
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from models import InterviewResult, Question, QuestionResult
+from decision_trace import TraceEvent
+from engine import InterviewEngine
+
+ARCHIVE_PATH_ENV = "INTERVIEW_ARCHIVE_PATH"
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_LINGER = 0.05
+DEFAULT_MAX_PENDING = 10_000
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    candidate TEXT NOT NULL,
+    experience_level TEXT NOT NULL,
+    status TEXT NOT NULL,
+    final_score REAL NOT NULL,
+    confidence_score REAL NOT NULL,
+    hiring_readiness TEXT NOT NULL,
+    termination_reason TEXT,
+    questions INTEGER NOT NULL,
+    finished_at REAL NOT NULL,
+    profile TEXT NOT NULL,
+    report TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS answers (
+    session_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    question_id TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    state TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    time_taken REAL NOT NULL,
+    is_timeout INTEGER NOT NULL,
+    accuracy REAL NOT NULL,
+    relevance REAL NOT NULL,
+    clarity REAL NOT NULL,
+    time_efficiency REAL NOT NULL,
+    overall REAL NOT NULL,
+    bonus REAL NOT NULL,
+    feedback TEXT NOT NULL,
+    question TEXT NOT NULL,
+    PRIMARY KEY (session_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS traces (
+    session_id TEXT PRIMARY KEY,
+    dropped INTEGER NOT NULL,
+    events TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_candidate ON sessions (candidate, finished_at);
+CREATE INDEX IF NOT EXISTS sessions_by_status ON sessions (status, finished_at);
+CREATE INDEX IF NOT EXISTS sessions_by_finished ON sessions (finished_at);
+CREATE INDEX IF NOT EXISTS answers_by_question ON answers (question_id);
+CREATE INDEX IF NOT EXISTS answers_by_skill ON answers (skill, overall);
+"""
+
+_ANSWER_COLUMNS = (
+    "session_id", "position", "question_id", "skill", "difficulty", "state", "answer", "time_taken", "is_timeout",
+    "accuracy", "relevance", "clarity", "time_efficiency", "overall", "bonus", "feedback", "question",
+)
+_SESSION_COLUMNS = (
+    "session_id", "candidate", "experience_level", "status", "final_score", "confidence_score",
+    "hiring_readiness", "termination_reason", "questions", "finished_at", "profile", "report",
+)
+
+
+class SessionRows(NamedTuple):
+    """One archived session as ready-to-insert rows."""
+    session: tuple
+    answers: List[tuple]
+    trace: tuple
+
+
+def session_rows(engine, session_id: str, finished_at: Optional[float] = None) -> SessionRows:
+    """Copy everything the archive keeps out of `engine` (report, history, trace)."""
+    result = engine.generate_final_report()
+    records = engine.records
+    profile = {
+        "candidate": engine.candidate.model_dump(mode="json"),
+        "job_description": engine.jd.model_dump(mode="json"),
+        "config": engine.config.model_dump(mode="json"),
+    }
+    session = (
+        session_id, engine.candidate.name, engine.candidate.experience_level, result.status.value,
+        result.final_score, result.confidence_score, result.hiring_readiness, result.termination_reason,
+        len(records), time.time() if finished_at is None else finished_at,
+        json.dumps(profile), result.model_dump_json(exclude={"timeline"}),
+    )
+    answers = [
+        (
+            session_id, i, q.id, q.skill, records.difficulty(i).value, records.state(i).value,
+            records.answers[i], records.time_taken(i), int(records.is_timeout(i)),
+            *records.scores(i), records.feedback[i], q.model_dump_json(),
+        )
+        for i, q in enumerate(records.questions)
+    ]
+    trace = (session_id, engine.trace.dropped, json.dumps([e.to_dict() for e in engine.trace], default=str))
+    return SessionRows(session, answers, trace)
+
+
+_STOP = object()
+
+
+class SessionArchive:
+    """FEATURE: Write-behind SQLite archive of finished sessions."""
+
+    def __init__(
+        self, path: str, batch_size: int = DEFAULT_BATCH_SIZE, linger: float = DEFAULT_LINGER,
+        max_pending: int = DEFAULT_MAX_PENDING
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.linger = linger
+        self.submitted = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_error: Optional[BaseException] = None
+        self._count_lock = threading.Lock()   # submit() runs on many session threads
+        # One slot is kept free for close()'s stop marker
+        self._queue: "queue.Queue" = queue.Queue(max_pending + 1)
+        self._max_pending = max_pending
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_lock = threading.Lock()
+        # Create the schema up front so reads work before the first batch lands
+        self._connect().close()
+        self._writer = threading.Thread(target=self._run, name="session-archive", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        return db
+
+    # --- writing ---
+    def submit(self, engine, session_id: Optional[str] = None) -> str:
+        """Queue a snapshot of a finished engine for archiving; returns its session id without touching disk."""
+        session_id = session_id or uuid.uuid4().hex
+        item = (engine.snapshot(compress=False), engine.index, session_id, time.time())
+        with self._count_lock:
+            if self._queue.qsize() >= self._max_pending:
+                self.dropped += 1
+                logger.warning("Archive queue full (%d pending); dropped session %s", self._max_pending, session_id)
+                return session_id
+            self._queue.put_nowait(item)
+            self.submitted += 1
+        return session_id
+
+    def flush(self):
+        """Block until every submitted session has been written (or has failed)."""
+        self._queue.join()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        with self._reader_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+        atexit.unregister(self.close)
+
+    def _run(self):
+        db = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                deadline = time.monotonic() + self.linger
+                while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                    try:
+                        batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                    except queue.Empty:
+                        break
+                try:
+                    rows = [r for r in map(self._rows, (item for item in batch if item is not _STOP)) if r]
+                    if rows:
+                        self._write(db, rows)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if batch[-1] is _STOP:
+                    return
+        finally:
+            db.close()
+
+    def _rows(self, item: tuple) -> Optional[SessionRows]:
+        snapshot, index, session_id, finished_at = item
+        try:
+            return session_rows(InterviewEngine.restore(snapshot, index), session_id, finished_at)
+        except Exception as e:
+            self._failed(1, e)
+            return None
+
+    def _failed(self, sessions: int, error: Exception):
+        self.failed += sessions
+        self.last_error = error
+        logger.exception("Failed to archive %d session(s) to %s", sessions, self.path)
+
+    def _write(self, db: sqlite3.Connection, rows: List[SessionRows]):
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            db.executemany("DELETE FROM answers WHERE session_id = ?", [(r.session[0],) for r in rows])
+            db.executemany(_insert("sessions", _SESSION_COLUMNS), [r.session for r in rows])
+            db.executemany(_insert("answers", _ANSWER_COLUMNS), [a for r in rows for a in r.answers])
+            db.executemany("INSERT OR REPLACE INTO traces VALUES (?, ?, ?)", [r.trace for r in rows])
+            db.execute("COMMIT")
+        except Exception as e:
+            if db.in_transaction:
+                db.execute("ROLLBACK")
+            self._failed(len(rows), e)
+            return
+        self.written += len(rows)
+        self.batches += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+            "pending": self._queue.qsize(),
+            "batches": self.batches,
+        }
+
+    # --- reading ---
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._reader_lock:
+            if self._reader is None:
+                self._reader = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+                self._reader.row_factory = sqlite3.Row
+            return [dict(row) for row in self._reader.execute(sql, params)]
+
+    def sessions(
+        self, candidate: Optional[str] = None, status: Optional[str] = None,
+        since: Optional[float] = None, until: Optional[float] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Archived session rows (without profile/report JSON), newest first."""
+        where, params = _filters(candidate=candidate, status=status)
+        if since is not None:
+            where.append("finished_at >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("finished_at < ?")
+            params.append(until)
+        columns = ", ".join(c for c in _SESSION_COLUMNS if c not in ("profile", "report"))
+        return self._query(
+            f"SELECT {columns} FROM sessions{_where(where)} ORDER BY finished_at DESC LIMIT ?", (*params, limit)
+        )
+
+    def answers(
+        self, question_id: Optional[str] = None, skill: Optional[str] = None, limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Archived answer rows (without the question JSON) across sessions."""
+        where, params = _filters(question_id=question_id, skill=skill)
+        columns = ", ".join(c for c in _ANSWER_COLUMNS if c != "question")
+        return self._query(f"SELECT {columns} FROM answers{_where(where)} LIMIT ?", (*params, limit))
+
+    def load_result(self, session_id: str) -> Optional[InterviewResult]:
+        """The archived InterviewResult of a session, timeline included."""
+        found = self._query("SELECT report FROM sessions WHERE session_id = ?", (session_id,))
+        if not found:
+            return None
+        result = InterviewResult.model_validate_json(found[0]["report"])
+        result.timeline = [
+            QuestionResult(
+                question=Question.model_validate_json(row["question"]),
+                response={"question_id": row["question_id"], "answer": row["answer"],
+                          "time_taken": row["time_taken"], "is_timeout": bool(row["is_timeout"])},
+                score={k: row[k] for k in ("accuracy", "relevance", "clarity", "time_efficiency", "overall", "bonus")},
+                state_at_time=row["state"],
+                difficulty_at_time=row["difficulty"],
+                feedback=row["feedback"]
+            )
+            for row in self._query("SELECT * FROM answers WHERE session_id = ? ORDER BY position", (session_id,))
+        ]
+        return result
+
+    def load_trace(self, session_id: str) -> Tuple[List[TraceEvent], int]:
+        """Archived trace events of a session and the count dropped before archiving."""
+        found = self._query("SELECT dropped, events FROM traces WHERE session_id = ?", (session_id,))
+        if not found:
+            return [], 0
+        events = [
+            TraceEvent(e.pop("type"), e.pop("ts"), e)
+            for e in json.loads(found[0]["events"])
+        ]
+        return events, found[0]["dropped"]
+
+
+def _insert(table: str, columns: Tuple[str, ...]) -> str:
+    return f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+
+def _filters(**equals) -> Tuple[List[str], list]:
+    where, params = [], []
+    for column, value in equals.items():
+        if value is not None:
+            where.append(f"{column} = ?")
+            params.append(value)
+    return where, params
+
+
+def _where(clauses: List[str]) -> str:
+    return f" WHERE {' AND '.join(clauses)}" if clauses else ""
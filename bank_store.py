@@ -0,0 +1,244 @@
+"""Memory-mapped on-disk question bank for very large banks.
+
+File layout (little-endian):
+
+    header   MAGIC, version, question count, skill count, pool count, and the
+             byte offsets of the sections below
+    skills   u16 length + UTF-8 name, one per skill code
+    pools    (difficulty u8, skill u16, start u32, end u32) per (difficulty, skill);
+             questions are sorted by (difficulty, skill, id), so every pool is a
+             contiguous range of positions
+    entries  fixed-size (record offset, record length, id offset, id length,
+             skill code, difficulty code) per question position
+    by_id    u32 positions sorted by question id, for binary-search lookup
+    ids      concatenated UTF-8 question ids
+    records  one JSON-encoded Question per position
+
+The index sections are read straight out of the mapping, so worker processes
+share them through the page cache. A Question is decoded only when it is
+actually selected. Decoded questions sit in a bounded LRU and in a weak
+table. While anything still references a decoded question, such as a session
+history or a cached alias table, its position decodes to that same object. A
+fresh object is decoded only after every reference is gone. So identity-based
+consumers never see two live objects for one position.
+
+    python question_bank.py pack bank.qbank
+    QUESTION_BANK_PATH=bank.qbank streamlit run app.py
+"""
+import mmap
+import os
+import struct
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+from models import Question, Difficulty
+
+MAGIC = b"QBNK"
+VERSION = 1
+DIFFICULTY_CODES: Tuple[Difficulty, ...] = (Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD)
+_DIFFICULTY_INDEX = {d: i for i, d in enumerate(DIFFICULTY_CODES)}
+
+_HEADER = struct.Struct("<4sHxxIII7Q")
+_POOL = struct.Struct("<BxHII")
+_ENTRY = struct.Struct("<QIQHHBxxxxx")
+_POS = struct.Struct("<I")
+DECODE_CACHE_SIZE = 4096
+
+
+def write_bank(questions: Iterable[Question], path: str) -> int:
+    """Write `questions` to `path` in the mapped bank format; returns the count."""
+    ordered = sorted(questions, key=lambda q: (_DIFFICULTY_INDEX[q.difficulty], q.skill, q.id))
+    skills = sorted({q.skill for q in ordered})
+    skill_codes = {s: i for i, s in enumerate(skills)}
+
+    skills_blob = bytearray()
+    for s in skills:
+        data = s.encode("utf-8")
+        skills_blob += struct.pack("<H", len(data)) + data
+
+    pools: List[Tuple[int, int, int, int]] = []
+    for pos, q in enumerate(ordered):
+        key = (_DIFFICULTY_INDEX[q.difficulty], skill_codes[q.skill])
+        if pools and pools[-1][:2] == key:
+            pools[-1] = (key[0], key[1], pools[-1][2], pos + 1)
+        else:
+            pools.append((key[0], key[1], pos, pos + 1))
+    pools_blob = b"".join(_POOL.pack(*p) for p in pools)
+
+    entries_blob, ids_blob, records_blob = bytearray(), bytearray(), bytearray()
+    seen = set()
+    for q in ordered:
+        if q.id in seen:
+            raise ValueError(f"Duplicate question id {q.id!r}.")
+        seen.add(q.id)
+        qid = q.id.encode("utf-8")
+        record = q.model_dump_json().encode("utf-8")
+        entries_blob += _ENTRY.pack(
+            len(records_blob), len(record), len(ids_blob), len(qid),
+            skill_codes[q.skill], _DIFFICULTY_INDEX[q.difficulty]
+        )
+        ids_blob += qid
+        records_blob += record
+    by_id = sorted(range(len(ordered)), key=lambda i: ordered[i].id)
+    by_id_blob = b"".join(_POS.pack(i) for i in by_id)
+
+    offset = _HEADER.size
+    sections = [skills_blob, pools_blob, entries_blob, by_id_blob, ids_blob, records_blob]
+    offsets = []
+    for blob in sections:
+        offsets.append(offset)
+        offset += len(blob)
+    header = _HEADER.pack(MAGIC, VERSION, len(ordered), len(skills), len(pools), *offsets, offset)
+    # Replace atomically: processes that have the old file mapped keep reading it intact
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        for blob in sections:
+            f.write(blob)
+    os.replace(tmp, path)
+    return len(ordered)
+
+
+class _LazyPool(Sequence):
+    """Read-only sequence of Questions over one or more position ranges of a mapped bank."""
+
+    __slots__ = ("_bank", "_ranges", "_len")
+
+    def __init__(self, bank: "MappedQuestionIndex", ranges: Tuple[range, ...]):
+        # A proxy, so pools held by per-index caches (sampler alias tables) do not keep the bank alive
+        self._bank = weakref.proxy(bank)
+        self._ranges = ranges
+        self._len = sum(len(r) for r in ranges)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _position(self, i: int) -> int:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError(i)
+        for r in self._ranges:
+            if i < len(r):
+                return r[i]
+            i -= len(r)
+        raise IndexError(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._len))]
+        return self._bank.question_at(self._position(i))
+
+    def id_at(self, i: int) -> str:
+        return self._bank.id_at(self._position(i))
+
+    def __iter__(self) -> Iterator[Question]:
+        for r in self._ranges:
+            for pos in r:
+                yield self._bank.question_at(pos)
+
+
+def _release(mm: mmap.mmap, file):
+    mm.close()
+    file.close()
+
+
+class MappedQuestionIndex:
+    """FEATURE: QuestionIndex over a memory-mapped bank file, decoding questions on demand."""
+
+    def __init__(self, path: str, decode_cache_size: int = DECODE_CACHE_SIZE):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        # Unmapped when the index is collected, i.e. once no session holds it (see question_bank.reload_bank)
+        self._release = weakref.finalize(self, _release, self._mm, self._file)
+        (magic, version, self._count, n_skills, n_pools,
+         skills_off, pools_off, self._entries_off, self._by_id_off,
+         self._ids_off, self._records_off, _end) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a question bank file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported question bank version {version} (expected {VERSION}).")
+
+        skills = []
+        pos = skills_off
+        for _ in range(n_skills):
+            (n,) = struct.unpack_from("<H", self._mm, pos)
+            skills.append(self._mm[pos + 2:pos + 2 + n].decode("utf-8"))
+            pos += 2 + n
+        self._skill_names: Tuple[str, ...] = tuple(skills)
+        self.skills: FrozenSet[str] = frozenset(skills)
+
+        self._by_key: Dict[Tuple[Difficulty, str], range] = {}
+        for i in range(n_pools):
+            d, s, start, end = _POOL.unpack_from(self._mm, pools_off + i * _POOL.size)
+            self._by_key[(DIFFICULTY_CODES[d], skills[s])] = range(start, end)
+        self._pool_cache: Dict[tuple, _LazyPool] = {}
+        self._decoded: "OrderedDict[int, Question]" = OrderedDict()
+        self._alive: "weakref.WeakValueDictionary[int, Question]" = weakref.WeakValueDictionary()
+        self._decode_cache_size = decode_cache_size
+        self._decode_lock = threading.Lock()   # Streamlit sessions and reload threads share one index
+
+    def close(self):
+        self._release()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Question]:
+        return (self.question_at(i) for i in range(self._count))
+
+    def _entry(self, pos: int) -> tuple:
+        return _ENTRY.unpack_from(self._mm, self._entries_off + pos * _ENTRY.size)
+
+    def id_at(self, pos: int) -> str:
+        _, _, id_off, id_len, _, _ = self._entry(pos)
+        start = self._ids_off + id_off
+        return self._mm[start:start + id_len].decode("utf-8")
+
+    def question_at(self, pos: int) -> Question:
+        with self._decode_lock:
+            question = self._decoded.get(pos)
+            if question is not None:
+                self._decoded.move_to_end(pos)
+                return question
+            question = self._alive.get(pos)
+            if question is None:
+                rec_off, rec_len, _, _, _, _ = self._entry(pos)
+                start = self._records_off + rec_off
+                question = self._alive[pos] = Question.model_validate_json(self._mm[start:start + rec_len])
+            self._decoded[pos] = question
+            if len(self._decoded) > self._decode_cache_size:
+                self._decoded.popitem(last=False)
+            return question
+
+    def position_of(self, question_id: str) -> Optional[int]:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (pos,) = _POS.unpack_from(self._mm, self._by_id_off + mid * _POS.size)
+            mid_id = self.id_at(pos)
+            if mid_id == question_id:
+                return pos
+            if mid_id < question_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def get(self, question_id: str) -> Optional[Question]:
+        pos = self.position_of(question_id)
+        return self.question_at(pos) if pos is not None else None
+
+    def pool(self, difficulty: Difficulty, skill: Optional[str] = None) -> _LazyPool:
+        key = (difficulty, skill)
+        pool = self._pool_cache.get(key)
+        if pool is None:
+            if skill is None:
+                ranges = tuple(r for (d, _), r in self._by_key.items() if d == difficulty)
+            else:
+                r = self._by_key.get((difficulty, skill))
+                ranges = (r,) if r is not None else ()
+            pool = self._pool_cache[key] = _LazyPool(self, ranges)
+        return pool
@@ -0,0 +1,116 @@
+"""Session archive throughput: write-behind batches vs committing each session on the request path.
+
+The baseline commits every finished session in its own transaction, in the
+submitting thread, with SQLite's default rollback journal and
+synchronous=FULL. That is what archiving "on submit" costs without the queue.
+The archive is fed from SUBMITTERS threads at once, like concurrent sessions
+in the service. The benchmark also times indexed lookups and checks that
+archived results load back equal to the engines' reports.
+
+Run from the repo root:  python -m benchmarks.bench_archive [n_sessions]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from archive import SCHEMA, SessionArchive, _ANSWER_COLUMNS, _SESSION_COLUMNS, _insert, session_rows
+from benchmarks.bench_snapshot import make_sessions
+
+SUBMITTERS = 8
+
+
+def _synchronous(path: str, engines) -> list:
+    db = sqlite3.connect(path, isolation_level=None)
+    db.execute("PRAGMA synchronous=FULL")
+    db.executescript(SCHEMA)
+    latencies = []
+    for i, engine in enumerate(engines):
+        t0 = time.perf_counter()
+        rows = session_rows(engine, f"sync-{i}")
+        db.execute("BEGIN")
+        db.execute(_insert("sessions", _SESSION_COLUMNS), rows.session)
+        db.executemany(_insert("answers", _ANSWER_COLUMNS), rows.answers)
+        db.execute("INSERT OR REPLACE INTO traces VALUES (?, ?, ?)", rows.trace)
+        db.execute("COMMIT")
+        latencies.append(time.perf_counter() - t0)
+    db.close()
+    return latencies
+
+
+def _write_behind(archive: SessionArchive, engines) -> list:
+    latencies = [[] for _ in range(SUBMITTERS)]
+
+    def submitter(k: int):
+        for i in range(k, len(engines), SUBMITTERS):
+            t0 = time.perf_counter()
+            archive.submit(engines[i], f"wb-{i}")
+            latencies[k].append(time.perf_counter() - t0)
+
+    threads = [threading.Thread(target=submitter, args=(k,)) for k in range(SUBMITTERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    archive.flush()
+    return [x for part in latencies for x in part]
+
+
+def _p(samples, q: float) -> float:
+    return sorted(samples)[int(q * (len(samples) - 1))] * 1e6
+
+
+def run(n: int = 2000) -> dict:
+    engines = make_sessions(n)
+    answers = sum(len(e.records) for e in engines)
+    tmp = tempfile.mkdtemp()
+
+    t0 = time.perf_counter()
+    sync = _synchronous(os.path.join(tmp, "sync.db"), engines)
+    sync_s = time.perf_counter() - t0
+
+    archive = SessionArchive(os.path.join(tmp, "archive.db"))
+    t0 = time.perf_counter()
+    behind = _write_behind(archive, engines)
+    behind_s = time.perf_counter() - t0
+
+    candidate = engines[0].candidate.name
+    question_id = engines[0].records.questions[0].id
+    t0 = time.perf_counter()
+    for _ in range(100):
+        archive.sessions(candidate=candidate)
+    by_candidate_us = (time.perf_counter() - t0) / 100 * 1e6
+    t0 = time.perf_counter()
+    for _ in range(100):
+        archive.answers(question_id=question_id, limit=100)
+    by_question_us = (time.perf_counter() - t0) / 100 * 1e6
+    plan = archive._query("EXPLAIN QUERY PLAN SELECT * FROM answers WHERE question_id = ?", (question_id,))
+
+    exact = all(archive.load_result(f"wb-{i}") == engines[i].generate_final_report() for i in range(0, n, max(1, n // 50)))
+    stats = archive.stats()
+    archive.close()
+    return {
+        "sessions": n,
+        "answer_rows": answers,
+        "sync_sessions_per_s": n / sync_s,
+        "sync_submit_us_p50": _p(sync, 0.5),
+        "sync_submit_us_p99": _p(sync, 0.99),
+        "archive_sessions_per_s": n / behind_s,
+        "archive_rows_per_s": (n + answers) / behind_s,
+        "archive_submit_us_p50": _p(behind, 0.5),
+        "archive_submit_us_p99": _p(behind, 0.99),
+        "archive_batches": stats["batches"],
+        "archive_failed": stats["failed"],
+        "archive_dropped": stats["dropped"],
+        "by_candidate_us": by_candidate_us,
+        "by_question_us": by_question_us,
+        "question_lookup_indexed": any("answers_by_question" in row["detail"] for row in plan),
+        "round_trip_exact": exact,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for key, value in run(n).items():
+        print(f"{key:>24}: {value:,.1f}" if isinstance(value, float) else f"{key:>24}: {value}")
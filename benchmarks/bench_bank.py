@@ -0,0 +1,85 @@
+"""Open time, resident memory and draw latency of a large in-memory vs mapped bank.
+
+Run from the repo root:  python -m benchmarks.bench_bank [n_questions]
+"""
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from bank_store import MappedQuestionIndex, write_bank
+from models import Question, Difficulty
+from question_bank import _QUESTION_LIST
+from question_index import QuestionIndex
+from sampling import QuestionSampler, session_skill_weights
+
+SKILLS = 200
+
+
+def make_questions(n: int, seed: int = 5):
+    rng = random.Random(seed)
+    difficulties = list(Difficulty)
+    for i in range(n):
+        skill = f"Skill {i % SKILLS:03d}"
+        yield Question(
+            id=f"q_{i:07d}", skill=skill, difficulty=rng.choice(difficulties),
+            question_text=f"Question {i} about {skill}: " + "explain the trade-offs in detail. " * 4,
+            expected_keywords=[f"kw{rng.randrange(500)}" for _ in range(4)],
+        )
+
+
+def _timed_traced(build):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - t0
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, elapsed, size
+
+
+def _draw_us(index, draws: int = 20000) -> float:
+    rng = random.Random(1)
+    skills = sorted(index.skills)
+    profiles = [session_skill_weights(rng.sample(skills, 3), []) for _ in range(20)]
+    difficulties = list(Difficulty)
+    sampler = QuestionSampler(index)
+    t0 = time.perf_counter()
+    for _ in range(draws):
+        sampler.draw(rng.choice(difficulties), rng.choice(profiles), set(), rng)
+    return (time.perf_counter() - t0) / draws * 1e6
+
+
+def run(n: int = 100_000) -> dict:
+    path = os.path.join(tempfile.mkdtemp(), "bench.qbank")
+    questions = list(make_questions(n))
+    write_bank(questions, path)
+    # The in-memory side goes through the same validate_json load as the JSON artifact
+    body = _QUESTION_LIST.dump_json(questions)
+    del questions
+
+    memory, memory_s, memory_bytes = _timed_traced(lambda: QuestionIndex(_QUESTION_LIST.validate_json(body)))
+    mapped, mapped_s, mapped_bytes = _timed_traced(lambda: MappedQuestionIndex(path))
+    result = {
+        "questions": n,
+        "file_mb": os.path.getsize(path) / 1e6,
+        "in_memory_load_ms": memory_s * 1000,
+        "mapped_open_ms": mapped_s * 1000,
+        "in_memory_heap_mb": memory_bytes / 1e6,
+        "mapped_heap_mb": mapped_bytes / 1e6,
+        "in_memory_draw_us": _draw_us(memory),
+        "mapped_draw_us": _draw_us(mapped),
+        "mapped_decoded": len(mapped._decoded),
+    }
+    mapped.close()
+    os.remove(path)
+    return result
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for key, value in run(n).items():
+        print(f"{key:>20}: {value:,.2f}" if isinstance(value, float) else f"{key:>20}: {value:,}")
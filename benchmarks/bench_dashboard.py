@@ -0,0 +1,77 @@
+"""Per-rerun latency of the results dashboard with and without the render cache.
+
+It also checks that two sessions viewing the same cached result get Figures
+of their own: editing one leaves the other, and the cache, untouched.
+
+Run from the repo root:  python -m benchmarks.bench_dashboard [reruns]
+"""
+import os
+import statistics
+import sys
+import time
+from streamlit.testing.v1 import AppTest
+import dashboard
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+ANSWER = "order key-value o(1) hash table wrapper sharding kafka caching edge location " * 3
+
+
+def results_page() -> AppTest:
+    """Drive app.py through a full interview and stop on the results dashboard."""
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    at.sidebar.button[0].click().run()
+    while not at.session_state.interview_finished:
+        at.text_area[0].input(ANSWER)
+        at.button[0].click().run()
+    return at
+
+
+def _time_reruns(at: AppTest, reruns: int):
+    samples = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def run(reruns: int = 30) -> dict:
+    at = results_page()
+    cached_get = dashboard.get_artifacts
+    try:
+        # Baseline: rebuild every artifact on every rerun, as app.py did before the cache
+        dashboard.get_artifacts = lambda result, cache=None: dashboard.build_artifacts(result)
+        uncached = _time_reruns(at, reruns)
+    finally:
+        dashboard.get_artifacts = cached_get
+    dashboard.RENDER_CACHE.clear()
+    at.run()  # Warm the cache
+    cached = _time_reruns(at, reruns)
+
+    result = at.session_state.engine.generate_final_report()
+    first = dashboard.get_artifacts(result)
+    first.gauge.update_layout(height=1)
+    second = dashboard.get_artifacts(result)
+    isolated = first.gauge is not second.gauge and second.gauge.layout.height != 1
+
+    t0 = time.perf_counter()
+    dashboard.build_artifacts(result)
+    build_ms = (time.perf_counter() - t0) * 1000
+    return {
+        "reruns": reruns,
+        "uncached_rerun_ms_p50": statistics.median(uncached) * 1000,
+        "cached_rerun_ms_p50": statistics.median(cached) * 1000,
+        "artifact_build_ms": build_ms,
+        "cache_hits": dashboard.RENDER_CACHE.hits,
+        "cache_bytes": dashboard.RENDER_CACHE.size_bytes,
+        "figures_isolated": isolated,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    for key, value in run(n).items():
+        if isinstance(value, bool):
+            print(f"{key:>24}: {value}")
+        else:
+            print(f"{key:>24}: {value:,.2f}" if isinstance(value, float) else f"{key:>24}: {value:,}")
@@ -0,0 +1,97 @@
+"""Server reruns and script CPU per interview on the live page.
+
+Before the live panels, app.py reran only when the candidate typed or
+submitted, and every rerun re-rendered the whole decision trace. The
+countdown moved only on those reruns. Now the countdown ticks in the browser
+(live_panels.timer_panel), so it must add no reruns, and the trace HTML is
+cached until an answer adds events.
+
+This drives app.py with AppTest through a full interview. Each answer is one
+keystroke batch and a submit, and the submit's st.rerun() adds a second run,
+so an answer should cost exactly RERUNS_PER_ANSWER script runs. The bench
+counts the runs the session really takes, and measures script-thread CPU
+(excluding AppTest's own overhead) of a full rerun of the live view:
+
+* before: the trace HTML rendered on every rerun, as app.py did,
+* after: the cached trace and the client-side countdown.
+
+Run from the repo root:  python -m benchmarks.bench_fragments [reruns]
+"""
+import statistics
+import sys
+import time
+from unittest import mock
+from streamlit.runtime.scriptrunner import script_runner
+from benchmarks.bench_dashboard import APP_PATH, ANSWER
+from streamlit.testing.v1 import AppTest
+import live_panels
+
+RERUNS_PER_ANSWER = 3
+
+_script_cpu = []
+_exec = script_runner.exec_func_with_error_handling
+
+
+def _timed_exec(func, ctx):
+    t0 = time.thread_time()
+    try:
+        return _exec(func, ctx)
+    finally:
+        _script_cpu.append(time.thread_time() - t0)
+
+
+def live_page() -> AppTest:
+    """Drive app.py into the live interview with two answers (and their trace events) behind it."""
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    at.sidebar.button[0].click().run()
+    for _ in range(2):
+        at.text_area[0].input(ANSWER)
+        at.button[0].click().run()
+    at.text_area[0].input(ANSWER[:80]).run()
+    return at
+
+
+def _session_reruns():
+    """Answers and script runs of a full interview, from the first answer's keystrokes to the last submit."""
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    at.sidebar.button[0].click().run()
+    _script_cpu.clear()
+    while not at.session_state.interview_finished:
+        at.text_area[0].input(ANSWER[:80]).run()
+        at.text_area[0].input(ANSWER)
+        at.button[0].click().run()
+    return len(at.session_state.engine.history), len(_script_cpu)
+
+
+def _cpu_ms(at: AppTest, reruns: int) -> float:
+    _script_cpu.clear()
+    for _ in range(reruns):
+        at.run()
+    return statistics.median(_script_cpu) * 1000
+
+
+def run(reruns: int = 50) -> dict:
+    with mock.patch.object(script_runner, "exec_func_with_error_handling", _timed_exec):
+        at = live_page()
+        assert not at.session_state.interview_finished
+        # Baseline: render the trace on every rerun, as app.py did before the cache
+        with mock.patch.object(live_panels, "trace_html", lambda trace: trace.render_html()):
+            before_ms = _cpu_ms(at, reruns)
+        after_ms = _cpu_ms(at, reruns)
+        answers, session_reruns = _session_reruns()
+
+    return {
+        "before_full_rerun_cpu_ms": before_ms,
+        "after_full_rerun_cpu_ms": after_ms,
+        "answers": answers,
+        "session_reruns": session_reruns,
+        "countdown_reruns": session_reruns - answers * RERUNS_PER_ANSWER,
+        "before_session_cpu_ms": session_reruns * before_ms,
+        "after_session_cpu_ms": session_reruns * after_ms,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for key, value in run(n).items():
+        print(f"{key:>25}: {value:,.2f}" if isinstance(value, float) else f"{key:>25}: {value:,}")
@@ -0,0 +1,44 @@
+"""Cold-start import time of `engine` and `app`, checked against a startup budget.
+
+Each module is imported in a fresh interpreter several times; the median is
+compared with benchmarks/import_budget.json. Exits non-zero when over budget.
+
+Run from the repo root:  python -m benchmarks.bench_import [repeats]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(ROOT, "benchmarks", "import_budget.json")
+MODULES = ("engine", "app")
+
+_PROBE = "import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+
+
+def import_ms(module: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    # app.py runs in Streamlit bare mode and may print warnings first
+    return float(out.strip().splitlines()[-1]) * 1000
+
+
+def run(repeats: int = 5) -> dict:
+    return {module: statistics.median(import_ms(module) for _ in range(repeats)) for module in MODULES}
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with open(BUDGET_PATH) as f:
+        budget = json.load(f)
+    over = False
+    for module, ms in run(repeats).items():
+        limit = budget[module]
+        ok = ms <= limit
+        over |= not ok
+        print(f"{'✅' if ok else '❌'} import {module:<8} {ms:8.1f} ms  (budget {limit:.0f} ms)")
+    sys.exit(1 if over else 0)
@@ -0,0 +1,50 @@
+"""Overhead of engine instrumentation when disabled and when enabled.
+
+Run from the repo root:  python -m benchmarks.bench_instrumentation [n_sessions]
+"""
+import statistics
+import sys
+import time
+import timeit
+import instrumentation
+from benchmarks.bench_snapshot import make_sessions
+
+# Disabled-path checks per answer: process_response (7), next_question (1), adaptive rules (at most 1)
+CHECKS_PER_ANSWER = 9
+
+
+def _answers_per_sec(n: int) -> float:
+    t0 = time.perf_counter()
+    engines = make_sessions(n)
+    elapsed = time.perf_counter() - t0
+    return sum(len(e.records) for e in engines) / elapsed
+
+
+def run(n: int = 500, repeats: int = 5) -> dict:
+    disabled, enabled = [], []
+    for _ in range(repeats):  # Interleaved to spread machine noise over both modes
+        instrumentation.disable()
+        disabled.append(_answers_per_sec(n))
+        instrumentation.enable(instrumentation.MetricsRegistry())
+        enabled.append(_answers_per_sec(n))
+    instrumentation.disable()
+
+    check_ns = min(timeit.repeat(
+        "m = instrumentation.ACTIVE\nif m:\n    pass", globals={"instrumentation": instrumentation},
+        number=1_000_000, repeat=5
+    )) * 1000  # ns per check
+    answer_us = 1e6 / statistics.median(disabled)
+    return {
+        "sessions": n,
+        "disabled_answers_per_sec": statistics.median(disabled),
+        "enabled_answers_per_sec": statistics.median(enabled),
+        "enabled_overhead_pct": (statistics.median(disabled) / statistics.median(enabled) - 1) * 100,
+        "disabled_check_ns": check_ns,
+        "disabled_overhead_pct": CHECKS_PER_ANSWER * check_ns / 1000 / answer_us * 100,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    for key, value in run(n).items():
+        print(f"{key:>26}: {value:,.3f}" if isinstance(value, float) else f"{key:>26}: {value:,}")
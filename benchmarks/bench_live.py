@@ -0,0 +1,60 @@
+"""Live scoring cost while an answer is typed: LiveScorer vs re-analyzing the full text.
+
+Run from the repo root:  python -m benchmarks.bench_live [words]
+"""
+import random
+import sys
+import time
+from benchmarks.bench_text import KEYWORDS, make_answer
+from live_scoring import LiveScorer
+from models import Question, Difficulty
+from text_analysis import analyze
+
+BATCH_CHARS = 40  # Text that arrives between two Streamlit reruns
+
+
+def _edits(answer: str, seed: int = 3):
+    """Typing in batches with an occasional backspace burst; yields each intermediate text."""
+    rng = random.Random(seed)
+    text = ""
+    pos = 0
+    while pos < len(answer):
+        pos = min(len(answer), pos + BATCH_CHARS)
+        text = answer[:pos]
+        if rng.random() < 0.05:
+            yield text[:max(0, len(text) - rng.randint(1, 30))]
+        yield text
+
+
+def run(words: int = 10_000) -> dict:
+    question = Question(id="bench_live", skill="System Design", difficulty=Difficulty.HARD,
+                        question_text="Design a distributed key-value store.", expected_keywords=KEYWORDS)
+    answer = make_answer(words)
+    edits = list(_edits(answer))
+
+    t0 = time.perf_counter()
+    for text in edits:
+        full = analyze(question, text)
+    full_s = time.perf_counter() - t0
+
+    scorer = LiveScorer(question)
+    t0 = time.perf_counter()
+    for text in edits:
+        live = scorer.update(text)
+    live_s = time.perf_counter() - t0
+
+    return {
+        "words": words,
+        "updates": len(edits),
+        "full_reanalysis_s": full_s,
+        "live_scorer_s": live_s,
+        "speedup": full_s / live_s,
+        "live_update_us": live_s / len(edits) * 1e6,
+        "final_state_identical": live == full == analyze(question, answer),
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    for key, value in run(n).items():
+        print(f"{key:>22}: {value:,.3f}" if isinstance(value, float) else f"{key:>22}: {value}")
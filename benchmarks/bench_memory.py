@@ -0,0 +1,53 @@
+"""Per-session memory of the compact history vs materialized pydantic history.
+
+Run from the repo root:  python -m benchmarks.bench_memory [n_sessions]
+"""
+import gc
+import sys
+import tracemalloc
+from benchmarks.bench_snapshot import make_sessions
+from history import SessionHistory
+
+
+def _traced(build):
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    gc.collect()
+    return value, tracemalloc.get_traced_memory()[0] - before
+
+
+def _copy_records(records: SessionHistory) -> SessionHistory:
+    # Answers and questions are shared objects in both layouts, so only the containers are new
+    copy = SessionHistory()
+    for i in range(len(records)):
+        copy.append(
+            records.questions[i], records.answers[i], records.time_taken(i), records.is_timeout(i),
+            records.scores(i), records.state(i), records.difficulty(i), records.feedback[i]
+        )
+    return copy
+
+
+def run(n: int = 1000) -> dict:
+    tracemalloc.start()
+    try:
+        engines, session_bytes = _traced(lambda: make_sessions(n))
+        answers = sum(len(e.records) for e in engines)
+        _, records_bytes = _traced(lambda: [_copy_records(e.records) for e in engines])
+        _, pydantic_bytes = _traced(lambda: [e.history for e in engines])
+    finally:
+        tracemalloc.stop()
+    return {
+        "sessions": n,
+        "answers_per_session": answers / n,
+        "session_bytes": session_bytes / n,
+        "compact_history_bytes": records_bytes / n,
+        "pydantic_history_bytes": pydantic_bytes / n,
+        "history_reduction": pydantic_bytes / records_bytes,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for key, value in run(n).items():
+        print(f"{key:>24}: {value:,.1f}" if isinstance(value, float) else f"{key:>24}: {value:,}")
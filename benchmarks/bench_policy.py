@@ -0,0 +1,53 @@
+"""Vectorized policy Monte-Carlo vs driving the scalar engine, with an agreement check.
+
+Run from the repo root:  python -m benchmarks.bench_policy [n_trajectories]
+"""
+import sys
+import time
+import numpy as np
+from models import InterviewConfig
+from policy import compile_policy, normal_score_model, simulate, verify_against_engine
+
+# Scores on and around every band boundary, mixed with uniform draws
+EDGE_SCORES = (0.0, 39.999, 40.0, 55.0, 79.99, 80.0, 95.0, 100.0)
+CONFIGS = (
+    InterviewConfig(),
+    InterviewConfig(max_questions=8, early_termination_threshold_count=3, min_score_threshold=40, ramp_rate=1.5),
+    InterviewConfig(max_questions=10, early_termination_threshold_count=1, min_score_threshold=20, ramp_rate=0.5),
+)
+
+
+def _sampled_scores(rng, n: int, k: int) -> np.ndarray:
+    edges = rng.choice(EDGE_SCORES, size=(n, k))
+    return np.where(rng.random((n, k)) < 0.5, edges, rng.uniform(0, 100, (n, k)))
+
+
+def run(n: int = 1_000_000, verify: int = 2000) -> dict:
+    rng = np.random.default_rng(0)
+    out = {"trajectories": n}
+
+    t0 = time.perf_counter()
+    table = compile_policy(InterviewConfig())
+    out["compile_us"] = (time.perf_counter() - t0) * 1e6
+    model = normal_score_model(n, rng)
+    t0 = time.perf_counter()
+    outcomes = simulate(table, model, n=n)
+    elapsed = time.perf_counter() - t0
+    out["vectorized_per_s"] = n / elapsed
+    out["expected_length"] = outcomes.summary()["expected_length"]
+
+    mismatches, t0 = 0, time.perf_counter()
+    for config in CONFIGS:
+        scores = _sampled_scores(rng, verify, config.max_questions)
+        levels = rng.choice(["Junior", "Mid", "Senior", "Lead"], verify).tolist()
+        mismatches += len(verify_against_engine(config, scores, levels))
+    out["engine_per_s"] = verify * len(CONFIGS) / (time.perf_counter() - t0)
+    out["verified_trajectories"] = verify * len(CONFIGS)
+    out["engine_mismatches"] = mismatches
+    return out
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for key, value in run(n).items():
+        print(f"{key:>22}: {value:,.1f}" if isinstance(value, float) else f"{key:>22}: {value}")
@@ -0,0 +1,69 @@
+"""Relevance scoring: cost per answer and how word-count and TF-IDF relevance treat padding.
+
+The word-count relevance (min(100, words / RELEVANCE_TARGET_WORDS * 100))
+gives full marks to any answer long enough. For each bank question this
+compares an on-topic answer with an equally long off-topic one under the
+word-count formula and the TF-IDF formula used by the engine now.
+
+Run from the repo root:  python -m benchmarks.bench_relevance [n_answers]
+"""
+import statistics
+import sys
+import time
+from benchmarks.bench_scoring import make_workload
+from question_bank import QUESTION_BANK, QUESTION_INDEX
+from relevance import get_model
+from scoring import RELEVANCE_TARGET_WORDS, SIMILARITY_TARGET
+from text_analysis import analyze
+
+PADDING = ("Well I think it really depends on many different factors and what the team "
+           "prefers in general, so honestly I would just go with whatever works best overall.")
+
+
+def _word_count_relevance(stats) -> float:
+    return min(100, (stats.words / RELEVANCE_TARGET_WORDS) * 100) if stats.words > 0 else 0
+
+
+def _tfidf_relevance(question, stats) -> float:
+    similarity = get_model(QUESTION_INDEX).similarity(question, stats.terms)
+    return min(100, (similarity / SIMILARITY_TARGET) * 100) * min(1.0, stats.words / RELEVANCE_TARGET_WORDS)
+
+
+def run(n: int = 20_000) -> dict:
+    model = get_model(QUESTION_INDEX)
+    questions, answers, _ = make_workload(n)
+    counts = [analyze(q, a).terms for q, a in zip(questions, answers)]
+
+    t0 = time.perf_counter()
+    scalar = [model.similarity(q, c) for q, c in zip(questions, counts)]
+    scalar_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    batch = model.similarities(questions, counts)
+    batch_s = time.perf_counter() - t0
+
+    on_old, on_new, pad_old, pad_new = [], [], [], []
+    for q in QUESTION_BANK:
+        on_topic = analyze(q, f"I would rely on {', '.join(q.expected_keywords)} here, because "
+                              f"{q.question_text.lower()} comes down to trading those off in production.")
+        padded = analyze(q, PADDING)
+        on_old.append(_word_count_relevance(on_topic))
+        on_new.append(_tfidf_relevance(q, on_topic))
+        pad_old.append(_word_count_relevance(padded))
+        pad_new.append(_tfidf_relevance(q, padded))
+
+    return {
+        "answers": n,
+        "scalar_us": scalar_s / n * 1e6,
+        "batch_per_sec": n / batch_s,
+        "batch_mismatches": sum(1 for s, b in zip(scalar, batch) if s != b),
+        "on_topic_word_count": float(statistics.mean(on_old)),
+        "on_topic_tfidf": statistics.mean(on_new),
+        "padding_word_count": float(statistics.mean(pad_old)),
+        "padding_tfidf": statistics.mean(pad_new),
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    for key, value in run(n).items():
+        print(f"{key:>20}: {value:,.2f}" if isinstance(value, float) else f"{key:>20}: {value}")
@@ -0,0 +1,138 @@
+"""Hot reload of a large bank: copy-on-write snapshot vs rebuilding everything.
+
+A full rebuild re-creates the index, re-tokenizes the whole bank for the IDF
+table, and rebuilds every relevance vector and sampler alias table. reload_bank()
+diffs the new questions against the live snapshot and patches the IDF from
+the edited questions. It then keeps every vector and alias table that the edit
+did not touch. Both are timed up to the same fully warm state. The edit
+scenario rewrites EDITS questions. The grow scenario adds EDITS questions,
+which changes the document count and so every idf.
+
+It also checks that:
+
+* the incremental IDF table and vectors equal a from-scratch build, exactly;
+* an engine started before the reload keeps drawing from its old snapshot;
+* an engine started after the reload sees the new one;
+* a superseded snapshot is garbage collected, with its sampler and
+  relevance model, once no session uses it;
+* the keyword matcher cache holds no more matchers than the live bank has
+  questions after the reloads.
+
+Run from the repo root:  python -m benchmarks.bench_reload [bank_size]
+"""
+import gc
+import sys
+import time
+import weakref
+import keyword_matcher
+import question_bank
+from benchmarks.bench_bank import SKILLS, make_questions
+from engine import InterviewEngine
+from models import CandidateProfile, Difficulty, InterviewConfig, JobDescription
+from question_index import QuestionIndex
+from relevance import IdfTable, RelevanceModel, get_model
+from sampling import get_sampler
+
+EDITS = 20
+
+
+def _warm(index):
+    model = get_model(index)
+    for q in index:
+        model.vector(q)
+    sampler = get_sampler(index)
+    for difficulty in Difficulty:
+        for s in range(SKILLS):
+            sampler.table(difficulty, f"Skill {s:03d}")
+
+
+def _full_rebuild(questions) -> float:
+    gc.collect()
+    t0 = time.perf_counter()
+    index = QuestionIndex(questions)
+    _warm(index)
+    return time.perf_counter() - t0
+
+
+def _reload(questions) -> float:
+    gc.collect()
+    t0 = time.perf_counter()
+    question_bank.reload_bank(questions)
+    _warm(question_bank.QUESTION_INDEX)
+    return time.perf_counter() - t0
+
+
+def _exact(index) -> bool:
+    model = get_model(index)
+    full = IdfTable.build(index)
+    if model.idf.documents != full.documents or model.idf.df != full.df or model.idf._idf != full._idf:
+        return False
+    fresh = RelevanceModel(full)
+    return all(model.vector(q) == fresh.vector(q) for q in index)
+
+
+def _engine() -> InterviewEngine:
+    skills = ["Skill 000"]
+    return InterviewEngine(
+        CandidateProfile(name="bench", experience_level="Mid", skills=skills),
+        JobDescription(required_skills=skills, difficulty_expectation=Difficulty.MEDIUM),
+        InterviewConfig(), seed=0
+    )
+
+
+def run(n: int = 100_000) -> dict:
+    saved = question_bank.QUESTION_BANK, question_bank.QUESTION_INDEX
+    try:
+        base = list(make_questions(n))
+        question_bank.reload_bank(base)
+        _warm(question_bank.QUESTION_INDEX)
+
+        # Edit scenario: same document count, a handful of rewritten questions
+        edited = list(base)
+        for i in range(0, n, n // EDITS):
+            edited[i] = edited[i].model_copy(update={"question_text": edited[i].question_text + " Mention caching."})
+        before = _engine()
+        old_index = before.index
+        edit_full_s = _full_rebuild(edited)
+        edit_reload_s = _reload(edited)
+        edit_exact = _exact(question_bank.QUESTION_INDEX)
+        after = _engine()
+        isolated = before.index is old_index and after.index is question_bank.QUESTION_INDEX is not old_index
+        reused = sum(a is b for a, b in zip(old_index, question_bank.QUESTION_INDEX))
+        superseded = weakref.ref(old_index)
+        del before, old_index
+
+        # Grow scenario: new questions shift every idf
+        grown = edited + [
+            q.model_copy(update={"id": f"new_{i}"}) for i, q in enumerate(make_questions(EDITS, seed=9))
+        ]
+        grow_full_s = _full_rebuild(grown)
+        grow_reload_s = _reload(grown)
+        grow_exact = _exact(question_bank.QUESTION_INDEX)
+        gc.collect()
+        collected = superseded() is None
+        matchers_bounded = len(keyword_matcher._MATCHER_CACHE) <= len(question_bank.QUESTION_INDEX)
+    finally:
+        question_bank.QUESTION_BANK, question_bank.QUESTION_INDEX = saved
+
+    return {
+        "bank_size": n,
+        "edited_questions": EDITS,
+        "edit_full_rebuild_ms": edit_full_s * 1e3,
+        "edit_reload_ms": edit_reload_s * 1e3,
+        "edit_speedup": edit_full_s / edit_reload_s,
+        "grow_full_rebuild_ms": grow_full_s * 1e3,
+        "grow_reload_ms": grow_reload_s * 1e3,
+        "grow_speedup": grow_full_s / grow_reload_s,
+        "questions_reused": reused,
+        "snapshot_isolated": isolated,
+        "exact_match_full_rebuild": edit_exact and grow_exact,
+        "superseded_collected": collected,
+        "matcher_cache_bounded": matchers_bounded,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for key, value in run(n).items():
+        print(f"{key:>26}: {value:,.2f}" if isinstance(value, float) else f"{key:>26}: {value}")
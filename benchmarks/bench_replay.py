@@ -0,0 +1,50 @@
+"""Transcript replay throughput and peak memory, in-process vs process pool.
+
+Run from the repo root:  python -m benchmarks.bench_replay [n_sessions]
+"""
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+from benchmarks.bench_snapshot import make_sessions
+from models import InterviewConfig
+from replay import engine_transcript, replay_file
+
+
+def write_transcripts(path: str, n: int):
+    with open(path, "w", encoding="utf-8") as f:
+        for i, engine in enumerate(make_sessions(n)):
+            f.write(json.dumps(engine_transcript(engine, f"bench-{i}")) + "\n")
+
+
+def run(n: int = 5000) -> dict:
+    tmp = tempfile.mkdtemp()
+    source = os.path.join(tmp, "transcripts.jsonl")
+    write_transcripts(source, n)
+    config = InterviewConfig(max_questions=8, min_score_threshold=50)
+
+    serial = replay_file(source, os.path.join(tmp, "serial.jsonl"), config, workers=1, resume=False)
+    workers = max(2, os.cpu_count() or 1)
+    pooled = replay_file(source, os.path.join(tmp, "pooled.jsonl"), config, workers=workers, resume=False)
+    # Peak heap of the streaming loop should stay flat regardless of file size
+    tracemalloc.start()
+    replay_file(source, os.path.join(tmp, "traced.jsonl"), config, workers=1, resume=False)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "sessions": n,
+        "input_mb": os.path.getsize(source) / 1e6,
+        "workers": workers,
+        "serial_sessions_per_sec": n / serial.wall_seconds,
+        "pooled_sessions_per_sec": n / pooled.wall_seconds,
+        "serial_peak_heap_mb": peak / 1e6,
+        "changed": pooled.changed,
+        "status_changed": pooled.status_changed,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    for key, value in run(n).items():
+        print(f"{key:>24}: {value:,.2f}" if isinstance(value, float) else f"{key:>24}: {value:,}")
@@ -0,0 +1,107 @@
+"""Cohort aggregates from the columnar results store vs pandas over pydantic results.
+
+Run from the repo root:  python -m benchmarks.bench_results_store [n_answers]
+"""
+import os
+import sys
+import tempfile
+import time
+from benchmarks.bench_snapshot import make_sessions
+from results_store import ResultsStore
+
+DAY = 86400.0
+BASELINE_SESSIONS = 20_000
+
+
+def _timed_ms(fn, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - t0)
+    return value, best * 1000
+
+
+def _queries(store: ResultsStore):
+    day = store.session_mask(since=5 * DAY, until=6 * DAY)
+    return {
+        "skill_averages": lambda: store.skill_averages(),
+        "question_histograms": lambda: store.score_histograms("question"),
+        "termination_rates": lambda: store.termination_rates(),
+        "time_by_difficulty": lambda: store.time_by_difficulty(),
+        "one_day_one_skill": lambda: store.group_stats(
+            "difficulty", mask=store.answer_mask(skill="Python", sessions=day)
+        ),
+    }
+
+
+def _pandas_baseline(results):
+    import pandas as pd
+    t0 = time.perf_counter()
+    rows = [
+        {
+            "session": i, "skill": item.question.skill, "question": item.question.id,
+            "difficulty": item.difficulty_at_time.value, "time_taken": item.response.time_taken,
+            "overall": item.score.overall, "reason": r.termination_reason,
+        }
+        for i, r in enumerate(results) for item in r.timeline
+    ]
+    df = pd.DataFrame(rows)
+    build_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    averages = df.groupby("skill")["overall"].mean().to_dict()
+    df.groupby("difficulty")["time_taken"].quantile([0.5, 0.9])
+    df.groupby("question")["overall"].describe()
+    query_s = time.perf_counter() - t0
+    return averages, len(df), build_s, query_s
+
+
+def run(n_answers: int = 1_000_000) -> dict:
+    engines = make_sessions(2000)
+    results = [e.generate_final_report() for e in engines]
+
+    store = ResultsStore()
+    t0 = time.perf_counter()
+    i = 0
+    while store.n_answers < n_answers:
+        store.append_engine(engines[i % len(engines)], recorded_at=(i % 30) * DAY + i % 997)
+        i += 1
+    ingest_s = time.perf_counter() - t0
+    flush_ms = _timed_ms(lambda: store.answers.column("overall"), repeat=1)[1]
+
+    out = {
+        "sessions": len(store),
+        "answers": store.n_answers,
+        "ingest_answers_per_s": store.n_answers / ingest_s,
+        "flush_ms": flush_ms,
+    }
+    for name, query in _queries(store).items():
+        out[f"{name}_ms"] = _timed_ms(query)[1]
+
+    path = os.path.join(tempfile.mkdtemp(), "results.npz")
+    _, out["save_ms"] = _timed_ms(lambda: store.save(path), repeat=1)
+    out["file_mb"] = os.path.getsize(path) / 1e6
+    loaded, out["load_ms"] = _timed_ms(lambda: ResultsStore.load(path), repeat=1)
+    out["load_round_trip"] = loaded.skill_averages() == store.skill_averages()
+
+    # Baseline: pandas over the pydantic timelines of a smaller cohort, checked against the store
+    cohort = [results[j % len(results)] for j in range(BASELINE_SESSIONS)]
+    averages, rows, build_s, query_s = _pandas_baseline(cohort)
+    small = ResultsStore()
+    for r in cohort:
+        small.append(r, recorded_at=0.0)
+    _, store_query_ms = _timed_ms(lambda: (
+        small.skill_averages(), small.time_by_difficulty(), small.group_stats("question")
+    ))
+    out["baseline_answers"] = rows
+    out["pandas_build_ms"] = build_s * 1000
+    out["pandas_query_ms"] = query_s * 1000
+    out["store_same_query_ms"] = store_query_ms
+    out["max_abs_diff_vs_pandas"] = max(abs(averages[k] - v) for k, v in small.skill_averages().items())
+    return out
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for key, value in run(n).items():
+        print(f"{key:>24}: {value:,.3f}" if isinstance(value, float) else f"{key:>24}: {value}")
@@ -0,0 +1,122 @@
+"""Weighted alias-table draws vs rebuilding a filtered list on every draw.
+
+Run from the repo root:  python -m benchmarks.bench_sampling [n_questions]
+"""
+import random
+import sys
+import time
+from benchmarks.bench_bank import make_questions
+from models import Difficulty
+from question_index import QuestionIndex
+from sampling import QuestionSampler, SessionRandom, session_skill_weights
+
+SESSIONS = 200
+DRAWS_PER_SESSION = 10
+
+
+def _profiles(index, seed: int = 2):
+    rng = random.Random(seed)
+    skills = sorted(index.skills)
+    out = []
+    for _ in range(SESSIONS):
+        required = rng.sample(skills, 5)
+        resume = rng.sample(required, 2) + rng.sample(skills, 3)
+        out.append((rng.choice(list(Difficulty)), required, resume))
+    return out
+
+
+def _rebuild_uniform(index, profiles, rng) -> float:
+    # The previous approach: filter the prioritized pool, then random.choice
+    t0 = time.perf_counter()
+    for difficulty, required, resume in profiles:
+        relevant = frozenset(set(required) & set(resume)) or frozenset(required)
+        asked = set()
+        for _ in range(DRAWS_PER_SESSION):
+            remaining = [q for skill in sorted(relevant) for q in index.pool(difficulty, skill) if q.id not in asked]
+            asked.add(rng.choice(remaining).id)
+    return (time.perf_counter() - t0) / (len(profiles) * DRAWS_PER_SESSION) * 1e6
+
+
+def _rebuild_weighted(index, profiles, rng, exposures) -> float:
+    # The same weighting done naively: rebuild candidates and weights, then random.choices
+    t0 = time.perf_counter()
+    for difficulty, required, resume in profiles:
+        skill_weights = session_skill_weights(required, resume)
+        asked, counts = set(), {}
+        for _ in range(DRAWS_PER_SESSION):
+            remaining, weights = [], []
+            for skill, weight in skill_weights.items():
+                weight /= 1 + counts.get(skill, 0)
+                for q in index.pool(difficulty, skill):
+                    if q.id not in asked:
+                        remaining.append(q)
+                        weights.append(weight / (1 + exposures.get(q.id, 0)))
+            q = rng.choices(remaining, weights)[0]
+            asked.add(q.id)
+            counts[q.skill] = counts.get(q.skill, 0) + 1
+    return (time.perf_counter() - t0) / (len(profiles) * DRAWS_PER_SESSION) * 1e6
+
+
+def _alias(sampler, profiles, rng) -> float:
+    t0 = time.perf_counter()
+    for difficulty, required, resume in profiles:
+        skill_weights = session_skill_weights(required, resume)
+        asked, counts = set(), {}
+        for _ in range(DRAWS_PER_SESSION):
+            weights = {s: w / (1 + counts.get(s, 0)) for s, w in skill_weights.items()}
+            q = sampler.draw(difficulty, weights, asked, rng)
+            asked.add(q.id)
+            counts[q.skill] = counts.get(q.skill, 0) + 1
+    return (time.perf_counter() - t0) / (len(profiles) * DRAWS_PER_SESSION) * 1e6
+
+
+def _distribution_error(sampler, profile, exposures, draws: int = 200_000):
+    """Total variation distance from the exact target distribution, for alias draws and for
+    random.choices over the exact weights (the sampling-noise floor for this many draws)."""
+    difficulty, required, resume = profile
+    skill_weights = session_skill_weights(required, resume)
+    target = {}
+    for skill, weight in skill_weights.items():
+        for q in sampler.index.pool(difficulty, skill):
+            target[q.id] = weight / (1 + exposures.get(q.id, 0))
+    total = sum(target.values())
+    rng = SessionRandom(9)
+    seen = dict.fromkeys(target, 0)
+    for _ in range(draws):
+        seen[sampler.draw(difficulty, skill_weights, set(), rng).id] += 1
+    reference = dict.fromkeys(target, 0)
+    for qid in rng.choices(list(target), list(target.values()), k=draws):
+        reference[qid] += 1
+    tv = lambda counts: 0.5 * sum(abs(counts[qid] / draws - w / total) for qid, w in target.items())
+    return tv(seen), tv(reference)
+
+
+def run(n: int = 100_000) -> dict:
+    index = QuestionIndex(make_questions(n))
+    rng = random.Random(4)
+    exposures = {q.id: rng.randrange(20) for q in index}
+    profiles = _profiles(index)
+
+    sampler = QuestionSampler(index, exposures)
+    t0 = time.perf_counter()
+    for difficulty, required, _ in profiles:
+        for skill in required:
+            sampler.table(difficulty, skill)
+    build_s = time.perf_counter() - t0
+
+    alias_tv, reference_tv = _distribution_error(sampler, profiles[0], exposures)
+    return {
+        "questions": n,
+        "table_build_ms": build_s * 1000,
+        "rebuild_uniform_us": _rebuild_uniform(index, profiles, random.Random(1)),
+        "rebuild_weighted_us": _rebuild_weighted(index, profiles, random.Random(1), exposures),
+        "alias_weighted_us": _alias(sampler, profiles, SessionRandom(1)),
+        "alias_tv_distance": alias_tv,
+        "noise_tv_distance": reference_tv,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for key, value in run(n).items():
+        print(f"{key:>20}: {value:,.4f}" if isinstance(value, float) else f"{key:>20}: {value}")
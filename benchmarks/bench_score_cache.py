@@ -0,0 +1,77 @@
+"""Transcript replay with and without the score cache, plus an exactness check.
+
+Per-answer scores do not depend on InterviewConfig, so a config sweep over the
+same transcripts re-scores identical answers on every pass. This replays the
+file serially:
+
+* without a cache,
+* with a fresh SQLite cache (cold: every answer misses and is stored),
+* with the same cache file under a different config (a new process would see
+  only the disk tier),
+* with a warm in-memory cache,
+
+and checks that every cached replay writes exactly the same records as the
+uncached one for the same config.
+
+Run from the repo root:  python -m benchmarks.bench_score_cache [n_sessions]
+"""
+import os
+import sys
+import tempfile
+import score_cache
+from benchmarks.bench_replay import write_transcripts
+from models import InterviewConfig
+from replay import replay_file
+
+SWEEP_CONFIG = InterviewConfig(max_questions=8, min_score_threshold=50)
+
+
+def _replay(source: str, output: str, config: InterviewConfig, db=None) -> float:
+    summary = replay_file(source, output, config, workers=1, resume=False, score_cache_path=db)
+    return summary.sessions / summary.wall_seconds
+
+
+def _same(a: str, b: str) -> bool:
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        return fa.read() == fb.read()
+
+
+def run(n: int = 2000) -> dict:
+    tmp = tempfile.mkdtemp()
+    source = os.path.join(tmp, "transcripts.jsonl")
+    db = os.path.join(tmp, "scores.db")
+    write_transcripts(source, n)
+    out = lambda name: os.path.join(tmp, name + ".jsonl")
+
+    uncached = _replay(source, out("uncached"), InterviewConfig())
+    _replay(source, out("uncached_sweep"), SWEEP_CONFIG)
+    cold = _replay(source, out("cold"), InterviewConfig(), db)
+    disk = _replay(source, out("disk"), SWEEP_CONFIG, db)
+
+    cache = score_cache.enable()
+    try:
+        _replay(source, out("memory_fill"), InterviewConfig())
+        memory = _replay(source, out("memory"), SWEEP_CONFIG)
+        stats = cache.stats()
+    finally:
+        score_cache.disable()
+
+    return {
+        "sessions": n,
+        "uncached_sessions_per_sec": uncached,
+        "cold_disk_sessions_per_sec": cold,
+        "warm_disk_sessions_per_sec": disk,
+        "warm_memory_sessions_per_sec": memory,
+        "memory_hit_rate": stats["hit_rate"],
+        "db_mb": os.path.getsize(db) / 1e6,
+        "identical_results": (
+            _same(out("uncached"), out("cold")) and _same(out("uncached"), out("memory_fill"))
+            and _same(out("uncached_sweep"), out("disk")) and _same(out("uncached_sweep"), out("memory"))
+        ),
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for key, value in run(n).items():
+        print(f"{key:>28}: {value:,.2f}" if isinstance(value, float) else f"{key:>28}: {value}")
@@ -0,0 +1,62 @@
+"""Throughput of batch scoring vs the scalar _evaluate_response path.
+
+Run from the repo root:  python -m benchmarks.bench_scoring [n_answers]
+"""
+import random
+import sys
+import time
+from models import CandidateProfile, JobDescription, InterviewConfig, Difficulty
+from engine import InterviewEngine
+from question_bank import QUESTION_BANK
+from scoring import score_batch
+
+VOCAB = ["the", "system", "uses", "a", "cache", "for", "requests", "um", "like", "basically",
+         "data", "which", "is", "stored", "in", "memory", "and", "then", "flushed", "just",
+         "like,", "um.", "you know", "sort of", "(basically)", "like-minded"]
+
+
+def make_workload(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    questions, answers, times = [], [], []
+    for _ in range(n):
+        q = rng.choice(QUESTION_BANK)
+        words = [rng.choice(VOCAB) for _ in range(rng.randint(0, 120))]
+        for kw in q.expected_keywords:
+            if rng.random() < 0.6:
+                words.insert(rng.randint(0, len(words)), kw)
+        questions.append(q)
+        answers.append(" ".join(words))
+        times.append(rng.uniform(1, q.time_limit * 1.5))
+    return questions, answers, times
+
+
+def run(n: int = 50_000) -> dict:
+    engine = InterviewEngine(
+        CandidateProfile(name="bench", experience_level="Entry", skills=["Python"]),
+        JobDescription(required_skills=["Python"], difficulty_expectation=Difficulty.EASY),
+        InterviewConfig()
+    )
+    questions, answers, times = make_workload(n)
+
+    t0 = time.perf_counter()
+    scalar = [engine._evaluate_response(q, a, t) for q, a, t in zip(questions, answers, times)]
+    scalar_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = score_batch(questions, answers, times)
+    batch_s = time.perf_counter() - t0
+
+    mismatches = sum(1 for i, s in enumerate(scalar) if s != batch.breakdown(i))
+    return {
+        "answers": n,
+        "scalar_per_sec": n / scalar_s,
+        "batch_per_sec": n / batch_s,
+        "speedup": scalar_s / batch_s,
+        "mismatches": mismatches,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    for key, value in run(n).items():
+        print(f"{key:>16}: {value:,.1f}" if isinstance(value, float) else f"{key:>16}: {value:,}")
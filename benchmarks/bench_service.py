@@ -0,0 +1,68 @@
+"""Session service under concurrent load, and its in-flight backpressure.
+
+N clients each run a full interview through InProcessClient, all at once.
+The first service admits all N clients at once. It reports the session
+throughput and should reject nothing. The second has
+max_inflight=MAX_INFLIGHT. Requests that arrive together are all admitted
+before any of them runs, so that service must turn the excess away with
+"overloaded". Every request must get either an
+answer or that rejection.
+
+Run from the repo root:  python -m benchmarks.bench_service [n_sessions]
+"""
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+from question_bank import QUESTION_BANK
+from service import InProcessClient, InterviewService
+from simulator import PROFILES, AnswerGenerator
+
+MAX_INFLIGHT = 4
+CANDIDATE = {"name": "bench", "experience_level": "Mid", "skills": ["Python", "System Design"]}
+JD = {"required_skills": ["Python", "System Design"], "difficulty_expectation": "medium"}
+
+
+async def _session(client: InProcessClient, answers: dict, outcomes: Counter, seed: int):
+    response = await client.start(CANDIDATE, JD, seed=seed)
+    outcomes[response.get("error", "ok")] += 1
+    session_id = response.get("session_id")
+    while response["ok"] and response["question"] is not None:
+        response = await client.submit(session_id, *answers[response["question"]["id"]])
+        outcomes[response.get("error", "ok")] += 1
+
+
+async def _load(service: InterviewService, n: int, answers: dict) -> Counter:
+    outcomes: Counter = Counter()
+    client = InProcessClient(service)
+    await asyncio.gather(*(_session(client, answers, outcomes, i) for i in range(n)))
+    return outcomes
+
+
+def run(n: int = 2000) -> dict:
+    generator = AnswerGenerator(PROFILES["average"], random.Random(0))
+    answers = {q.id: generator.generate(q) for q in QUESTION_BANK}
+
+    service = InterviewService(max_inflight=n)
+    t0 = time.perf_counter()
+    unlimited = asyncio.run(_load(service, n, answers))
+    elapsed = time.perf_counter() - t0
+
+    limited_service = InterviewService(max_inflight=MAX_INFLIGHT)
+    limited = asyncio.run(_load(limited_service, n, answers))
+    return {
+        "sessions": n,
+        "sessions_per_sec": n / elapsed,
+        "requests": sum(unlimited.values()),
+        "rejected_unlimited": service.rejected,
+        "rejected_max_inflight": limited_service.rejected,
+        "overloaded_responses": limited["overloaded"],
+        "all_answered_or_overloaded": set(unlimited) == {"ok"} and set(limited) <= {"ok", "overloaded"},
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for key, value in run(n).items():
+        print(f"{key:>28}: {value:,.1f}" if isinstance(value, float) else f"{key:>28}: {value}")
@@ -0,0 +1,82 @@
+"""Snapshot size and round-trip speed vs pickling the engine state.
+
+A round trip is exact when the restored engine re-encodes to the same bytes
+and also produces the same report, decision trace, termination rule and RNG
+state. The second check catches state that the format does not store at all.
+
+Run from the repo root:  python -m benchmarks.bench_snapshot [n_sessions]
+"""
+import pickle
+import random
+import sys
+import time
+from engine import InterviewEngine
+from models import InterviewConfig
+from simulator import AnswerGenerator, PROFILES, _random_candidate
+
+
+def make_sessions(n: int, seed: int = 3):
+    rng = random.Random(seed)
+    engines = []
+    for _ in range(n):
+        candidate, jd = _random_candidate(rng)
+        engine = InterviewEngine(candidate, jd, InterviewConfig(max_questions=8), seed=rng.getrandbits(64))
+        generator = AnswerGenerator(PROFILES[rng.choice(list(PROFILES))], rng)
+        question = engine.start_interview()
+        while question is not None:
+            question = engine.process_response(question, *generator.generate(question))
+        engines.append(engine)
+    return engines
+
+
+def _pickle_state(engine) -> bytes:
+    # The shared bank index is not session state; leave it out of the comparison
+    return pickle.dumps({k: v for k, v in vars(engine).items() if k != "index"}, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _same_session(a: InterviewEngine, b: InterviewEngine) -> bool:
+    return (
+        a.snapshot() == b.snapshot()
+        and a.generate_final_report() == b.generate_final_report()
+        and list(a.trace) == list(b.trace) and a.trace.dropped == b.trace.dropped
+        and a._termination_rule == b._termination_rule
+        and a.rng.getstate() == b.rng.getstate()
+    )
+
+
+def run(n: int = 2000) -> dict:
+    engines = make_sessions(n)
+
+    t0 = time.perf_counter()
+    pickled = [_pickle_state(e) for e in engines]
+    pickle_dump_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for blob in pickled:
+        pickle.loads(blob)
+    pickle_load_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    snaps = [e.snapshot() for e in engines]
+    snap_dump_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    restored = [InterviewEngine.restore(blob) for blob in snaps]
+    snap_load_s = time.perf_counter() - t0
+
+    exact = all(_same_session(e, r) for e, r in zip(engines, restored))
+    return {
+        "sessions": n,
+        "pickle_bytes_mean": sum(map(len, pickled)) / n,
+        "snapshot_bytes_mean": sum(map(len, snaps)) / n,
+        "pickle_dump_us": pickle_dump_s / n * 1e6,
+        "pickle_load_us": pickle_load_s / n * 1e6,
+        "snapshot_us": snap_dump_s / n * 1e6,
+        "restore_us": snap_load_s / n * 1e6,
+        "early_terminated": sum(e._termination_rule is not None for e in engines),
+        "exact_round_trip": exact,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for key, value in run(n).items():
+        print(f"{key:>20}: {value:,.1f}" if isinstance(value, float) else f"{key:>20}: {value}")
@@ -0,0 +1,99 @@
+"""Answer analysis cost on long answers: single-pass analyzer vs the original per-dimension scans.
+
+The analyzer also counts punctuated fillers ("like,") and filler phrases
+("you know"), which the original whitespace scan never did, and it computes
+the relevance terms. So the word and filler counting is timed on its own,
+three ways:
+
+* original: split() and a set lookup per token, with the old semantics;
+* tokenizer: split(), strip the punctuation off every token, and pair
+  neighbouring tokens for the phrases, with the analyzer's semantics;
+* regex: split() for the word count, and text_analysis's one regex scan
+  for the fillers.
+
+The regex must find exactly as many fillers as the tokenizer.
+
+Run from the repo root:  python -m benchmarks.bench_text [words]
+"""
+import random
+import sys
+import time
+from itertools import compress, islice
+from models import Question, Difficulty
+from scoring import FILLER_WORDS
+from text_analysis import _FILLER_RE, FILLER_PHRASES, PUNCTUATION, analyze
+
+VOCAB = ["the", "service", "shards", "writes", "across", "nodes", "and", "caches", "hot", "keys",
+         "like,", "um.", "you", "know", "sort", "of", "basically", "i", "mean", "replication"]
+KEYWORDS = ["consistent hashing", "replication", "quorum", "write-ahead log", "sharding",
+            "cache invalidation", "leader election", "idempotency"]
+
+
+def make_answer(words: int, seed: int = 11) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCAB) for _ in range(words))
+
+
+def _original(question: Question, answer: str):
+    # The engine's scans before the analyzer: one lower() per keyword plus one for splitting
+    found = [kw for kw in question.expected_keywords if kw.lower() in answer.lower()]
+    words = answer.lower().split()
+    fillers = sum(1 for word in words if word in FILLER_WORDS)
+    return len(words), fillers, found
+
+
+def _original_fillers(lowered: str):
+    words = lowered.split()
+    return len(words), sum(1 for word in words if word in FILLER_WORDS)
+
+
+_PHRASES = frozenset(FILLER_PHRASES)
+
+
+def _tokenizer_fillers(lowered: str):
+    # A phrase's first token may only lead with punctuation and its last only trail it, as in the regex
+    tokens = lowered.split()
+    bare = [token.strip(PUNCTUATION) for token in tokens]
+    fillers = sum(map(FILLER_WORDS.__contains__, bare))
+    for i in compress(range(len(tokens)), map(_PHRASES.__contains__, zip(bare, islice(bare, 1, None)))):
+        if tokens[i].lstrip(PUNCTUATION) == bare[i] and tokens[i + 1].rstrip(PUNCTUATION) == bare[i + 1]:
+            fillers += 1
+    return len(tokens), fillers
+
+
+def _regex_fillers(lowered: str):
+    return len(lowered.split()), len(_FILLER_RE.findall(f" {lowered} "))
+
+
+def _per_call_ms(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1000
+
+
+def run(words: int = 10_000, repeat: int = 50) -> dict:
+    question = Question(id="bench_text", skill="System Design", difficulty=Difficulty.HARD,
+                        question_text="Design a distributed key-value store.", expected_keywords=KEYWORDS)
+    answer = make_answer(words)
+    stats = analyze(question, answer)
+    original = _original(question, answer)
+    lowered = answer.lower()
+    return {
+        "words": words,
+        "original_ms": _per_call_ms(lambda: _original(question, answer), repeat),
+        "analyzer_ms": _per_call_ms(lambda: analyze(question, answer), repeat),
+        "fillers_original_ms": _per_call_ms(lambda: _original_fillers(lowered), repeat),
+        "fillers_tokenizer_ms": _per_call_ms(lambda: _tokenizer_fillers(lowered), repeat),
+        "fillers_regex_ms": _per_call_ms(lambda: _regex_fillers(lowered), repeat),
+        "original_fillers": original[1],
+        "analyzer_fillers": stats.fillers,
+        "tokenizer_agrees": _tokenizer_fillers(lowered) == _regex_fillers(lowered) == (stats.words, stats.fillers),
+        "same_keywords": stats.found == original[2],
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    for key, value in run(n).items():
+        print(f"{key:>20}: {value:,.3f}" if isinstance(value, float) else f"{key:>20}: {value}")
@@ -0,0 +1,237 @@
+"""Benchmark suite for the engine and UI hot paths, with JSON baselines.
+
+Cases (seconds per call):
+
+    evaluate_response[words=N]    InterviewEngine._evaluate_response on an N-word answer
+    next_question[bank=N]         one adaptive draw from an N-question bank
+    interview[questions=N]        a full session: start_interview, N process_response calls, report
+    final_report[history=N]       generate_final_report (not memoized) after N answers
+    app_rerun[view=live|results]  AppTest rerun of app.py on the live interview / results dashboard
+
+Each case is timed with timeit. autorange() sizes a round to at least 0.2 s,
+and the suite keeps the median and minimum of REPEATS rounds. Streamlit is
+only imported when an app_rerun case runs.
+
+    python -m benchmarks.suite run [--filter evaluate] [--save results.json]
+    python -m benchmarks.suite run --save benchmarks/baseline.json       # refresh the baseline
+    python -m benchmarks.suite compare [--current results.json] [--threshold 0.25]
+
+compare runs the suite, or loads --current, and checks each case against
+benchmarks/baseline.json. It exits non-zero if any case is slower by more
+than the threshold. The default statistic is the fastest round, because
+noise from other processes only ever adds time. Pass --stat median to
+compare medians instead. Baselines are machine-specific; refresh them on the
+machine that runs the comparison.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from functools import partial
+from typing import Callable, Dict, Optional
+from models import CandidateProfile, JobDescription, InterviewConfig, Difficulty, Question
+from engine import InterviewEngine
+from question_bank import QUESTION_BANK
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+REPEATS = 5
+DEFAULT_THRESHOLD = 0.25   # Allowed slowdown before compare flags a regression
+
+Setup = Callable[[], Callable[[], object]]   # Builds the workload, returns the timed call
+CASES: Dict[str, Setup] = {}
+
+
+def _engine(config: Optional[InterviewConfig] = None, skills=("Python", "System Design")) -> InterviewEngine:
+    return InterviewEngine(
+        CandidateProfile(name="bench", experience_level="Mid", skills=list(skills)),
+        JobDescription(required_skills=list(skills), difficulty_expectation=Difficulty.MEDIUM),
+        config or InterviewConfig(),
+        seed=0
+    )
+
+
+def _answers() -> Dict[str, tuple]:
+    """One fixed (answer, time_taken) per bank question from the simulator's average profile."""
+    import random
+    from simulator import PROFILES, AnswerGenerator
+    generator = AnswerGenerator(PROFILES["average"], random.Random(0))
+    return {q.id: generator.generate(q) for q in QUESTION_BANK}
+
+
+def evaluate_response(words: int):
+    from benchmarks.bench_text import KEYWORDS, make_answer
+    engine = _engine()
+    question = Question(id="bench_suite", skill="System Design", difficulty=Difficulty.HARD,
+                        question_text="Design a distributed key-value store.", expected_keywords=KEYWORDS)
+    answer = make_answer(words)
+    return partial(engine._evaluate_response, question, answer, 60.0)
+
+
+def next_question(bank: int):
+    from benchmarks.bench_bank import SKILLS, make_questions
+    from question_index import QuestionIndex
+    engine = _engine(skills=[f"Skill {i:03d}" for i in range(0, SKILLS, 10)])
+    engine.index = QuestionIndex(make_questions(bank))
+    engine.start_interview()
+    return engine.next_question
+
+
+def interview(questions: int):
+    answers = _answers()
+    config = InterviewConfig(max_questions=questions)
+
+    def session():
+        engine = _engine(config)
+        question = engine.start_interview()
+        while question is not None:
+            question = engine.process_response(question, *answers[question.id])
+        return engine.generate_final_report()
+    return session
+
+
+def final_report(history: int):
+    answers = _answers()
+    # Never terminate early, so the history reaches `history` answers
+    engine = _engine(InterviewConfig(max_questions=history, early_termination_threshold_count=history + 1,
+                                     min_score_threshold=0))
+    engine.start_interview()
+    for i in range(history):
+        # The bank is smaller than long histories, so questions repeat
+        question = QUESTION_BANK[i % len(QUESTION_BANK)]
+        engine.process_response(question, *answers[question.id])
+
+    def report():
+        engine._report = None
+        return engine.generate_final_report()
+    return report
+
+
+def app_rerun(view: str):
+    from streamlit.logger import set_log_level
+    # app.py's deprecation warnings would otherwise interleave with the results
+    set_log_level("error")
+    if view == "live":
+        from benchmarks.bench_fragments import live_page
+        at = live_page()
+    else:
+        from benchmarks.bench_dashboard import results_page
+        at = results_page()
+    return at.run
+
+
+for _words in (10, 100, 1000, 10_000):
+    CASES[f"evaluate_response[words={_words}]"] = partial(evaluate_response, _words)
+for _bank in (1_000, 100_000):
+    CASES[f"next_question[bank={_bank}]"] = partial(next_question, _bank)
+CASES["interview[questions=5]"] = partial(interview, 5)
+for _history in (10, 100, 1000):
+    CASES[f"final_report[history={_history}]"] = partial(final_report, _history)
+for _view in ("live", "results"):
+    CASES[f"app_rerun[view={_view}]"] = partial(app_rerun, _view)
+
+
+def measure(call: Callable[[], object], repeats: int = REPEATS) -> dict:
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    rounds = [t / number for t in timer.repeat(repeat=repeats, number=number)]
+    return {"median_s": statistics.median(rounds), "min_s": min(rounds), "number": number, "repeats": repeats}
+
+
+def run(filter: Optional[str] = None, repeats: int = REPEATS, progress=None) -> dict:
+    results = {}
+    for name, setup in CASES.items():
+        if filter and filter not in name:
+            continue
+        results[name] = measure(setup(), repeats)
+        if progress:
+            progress(name, results[name])
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "node": platform.node(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD, stat: str = "min_s") -> Dict[str, dict]:
+    """Per-case ratio of current to baseline `stat` with a status of ok, regression, improved, new or missing."""
+    rows = {}
+    base, cur = baseline["results"], current["results"]
+    for name in {**base, **cur}:
+        if name not in base or name not in cur:
+            rows[name] = {"status": "new" if name in cur else "missing"}
+            continue
+        ratio = cur[name][stat] / base[name][stat]
+        status = "regression" if ratio > 1 + threshold else "improved" if ratio < 1 / (1 + threshold) else "ok"
+        rows[name] = {"baseline_s": base[name][stat], "current_s": cur[name][stat],
+                      "ratio": ratio, "status": status}
+    return rows
+
+
+def _fmt(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds * 1e9:8.1f} ns"
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Engine and UI benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_p = sub.add_parser("run", help="Run the suite and print (or save) the results")
+    run_p.add_argument("--save", metavar="PATH", help="Write results as JSON (e.g. the baseline)")
+    cmp_p = sub.add_parser("compare", help="Compare results with a baseline; exit 1 on regressions")
+    cmp_p.add_argument("--baseline", default=BASELINE_PATH)
+    cmp_p.add_argument("--current", metavar="PATH", help="Compare saved results instead of running the suite")
+    cmp_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    cmp_p.add_argument("--stat", choices=["min", "median"], default="min")
+    for p in (run_p, cmp_p):
+        p.add_argument("--filter", help="Only cases whose name contains this text")
+        p.add_argument("--repeats", type=int, default=REPEATS)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.filter, args.repeats, lambda name, r: print(f"{name:<34} {_fmt(r['median_s'])}", flush=True))
+        if args.save:
+            with open(args.save, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+                f.write("\n")
+            print(f"✅ Saved {len(results['results'])} results to {args.save}")
+        return 0
+
+    baseline = _load(args.baseline)
+    current = _load(args.current) if args.current else run(args.filter, args.repeats)
+    if args.filter:
+        baseline["results"] = {k: v for k, v in baseline["results"].items() if args.filter in k}
+        current["results"] = {k: v for k, v in current["results"].items() if args.filter in k}
+    if baseline["meta"].get("machine") != current["meta"].get("machine"):
+        print(f"⚠️ Baseline was recorded on {baseline['meta'].get('machine')}, comparing on {current['meta'].get('machine')}")
+    marks = {"ok": "✅", "improved": "🚀", "regression": "❌", "new": "🆕", "missing": "⚠️"}
+    rows = compare(baseline, current, args.threshold, args.stat + "_s")
+    for name in sorted(rows):
+        row = rows[name]
+        if "ratio" in row:
+            print(f"{marks[row['status']]} {name:<34} {_fmt(row['baseline_s'])} -> {_fmt(row['current_s'])}  x{row['ratio']:.2f}")
+        else:
+            print(f"{marks[row['status']]} {name:<34} {row['status']}")
+    regressions = [name for name, row in rows.items() if row["status"] == "regression"]
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
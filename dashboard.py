@@ -0,0 +1,152 @@
+"""Results dashboard artifacts (gauge, skill radar, timeline HTML) with a render cache.
+
+Artifacts are keyed by a content hash of the InterviewResult, so Streamlit
+reruns of an unchanged results page reuse the figures instead of rebuilding
+them with pandas and Plotly. The cache holds each figure as its validated dict
+and every caller gets Figures of its own, so sessions viewing the same result
+never share (or mutate) one Figure. pandas and Plotly are imported on first build,
+so importing this module (and app.py) stays cheap until a results page renders.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+from models import InterviewResult
+
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class DashboardArtifacts(NamedTuple):
+    gauge: Any          # plotly Figure
+    radar: Any          # plotly Figure
+    timeline_html: str
+
+
+class _CachedArtifacts(NamedTuple):
+    gauge: dict         # Figure.to_dict()
+    radar: dict
+    timeline_html: str
+
+
+class RenderCache:
+    """Thread-safe LRU cache bounded by the approximate byte size of its entries."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, size: int):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+RENDER_CACHE = RenderCache()
+
+
+def result_fingerprint(result: InterviewResult) -> str:
+    return hashlib.blake2b(result.model_dump_json().encode("utf-8"), digest_size=16).hexdigest()
+
+
+def build_gauge(score: float):
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = score,
+        title = {'text': "Readiness Score (%)"},
+        gauge = {'axis': {'range': [0, 100]}, 'bar': {'color': "#60a5fa"}}
+    ))
+    fig.update_layout(height=250, margin=dict(t=30, b=0, l=30, r=30), paper_bgcolor='rgba(0,0,0,0)', font_color='white')
+    return fig
+
+
+def build_radar(skill_breakdown: dict):
+    import pandas as pd
+    import plotly.express as px
+    df_radar = pd.DataFrame(list(skill_breakdown.items()), columns=['Skill', 'Score'])
+    fig_r = px.line_polar(df_radar, r='Score', theta='Skill', line_close=True)
+    fig_r.update_traces(fill='toself', line_color='#f472b6', marker=dict(size=8))
+    fig_r.update_layout(paper_bgcolor='rgba(0,0,0,0)', polar=dict(bgcolor='rgba(0,0,0,0)'), font_color='white')
+    return fig_r
+
+
+def build_timeline_html(result: InterviewResult) -> str:
+    items = []
+    for i, res in enumerate(result.timeline):
+        items.append(f"""
+            <div class="timeline-item">
+                <div class="timeline-dot"></div>
+                <b>STEP {i+1}: {res.question.skill} ({res.difficulty_at_time.value.upper()})</b><br>
+                <small style="color: #64748b;">Score: {res.score.overall:.1f}% | Time: {res.response.time_taken:.1f}s | State: {res.state_at_time}</small><br>
+                <p style="margin-top: 5px; font-size: 0.9rem;">"{res.feedback}"</p>
+            </div>
+            """)
+    return "".join(items)
+
+
+def build_artifacts(result: InterviewResult) -> DashboardArtifacts:
+    return DashboardArtifacts(
+        gauge=build_gauge(result.final_score),
+        radar=build_radar(result.skill_breakdown),
+        timeline_html=build_timeline_html(result)
+    )
+
+
+def _figure(spec: dict):
+    import plotly.graph_objects as go
+    # The spec was validated when its figure was built; a fresh Figure per caller skips doing it again
+    return go.Figure(spec, _validate=False)
+
+
+def get_artifacts(result: InterviewResult, cache: Optional[RenderCache] = None) -> DashboardArtifacts:
+    """FEATURE: Cached dashboard artifacts for a result (built on first view, reused on reruns)"""
+    cache = cache if cache is not None else RENDER_CACHE
+    key = result_fingerprint(result)
+    entry = cache.get(key)
+    if entry is None:
+        import plotly.io as pio
+        artifacts = build_artifacts(result)
+        entry = _CachedArtifacts(artifacts.gauge.to_dict(), artifacts.radar.to_dict(), artifacts.timeline_html)
+        # Size the entry by the JSON Streamlit ships for each figure
+        size = (
+            len(pio.to_json(entry.gauge, validate=False))
+            + len(pio.to_json(entry.radar, validate=False))
+            + len(entry.timeline_html)
+        )
+        cache.put(key, entry, size)
+        return artifacts
+    return DashboardArtifacts(_figure(entry.gauge), _figure(entry.radar), entry.timeline_html)
@@ -0,0 +1,140 @@
+"""Structured, bounded decision trace for InterviewEngine.
+
+Events are stored as (type, timestamp, fields) records in a ring buffer and
+only turned into the familiar emoji log lines when something renders them.
+"""
+import html
+import json
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+DEFAULT_CAPACITY = 512
+
+
+class TraceEvent:
+    __slots__ = ("type", "ts", "fields")
+
+    def __init__(self, type: str, ts: float, fields: Dict[str, Any]):
+        self.type = type
+        self.ts = ts
+        self.fields = fields
+
+    def format(self) -> List[str]:
+        formatter = _FORMATTERS.get(self.type)
+        if formatter is None:
+            return [f"{self.type}: {self.fields}"]
+        return formatter(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self.type, "ts": self.ts, **self.fields}
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, TraceEvent)
+            and self.type == other.type and self.ts == other.ts and self.fields == other.fields
+        )
+
+    def __repr__(self) -> str:
+        return f"TraceEvent({self.type!r}, {self.ts!r}, {self.fields!r})"
+
+
+def _clock(ts: float) -> str:
+    return time.strftime("%H:%M:%S", time.localtime(ts))
+
+
+_FORMATTERS: Dict[str, Callable[[TraceEvent], List[str]]] = {
+    "init": lambda e: [
+        f"🚀 System initialized at {_clock(e.ts)}.",
+        "📌 Mode: STATEFUL_INTERVIEW_ENGINE",
+        f"👤 Profile: {e.fields['name']} ({e.fields['experience_level']})",
+        f"🎯 Target Skills: {', '.join(e.fields['skills'])}",
+        f"⚖️ Initial Difficulty: {e.fields['difficulty'].upper()}",
+    ],
+    "started": lambda e: ["🏁 Interview Started. State transition: NOT_STARTED -> IN_PROGRESS"],
+    "processing": lambda e: [f"📥 Processing Response for Q{e.fields['q']}..."],
+    "evaluated": lambda e: [
+        f"✅ Q{e.fields['q']} Evaluated. Overall Score: {e.fields['overall']:.1f}%",
+        f"   [Accuracy: {e.fields['accuracy']:.1f}, Relevance: {e.fields['relevance']:.1f}, "
+        f"Clarity: {e.fields['clarity']:.1f}, Time: {e.fields['time_efficiency']:.1f}]",
+    ],
+    "bonus": lambda e: [f"   🌟 BONUS: +{e.fields['bonus']:.1f}pts for high-speed accuracy!"],
+    "difficulty_up": lambda e: [
+        f"📈 DECISION: Elevating difficulty to {e.fields['difficulty'].upper()} due to high performance streak."
+    ],
+    "difficulty_down": lambda e: [
+        f"📉 DECISION: Stabilizing difficulty to {e.fields['difficulty'].upper()} to better assess performance."
+    ],
+    "terminated": lambda e: [
+        f"⛔ State transition: {e.fields['from_state']} -> EARLY_TERMINATED. Reason: {e.fields['reason']}"
+    ],
+    "completed": lambda e: [f"🏁 State transition: {e.fields['from_state']} -> COMPLETED"],
+    "note": lambda e: [e.fields["text"]],
+}
+
+
+class JsonlTraceSink:
+    """Buffered JSON-lines exporter; events are written in batches of `buffer_size`."""
+
+    def __init__(self, path: str, buffer_size: int = 256, session_id: Optional[str] = None):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.session_id = session_id
+        self._buffer: List[str] = []
+
+    def write(self, event: TraceEvent):
+        record = event.to_dict()
+        if self.session_id is not None:
+            record["session_id"] = self.session_id
+        self._buffer.append(json.dumps(record, ensure_ascii=False))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(self._buffer) + "\n")
+        self._buffer.clear()
+
+    def close(self):
+        self.flush()
+
+
+class DecisionTrace:
+    """FEATURE: Ring buffer of structured decision events with lazy formatting."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, sink: Optional[JsonlTraceSink] = None):
+        self.events: Deque[TraceEvent] = deque(maxlen=capacity)
+        self.sink = sink
+        self.dropped = 0
+
+    def record(self, type: str, **fields):
+        self.append(TraceEvent(type, time.time(), fields))
+
+    def append(self, event: TraceEvent):
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append(event)
+        if self.sink is not None:
+            self.sink.write(event)
+
+    def note(self, text: str):
+        self.record("note", text=text)
+
+    def __iter__(self) -> Iterator[TraceEvent]:
+        return iter(self.events)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def lines(self) -> List[str]:
+        out: List[str] = []
+        if self.dropped:
+            out.append(f"… {self.dropped} earlier events dropped")
+        for event in self.events:
+            out.extend(event.format())
+        return out
+
+    def render_html(self, separator: str = "<br>") -> str:
+        return separator.join(html.escape(line, quote=False) for line in self.lines())
@@ -1,19 +1,37 @@
-import time
-import random
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from models import (
-    InterviewStatus, Difficulty, Question, Response, 
+    InterviewStatus, Difficulty, Question, 
     ScoreBreakdown, QuestionResult, InterviewResult,
     CandidateProfile, JobDescription, InterviewConfig
 )
-from question_bank import QUESTION_BANK, get_questions_by_difficulty
+import question_bank
+from sampling import SessionRandom, get_sampler, session_skill_weights, COVERAGE_DECAY
+from keyword_matcher import get_matcher
+from snapshot import encode_engine, decode_into
+from decision_trace import DecisionTrace
+from history import (
+    SessionHistory, Scores, compose_feedback,
+    FEEDBACK_EMPTY, FEEDBACK_LOW_ACCURACY, FEEDBACK_STRONG, FEEDBACK_FILLER, FEEDBACK_SLOW, FEEDBACK_SPEED
+)
+from text_analysis import TextStats, analyze
+from relevance import get_model
+from policy import RAMP_STREAK, STRONG_SCORE, WEAK_SCORE, entry_difficulty
+import instrumentation
+import score_cache
+from scoring import (
+    ACCURACY_WEIGHT, RELEVANCE_WEIGHT, CLARITY_WEIGHT, TIME_WEIGHT,
+    NO_KEYWORD_ACCURACY, RELEVANCE_TARGET_WORDS, SIMILARITY_TARGET, FILLER_PENALTY,
+    GUESS_TIME, GUESS_EFFICIENCY, FAST_FRACTION, SPEED_BONUS,
+    BONUS_ACCURACY, BONUS_TIME_FRACTION, OVERTIME_BASE, OVERTIME_PENALTY
+)
 
 class InterviewEngine:
     def __init__(
         self, 
         candidate: CandidateProfile, 
         jd: JobDescription, 
-        config: InterviewConfig
+        config: InterviewConfig,
+        seed: Optional[int] = None
     ):
         self.candidate = candidate
         self.jd = jd
@@ -22,177 +40,278 @@ class InterviewEngine:
         self.state = InterviewStatus.NOT_STARTED
         
         # FEATURE: Seniority-based entry difficulty
-        if candidate.experience_level in ["Senior", "Lead"]:
-            self.current_difficulty = Difficulty.MEDIUM
-        else:
-            self.current_difficulty = Difficulty.EASY
+        self.current_difficulty = entry_difficulty(candidate.experience_level)
             
-        self.history: List[QuestionResult] = []
-        self.engine_logs: List[str] = [
-            f"🚀 System initialized at {time.strftime('%H:%M:%S')}.",
-            f"📌 Mode: STATEFUL_INTERVIEW_ENGINE",
-            f"👤 Profile: {candidate.name} ({candidate.experience_level})",
-            f"🎯 Target Skills: {', '.join(jd.required_skills)}",
-            f"⚖️ Initial Difficulty: {self.current_difficulty.value.upper()}"
-        ]
+        # FEATURE: Compact array-backed history; pydantic views are built on demand
+        self.records = SessionHistory()
+        self.asked_ids: Set[str] = set()
+        # The bank snapshot current at session start; a later reload_bank() does not affect this session
+        self.index = question_bank.QUESTION_INDEX
+        # FEATURE: Weighted selection (see sampling.py) driven by a per-session seeded RNG
+        self._skill_weights = session_skill_weights(jd.required_skills, candidate.skills)
+        self.rng = SessionRandom(seed)
+        self.trace = DecisionTrace()
+        self.trace.record(
+            "init",
+            name=candidate.name,
+            experience_level=candidate.experience_level,
+            skills=list(jd.required_skills),
+            difficulty=self.current_difficulty.value
+        )
         self.current_question_index = 0
         self.consecutive_strong_answers = 0
         self.consecutive_weak_answers = 0
         self.total_score_sum = 0
+        # FEATURE: Running aggregates, updated once per answer so reporting never re-walks history
+        self._skill_totals: Dict[str, float] = {}
+        self._skill_counts: Dict[str, int] = {}
+        self._score_mean = 0.0
+        self._score_m2 = 0.0  # Welford sum of squared deviations
+        self._strengths: Dict[str, None] = {}  # Insertion-ordered sets
+        self._weaknesses: Dict[str, None] = {}
+        self._report: Optional[InterviewResult] = None
+        self._report_key = None
         self.termination_reason = None
+        self._termination_rule: Optional[str] = None
         
+    @property
+    def history(self) -> List[QuestionResult]:
+        """Session history as pydantic QuestionResults, materialized at the API/report boundary."""
+        return [self.records.result(i) for i in range(len(self.records))]
+
+    @property
+    def engine_logs(self) -> List[str]:
+        """Decision trace rendered as text lines (formatted on access)."""
+        return self.trace.lines()
+
+    def snapshot(self, compress: bool = True) -> bytes:
+        """FEATURE: Compact binary snapshot of the full session state (see snapshot.py)"""
+        return encode_engine(self, compress)
+
+    @classmethod
+    def restore(cls, data: bytes, index=None) -> "InterviewEngine":
+        return decode_into(cls, data, index if index is not None else question_bank.QUESTION_INDEX)
+
     def start_interview(self):
+        m = instrumentation.ACTIVE
+        if m:
+            m.inc("engine_state_transitions_total", **{"from": self.state.value, "to": InterviewStatus.IN_PROGRESS.value})
         self.state = InterviewStatus.IN_PROGRESS
-        self.engine_logs.append(f"🏁 Interview Started. State transition: NOT_STARTED -> IN_PROGRESS")
+        self.trace.record("started")
         return self.next_question()
 
-    def select_appropriate_questions(self) -> List[Question]:
-        """FEATURE: Resume-to-JD Skill Alignment logic"""
-        # Weighted skill list: Combine JD required skills and Candidate's resume skills
-        relevant_skills = list(set(self.jd.required_skills) & set(self.candidate.skills))
-        if not relevant_skills:
-            relevant_skills = self.jd.required_skills
-            
-        available = [q for q in QUESTION_BANK if q.difficulty == self.current_difficulty]
-        # Prioritize questions matching the overlapping skills
-        prioritized = [q for q in available if q.skill in relevant_skills]
-        
-        return prioritized if prioritized else available
-
     def next_question(self) -> Optional[Question]:
         if self.state not in [InterviewStatus.IN_PROGRESS, InterviewStatus.ADAPTIVE_MODE]:
             return None
             
-        prioritized = self.select_appropriate_questions()
-        
-        asked_ids = [r.question.id for r in self.history]
-        remaining = [q for q in prioritized if q.id not in asked_ids]
-        
-        if not remaining:
-            # Fallback to any random question of same difficulty if prioritized pool is exhausted
-            fallback_pool = [q for q in QUESTION_BANK if q.difficulty == self.current_difficulty and q.id not in asked_ids]
-            if not fallback_pool:
-                return None
-            return random.choice(fallback_pool)
-            
-        return random.choice(remaining)
+        m = instrumentation.ACTIVE
+        t = m.clock() if m else 0.0
+        sampler = get_sampler(self.index)
+        counts = self._skill_counts
+        weights = {
+            skill: weight / (1 + COVERAGE_DECAY * counts.get(skill, 0))
+            for skill, weight in self._skill_weights.items()
+        }
+        question = sampler.draw(self.current_difficulty, weights, self.asked_ids, self.rng)
+        if question is None:
+            # Fallback to any skill of same difficulty if the JD skills are exhausted
+            weights = {skill: 1 / (1 + COVERAGE_DECAY * counts.get(skill, 0)) for skill in sorted(self.index.skills)}
+            question = sampler.draw(self.current_difficulty, weights, self.asked_ids, self.rng)
+        if m:
+            m.lap("next_question", t)
+        return question
 
-    def process_response(self, question: Question, user_answer: str, time_taken: float):
-        self.engine_logs.append(f"📥 Processing Response for Q{self.current_question_index + 1}...")
+    def process_response(
+        self, question: Question, user_answer: str, time_taken: float,
+        stats: Optional[TextStats] = None
+    ):
+        """`stats` may carry a LiveScorer's analysis of exactly `user_answer` to skip re-analysis."""
+        # FEATURE: Per-stage timings (see instrumentation.py); m is None unless enabled
+        m = instrumentation.ACTIVE
+        started = t = m.clock() if m else 0.0
+        self.trace.record("processing", q=self.current_question_index + 1)
         
-        # FEATURE: Deterministic Scoring (Explainable)
-        score_breakdown = self._evaluate_response(question, user_answer, time_taken)
-        feedback = self._generate_rule_based_feedback(score_breakdown, question, user_answer)
+        # FEATURE: Deterministic Scoring (Explainable), memoized when a score cache is enabled
+        cache = score_cache.ACTIVE
+        cached = None
+        if cache is not None:
+            key = cache.key(self.index, question, user_answer, time_taken)
+            cached = cache.get(key)
+            if m:
+                m.inc("engine_score_cache_total", result="miss" if cached is None else "hit")
+        if cached is not None:
+            score_breakdown, feedback = cached
+            if m:
+                t = m.lap("score_cache", t)
+        else:
+            if stats is None:
+                stats = analyze(question, user_answer)
+            score_breakdown = self._score_components(question, user_answer, time_taken, stats)
+            if m:
+                t = m.lap("evaluate", t)
+            feedback = self._generate_rule_based_feedback(score_breakdown, question, user_answer, stats.found)
+            if cache is not None:
+                cache.put(key, score_breakdown, feedback)
+            if m:
+                t = m.lap("feedback", t)
         
-        result = QuestionResult(
-            question=question,
-            response=Response(
-                question_id=question.id,
-                answer=user_answer,
-                time_taken=time_taken,
-                is_timeout=time_taken > question.time_limit
-            ),
-            score=score_breakdown,
-            state_at_time=self.state,
-            difficulty_at_time=self.current_difficulty,
-            feedback=feedback
+        self._record(
+            question, user_answer, time_taken, time_taken > question.time_limit,
+            score_breakdown, self.state, self.current_difficulty, feedback
         )
-        
-        self.history.append(result)
-        self.total_score_sum += score_breakdown.overall
         self.current_question_index += 1
         
         # Decision Trace Logs
-        self.engine_logs.append(f"✅ Q{self.current_question_index} Evaluated. Overall Score: {score_breakdown.overall:.1f}%")
-        self.engine_logs.append(f"   [Accuracy: {score_breakdown.accuracy:.1f}, Relevance: {score_breakdown.relevance:.1f}, Clarity: {score_breakdown.clarity:.1f}, Time: {score_breakdown.time_efficiency:.1f}]")
+        self.trace.record(
+            "evaluated",
+            q=self.current_question_index,
+            overall=score_breakdown.overall,
+            accuracy=score_breakdown.accuracy,
+            relevance=score_breakdown.relevance,
+            clarity=score_breakdown.clarity,
+            time_efficiency=score_breakdown.time_efficiency
+        )
         if score_breakdown.bonus > 0:
-            self.engine_logs.append(f"   🌟 BONUS: +{score_breakdown.bonus:.1f}pts for high-speed accuracy!")
+            self.trace.record("bonus", bonus=score_breakdown.bonus)
+        if m:
+            t = m.lap("record", t)
             
         # Adaptive Logic
         self._apply_adaptive_rules(score_breakdown.overall)
+        if m:
+            t = m.lap("adaptive_rules", t)
         
         # Check for Early Termination
-        if self._should_terminate():
+        terminate = self._should_terminate()
+        if m:
+            t = m.lap("should_terminate", t)
+        next_q = None
+        if terminate:
+            self.trace.record("terminated", from_state=self.state.value, reason=self.termination_reason)
+            if m:
+                m.inc("engine_terminations_total", rule=self._termination_rule)
+                m.inc("engine_state_transitions_total", **{"from": self.state.value, "to": InterviewStatus.EARLY_TERMINATED.value})
             self.state = InterviewStatus.EARLY_TERMINATED
-            self.engine_logs.append(f"⛔ State transition: IN_PROGRESS -> EARLY_TERMINATED. Reason: {self.termination_reason}")
-            return None
-            
-        if self.current_question_index >= self.config.max_questions:
+        elif self.current_question_index >= self.config.max_questions:
+            self.trace.record("completed", from_state=self.state.value)
+            if m:
+                m.inc("engine_state_transitions_total", **{"from": self.state.value, "to": InterviewStatus.COMPLETED.value})
             self.state = InterviewStatus.COMPLETED
-            self.engine_logs.append(f"🏁 State transition: {self.state.value} -> COMPLETED")
-            return None
-            
-        return self.next_question()
+        else:
+            next_q = self.next_question()
+        if m:
+            m.lap("process_response", started)
+        return next_q
+
+    def _record(
+        self, question: Question, answer: str, time_taken: float, is_timeout: bool,
+        scores: Scores, state: InterviewStatus, difficulty: Difficulty, feedback: str
+    ):
+        self.records.append(question, answer, time_taken, is_timeout, scores, state, difficulty, feedback)
+        self.asked_ids.add(question.id)
+        self._update_aggregates(question.skill, scores.overall)
+
+    def _update_aggregates(self, skill: str, overall: float):
+        self.total_score_sum += overall
+        self._skill_totals[skill] = self._skill_totals.get(skill, 0) + overall
+        self._skill_counts[skill] = self._skill_counts.get(skill, 0) + 1
+        n = len(self.records)
+        delta = overall - self._score_mean
+        self._score_mean += delta / n
+        self._score_m2 += delta * (overall - self._score_mean)
+        if overall >= 75:
+            self._strengths[skill] = None
+        if overall < 50:
+            self._weaknesses[skill] = None
+
+    def _evaluate_response(
+        self, question: Question, answer: str, time_taken: float,
+        stats: Optional[TextStats] = None
+    ) -> ScoreBreakdown:
+        return ScoreBreakdown(**self._score_components(question, answer, time_taken, stats)._asdict())
+
+    def _score_components(
+        self, question: Question, answer: str, time_taken: float,
+        stats: Optional[TextStats] = None
+    ) -> Scores:
+        # One analysis pass feeds accuracy, relevance and clarity
+        if stats is None:
+            stats = analyze(question, answer)
 
-    def _evaluate_response(self, question: Question, answer: str, time_taken: float) -> ScoreBreakdown:
         # 1. Accuracy (40%) - Keyword matching + Contextual presence
-        found_keywords = [kw for kw in question.expected_keywords if kw.lower() in answer.lower()]
-        accuracy_score = (len(found_keywords) / len(question.expected_keywords)) * 100 if question.expected_keywords else 80
+        accuracy_score = (len(stats.found) / len(question.expected_keywords)) * 100 if question.expected_keywords else NO_KEYWORD_ACCURACY
         
-        # 2. Relevance (20%) - Based on response length and technical vocabulary
-        words = answer.lower().split()
-        relevance_score = min(100, (len(words) / 20) * 100) if len(words) > 0 else 0
+        # 2. Relevance (20%) - TF-IDF similarity to the question's topic vocabulary, scaled by answer depth
+        similarity = get_model(self.index).similarity(question, stats.terms)
+        relevance_score = min(100, (similarity / SIMILARITY_TARGET) * 100) * min(1.0, stats.words / RELEVANCE_TARGET_WORDS)
         
-        # 3. Clarity (20%) - Professionalisms vs Filler Words
-        filler_words = ["basically", "um", "ah", "like", "actually", "just"]
-        filler_count = sum(1 for word in words if word in filler_words)
-        clarity_score = max(0, 100 - (filler_count * 10))
+        # 3. Clarity (20%) - Professionalisms vs Filler Words (including "like," and "you know")
+        clarity_score = max(0, 100 - (stats.fillers * FILLER_PENALTY))
         
         # 4. Time Efficiency (20%) - Penalty for overtime, Bonus for speed
-        if time_taken <= 5: # Guessing protection
-            eff_score = 10
-        elif time_taken <= question.time_limit * 0.4:
+        if time_taken <= GUESS_TIME: # Guessing protection
+            eff_score = GUESS_EFFICIENCY
+        elif time_taken <= question.time_limit * FAST_FRACTION:
             eff_score = 100
         elif time_taken <= question.time_limit:
             eff_score = 100 - ((time_taken / question.time_limit) * 30)
         else:
-            eff_score = max(0, 50 - ((time_taken - question.time_limit) * 2))
+            eff_score = max(0, OVERTIME_BASE - ((time_taken - question.time_limit) * OVERTIME_PENALTY))
             
         # FEATURE: Fast + Correct Bonus
         bonus = 0.0
-        if accuracy_score > 80 and time_taken < question.time_limit * 0.5:
-            bonus = 5.0
+        if accuracy_score > BONUS_ACCURACY and time_taken < question.time_limit * BONUS_TIME_FRACTION:
+            bonus = SPEED_BONUS
             
-        overall = (accuracy_score * 0.4) + (relevance_score * 0.2) + (clarity_score * 0.2) + (eff_score * 0.2) + bonus
+        overall = (accuracy_score * ACCURACY_WEIGHT) + (relevance_score * RELEVANCE_WEIGHT) + (clarity_score * CLARITY_WEIGHT) + (eff_score * TIME_WEIGHT) + bonus
         overall = min(100, overall)
         
-        return ScoreBreakdown(
-            accuracy=accuracy_score,
-            relevance=relevance_score,
-            clarity=clarity_score,
-            time_efficiency=eff_score,
-            overall=overall,
+        return Scores(
+            accuracy=float(accuracy_score),
+            relevance=float(relevance_score),
+            clarity=float(clarity_score),
+            time_efficiency=float(eff_score),
+            overall=float(overall),
             bonus=bonus
         )
 
-    def _generate_rule_based_feedback(self, score: ScoreBreakdown, q: Question, answer: str) -> str:
-        """FEATURE: Explainable Feedback Generator"""
+    def _generate_rule_based_feedback(
+        self, score, q: Question, answer: str,
+        found_keywords: Optional[List[str]] = None
+    ) -> str:
+        """FEATURE: Explainable Feedback Generator (accepts ScoreBreakdown or Scores)"""
         if len(answer.strip()) == 0:
-            return "Empty response detected. Zero points awarded for this section."
+            return FEEDBACK_EMPTY
             
-        feedbacks = []
+        templates = []
+        missing = ()
         if score.accuracy < 50:
-            feedbacks.append(f"Low technical accuracy. Missing key concepts like {', '.join(q.expected_keywords[:2])}.")
+            matcher = get_matcher(q)
+            if found_keywords is None:
+                found_keywords = matcher.found(answer)
+            missing = tuple(matcher.missing(found_keywords)[:2])
+            templates.append(FEEDBACK_LOW_ACCURACY)
         else:
-            feedbacks.append("Strong technical alignment with expected keywords.")
+            templates.append(FEEDBACK_STRONG)
             
         if score.clarity < 70:
-            feedbacks.append("Usage of filler words detected. Work on professional articulation.")
+            templates.append(FEEDBACK_FILLER)
             
         if score.time_efficiency < 50:
-            feedbacks.append("Response time was slow for this difficulty level.")
+            templates.append(FEEDBACK_SLOW)
         elif score.bonus > 0:
-            feedbacks.append("Excellent speed and accuracy streak!")
+            templates.append(FEEDBACK_SPEED)
             
-        return " ".join(feedbacks)
+        # Interned: identical feedback across answers and sessions shares one string
+        return compose_feedback(tuple(templates), missing)
 
     def _apply_adaptive_rules(self, last_score: float):
         adj_score = last_score
         
-        if adj_score >= 80:
+        if adj_score >= STRONG_SCORE:
             self.consecutive_strong_answers += 1
             self.consecutive_weak_answers = 0
-        elif adj_score < 40:
+        elif adj_score < WEAK_SCORE:
             self.consecutive_weak_answers += 1
             self.consecutive_strong_answers = 0
         else:
@@ -200,7 +319,7 @@ class InterviewEngine:
             self.consecutive_weak_answers = 0
             
         # Difficulty Step Up
-        if self.consecutive_strong_answers >= 2:
+        if self.consecutive_strong_answers >= RAMP_STREAK:
             old_diff = self.current_difficulty.value
             if self.current_difficulty == Difficulty.EASY:
                 self.current_difficulty = Difficulty.MEDIUM
@@ -208,12 +327,17 @@ class InterviewEngine:
                 self.current_difficulty = Difficulty.HARD
             
             if old_diff != self.current_difficulty.value:
-                self.engine_logs.append(f"📈 DECISION: Elevating difficulty to {self.current_difficulty.value.upper()} due to high performance streak.")
+                self.trace.record("difficulty_up", difficulty=self.current_difficulty.value)
                 self.consecutive_strong_answers = 0
+                m = instrumentation.ACTIVE
+                if m:
+                    m.inc("engine_difficulty_changes_total", direction="up")
+                    if self.state != InterviewStatus.ADAPTIVE_MODE:
+                        m.inc("engine_state_transitions_total", **{"from": self.state.value, "to": InterviewStatus.ADAPTIVE_MODE.value})
                 self.state = InterviewStatus.ADAPTIVE_MODE
             
         # Difficulty Step Down
-        if self.consecutive_weak_answers >= 2:
+        if self.consecutive_weak_answers >= RAMP_STREAK:
             old_diff = self.current_difficulty.value
             if self.current_difficulty == Difficulty.HARD:
                 self.current_difficulty = Difficulty.MEDIUM
@@ -221,33 +345,45 @@ class InterviewEngine:
                 self.current_difficulty = Difficulty.EASY
             
             if old_diff != self.current_difficulty.value:
-                self.engine_logs.append(f"📉 DECISION: Stabilizing difficulty to {self.current_difficulty.value.upper()} to better assess performance.")
+                self.trace.record("difficulty_down", difficulty=self.current_difficulty.value)
                 self.consecutive_weak_answers = 0
+                m = instrumentation.ACTIVE
+                if m:
+                    m.inc("engine_difficulty_changes_total", direction="down")
 
     def _should_terminate(self) -> bool:
         if self.consecutive_weak_answers >= self.config.early_termination_threshold_count:
             self.termination_reason = f"Consecutive failure threshold ({self.config.early_termination_threshold_count}) exceeded."
+            self._termination_rule = "consecutive_failures"
             return True
         if self.current_question_index >= 2:
             avg = self.total_score_sum / self.current_question_index
             if avg < self.config.min_score_threshold:
                 self.termination_reason = f"Average score ({avg:.1f}%) dropped below minimum threshold of {self.config.min_score_threshold}%."
+                self._termination_rule = "min_average_score"
                 return True
         return False
 
     def calculate_confidence_score(self) -> float:
         """FEATURE: Interview Confidence Score (Stability metric)"""
-        if len(self.history) < 2:
+        if len(self.records) < 2:
             return 80.0
-        scores = [r.score.overall for r in self.history]
-        mean = sum(scores) / len(scores)
-        variance = sum((x - mean) ** 2 for x in scores) / len(scores)
+        variance = self._score_m2 / len(self.records)
         std_dev = variance ** 0.5
         # Lower std_dev means higher stability
         confidence = max(0, 100 - (std_dev * 2))
         return confidence
 
     def generate_final_report(self) -> InterviewResult:
+        # Memoized until history or the terminal state changes (the UI may override state directly)
+        key = (len(self.records), self.state, self.termination_reason)
+        m = instrumentation.ACTIVE
+        if self._report is not None and self._report_key == key:
+            if m:
+                m.inc("engine_report_cache_hits_total")
+            return self._report
+        t = m.clock() if m else 0.0
+
         final_score = (self.total_score_sum / self.current_question_index) if self.current_question_index > 0 else 0
         confidence = self.calculate_confidence_score()
         
@@ -262,16 +398,9 @@ class InterviewEngine:
             hiring_readiness = "Not Ready 🛑"
             readiness_cat = "Needs Improvement"
             
-        skill_totals = {}
-        skill_counts = {}
-        for res in self.history:
-            s = res.question.skill
-            skill_totals[s] = skill_totals.get(s, 0) + res.score.overall
-            skill_counts[s] = skill_counts.get(s, 0) + 1
-            
-        skill_breakdown = {s: skill_totals[s]/skill_counts[s] for s in skill_totals}
+        skill_breakdown = {s: self._skill_totals[s]/self._skill_counts[s] for s in self._skill_totals}
         
-        return InterviewResult(
+        self._report = InterviewResult(
             final_score=final_score,
             hiring_readiness=hiring_readiness,
             readiness_category=readiness_cat,
@@ -284,12 +413,16 @@ class InterviewEngine:
             termination_reason=self.termination_reason,
             timeline=self.history
         )
+        self._report_key = key
+        if m:
+            m.lap("generate_final_report", t)
+        return self._report
 
     def _identify_strengths(self) -> List[str]:
-        return list(set([res.question.skill for res in self.history if res.score.overall >= 75]))
+        return list(self._strengths)
 
     def _identify_weaknesses(self) -> List[str]:
-        return list(set([res.question.skill for res in self.history if res.score.overall < 50]))
+        return list(self._weaknesses)
 
     def _generate_suggestions(self, cat: str) -> List[str]:
         if cat == "Strong":
@@ -0,0 +1,123 @@
+"""Memory-compact session history.
+
+Answered questions are kept in parallel arrays instead of one pydantic
+QuestionResult per answer: scores and timings in a single array('d'), state,
+difficulty and timeout flags in a bytearray, and questions as references to
+the shared Question objects owned by the bank index (a flyweight, never a
+copy). Feedback strings are interned per template combination. Pydantic
+models are only materialized at the API/report boundary.
+"""
+from array import array
+from typing import Dict, List, NamedTuple, Tuple
+from models import InterviewStatus, Difficulty, Question, QuestionResult
+
+# Explicit code tables so reordering the enums can never change stored codes
+STATUS_CODES: Tuple[InterviewStatus, ...] = (
+    InterviewStatus.NOT_STARTED, InterviewStatus.IN_PROGRESS, InterviewStatus.ADAPTIVE_MODE,
+    InterviewStatus.EARLY_TERMINATED, InterviewStatus.COMPLETED
+)
+DIFFICULTY_CODES: Tuple[Difficulty, ...] = (Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD)
+_STATUS_INDEX = {s: i for i, s in enumerate(STATUS_CODES)}
+_DIFFICULTY_INDEX = {d: i for i, d in enumerate(DIFFICULTY_CODES)}
+
+# Row layout of the float and code arrays
+_FLOATS = 7   # time_taken, accuracy, relevance, clarity, time_efficiency, overall, bonus
+_CODES = 3    # state code, difficulty code, timeout flag
+
+
+class Scores(NamedTuple):
+    """Score dimensions for one answer; attribute-compatible with ScoreBreakdown."""
+    accuracy: float
+    relevance: float
+    clarity: float
+    time_efficiency: float
+    overall: float
+    bonus: float
+
+
+# --- Feedback templates ---
+FEEDBACK_EMPTY = "Empty response detected. Zero points awarded for this section."
+FEEDBACK_LOW_ACCURACY = "Low technical accuracy. Missing key concepts like {missing}."
+FEEDBACK_STRONG = "Strong technical alignment with expected keywords."
+FEEDBACK_FILLER = "Usage of filler words detected. Work on professional articulation."
+FEEDBACK_SLOW = "Response time was slow for this difficulty level."
+FEEDBACK_SPEED = "Excellent speed and accuracy streak!"
+
+# Composed feedback strings keyed by (template tuple, missing keywords). The set of
+# combinations is bounded by the bank, and every session shares the same objects.
+_FEEDBACK_CACHE: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], str] = {}
+
+
+def compose_feedback(templates: Tuple[str, ...], missing: Tuple[str, ...] = ()) -> str:
+    key = (templates, missing)
+    text = _FEEDBACK_CACHE.get(key)
+    if text is None:
+        text = " ".join(t.format(missing=", ".join(missing)) if t is FEEDBACK_LOW_ACCURACY else t for t in templates)
+        _FEEDBACK_CACHE[key] = text
+    return text
+
+
+class SessionHistory:
+    """FEATURE: Array-backed history of answered questions for one session."""
+
+    __slots__ = ("questions", "answers", "feedback", "_floats", "_codes")
+
+    def __init__(self):
+        self.questions: List[Question] = []
+        self.answers: List[str] = []
+        self.feedback: List[str] = []
+        self._floats = array("d")
+        self._codes = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def append(
+        self, question: Question, answer: str, time_taken: float, is_timeout: bool,
+        scores: Scores, state: InterviewStatus, difficulty: Difficulty, feedback: str
+    ):
+        self.questions.append(question)
+        self.answers.append(answer)
+        self.feedback.append(feedback)
+        self._floats.append(time_taken)
+        self._floats.extend(scores)
+        self._codes.append(_STATUS_INDEX[state])
+        self._codes.append(_DIFFICULTY_INDEX[difficulty])
+        self._codes.append(1 if is_timeout else 0)
+
+    def time_taken(self, i: int) -> float:
+        return self._floats[i * _FLOATS]
+
+    def scores(self, i: int) -> Scores:
+        base = i * _FLOATS + 1
+        return Scores(*self._floats[base:base + 6])
+
+    def overall(self, i: int) -> float:
+        return self._floats[i * _FLOATS + 5]
+
+    def state(self, i: int) -> InterviewStatus:
+        return STATUS_CODES[self._codes[i * _CODES]]
+
+    def difficulty(self, i: int) -> Difficulty:
+        return DIFFICULTY_CODES[self._codes[i * _CODES + 1]]
+
+    def is_timeout(self, i: int) -> bool:
+        return bool(self._codes[i * _CODES + 2])
+
+    def result(self, i: int) -> QuestionResult:
+        """Materialize row `i` as a pydantic QuestionResult."""
+        # Nested dicts go through pydantic-core in one call, which beats model_construct
+        question = self.questions[i]
+        return QuestionResult(
+            question=question,
+            response={
+                "question_id": question.id,
+                "answer": self.answers[i],
+                "time_taken": self.time_taken(i),
+                "is_timeout": self.is_timeout(i)
+            },
+            score=self.scores(i)._asdict(),
+            state_at_time=self.state(i),
+            difficulty_at_time=self.difficulty(i),
+            feedback=self.feedback[i]
+        )
@@ -0,0 +1,178 @@
+"""Opt-in latency histograms and decision counters for InterviewEngine.
+
+Instrumentation is off by default: ACTIVE is None and every instrumented spot
+in the engine costs one module attribute load and a falsy check. enable()
+installs a MetricsRegistry that records:
+
+    engine_stage_seconds{stage}            histogram per pipeline stage
+    engine_state_transitions_total{from,to}
+    engine_terminations_total{rule}
+    engine_difficulty_changes_total{direction}
+    engine_report_cache_hits_total
+    engine_score_cache_total{result}       when a score cache is enabled (score_cache.py)
+
+Hooks registered with add_hook() see every observation as it happens, e.g. to
+forward them to StatsD or a tracing system. Snapshots are available as JSON
+(snapshot()) or Prometheus text exposition (to_prometheus()).
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Upper bounds in seconds; engine stages live in the microsecond to millisecond range
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 1.0
+)
+STAGE_METRIC = "engine_stage_seconds"
+
+Labels = Tuple[Tuple[str, str], ...]
+Hook = Callable[[str, float, Dict[str, str]], None]   # (metric name, value, labels)
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)   # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (inf if it is in the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, n in zip(self.bounds + (float("inf"),), self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {str(b): n for b, n in zip(self.bounds + ("+Inf",), self.counts)},
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MetricsRegistry:
+    """FEATURE: In-process metrics for engine stages and decisions."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, clock=time.perf_counter):
+        self.buckets = buckets
+        self.clock = clock
+        self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self.counters: Dict[Tuple[str, Labels], int] = {}
+        self.hooks: List[Hook] = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Hook):
+        self.hooks.append(hook)
+
+    def observe(self, name: str, value: float, **labels: str):
+        self._observe((name, tuple(sorted(labels.items()))), value)
+
+    def _observe(self, key: Tuple[str, Labels], value: float):
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = Histogram(self.buckets)
+            hist.observe(value)
+        if self.hooks:
+            labels = dict(key[1])
+            for hook in self.hooks:
+                hook(key[0], value, labels)
+
+    def inc(self, name: str, value: int = 1, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+        for hook in self.hooks:
+            hook(name, value, labels)
+
+    def lap(self, stage: str, started: float) -> float:
+        """Record the time since `started` for `stage` and return the current clock."""
+        now = self.clock()
+        self._observe((STAGE_METRIC, (("stage", stage),)), now - started)
+        return now
+
+    def stage(self, stage: str) -> Optional[Histogram]:
+        return self.histograms.get((STAGE_METRIC, (("stage", stage),)))
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def snapshot(self) -> dict:
+        """JSON-ready view of every counter and histogram."""
+        with self._lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), **hist.to_dict()}
+                    for (name, labels), hist in sorted(self.histograms.items())
+                ],
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        typed = set()
+        with self._lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} counter")
+                    typed.add(name)
+                lines.append(f"{name}{_labels(labels)} {value}")
+            for (name, labels), hist in sorted(self.histograms.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} histogram")
+                    typed.add(name)
+                cumulative = 0
+                for bound, n in zip(hist.bounds + (float("inf"),), hist.counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {hist.sum!r}")
+                lines.append(f"{name}_count{_labels(labels)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# The registry engines report to, or None when instrumentation is disabled
+ACTIVE: Optional[MetricsRegistry] = None
+
+
+def enable(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    global ACTIVE
+    ACTIVE = registry if registry is not None else (ACTIVE or MetricsRegistry())
+    return ACTIVE
+
+
+def disable():
+    global ACTIVE
+    ACTIVE = None
@@ -0,0 +1,94 @@
+from typing import Dict, List, Sequence, Tuple
+from models import Question
+
+
+class KeywordMatcher:
+    """FEATURE: Compiled multi-keyword matcher for accuracy scoring.
+
+    Keywords are lowercased and deduplicated once. Matching lowercases the
+    answer a single time and scans longest keywords first; a shorter keyword
+    contained in one that already hit is marked found without another scan.
+    """
+
+    __slots__ = ("source", "keywords", "_pairs", "_order", "_implied")
+
+    def __init__(self, keywords: Sequence[str]):
+        self.source = keywords
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        self._pairs = tuple((kw, kw.lower()) for kw in self.keywords)
+        lowered = list(dict.fromkeys(kw.lower() for kw in self.keywords))
+        self._order: Tuple[str, ...] = tuple(sorted(lowered, key=len, reverse=True))
+        self._implied: Dict[str, Tuple[str, ...]] = {
+            kw: tuple(other for other in lowered if other != kw and other in kw)
+            for kw in self._order
+        }
+
+    def found(self, answer: str) -> List[str]:
+        """Expected keywords present in `answer`, in their original order."""
+        if not self.keywords:
+            return []
+        return self.found_lowered(answer.lower())
+
+    def found_lowered(self, lowered: str) -> List[str]:
+        """Same as `found` for an answer the caller has already lowercased."""
+        hits = set()
+        for kw in self._order:
+            if kw in hits:
+                continue
+            if kw in lowered:
+                hits.add(kw)
+                hits.update(self._implied[kw])
+        return self.ordered(hits)
+
+    @property
+    def lowered(self) -> Tuple[str, ...]:
+        """Distinct lowercased keywords, longest first."""
+        return self._order
+
+    def ordered(self, hits) -> List[str]:
+        """Original keywords whose lowercased form is in `hits`, in question order."""
+        return [kw for kw, low in self._pairs if low in hits]
+
+    def missing(self, found: Sequence[str]) -> List[str]:
+        found_set = set(found)
+        return [kw for kw in self.keywords if kw not in found_set]
+
+
+# Compiled matchers keyed by question id and keyword list. Sessions on an older
+# bank snapshot (see question_bank.reload_bank) and sessions on the current one
+# each find the matcher for their own version of an edited question. Each reload
+# prunes the entries the new snapshot no longer has, so the cache stays at about
+# one matcher per live question however many reloads a process sees.
+_MATCHER_CACHE: Dict[Tuple[str, Tuple[str, ...]], KeywordMatcher] = {}
+
+
+def get_matcher(question: Question) -> KeywordMatcher:
+    key = (question.id, tuple(question.expected_keywords))
+    matcher = _MATCHER_CACHE.get(key)
+    if matcher is None:
+        matcher = _MATCHER_CACHE[key] = KeywordMatcher(question.expected_keywords)
+    return matcher
+
+
+def match_keywords(question: Question, answer: str) -> List[str]:
+    return get_matcher(question).found(answer)
+
+
+def prune_matcher_cache(index) -> int:
+    """Drop matchers for questions `index` no longer holds in that form; returns how many.
+
+    A session still on an older snapshot simply recompiles the matcher it asks
+    for again, and the next reload drops it once more.
+    """
+    stale = []
+    for key in _MATCHER_CACHE:
+        question = index.get(key[0])
+        if question is None or tuple(question.expected_keywords) != key[1]:
+            stale.append(key)
+    for key in stale:
+        _MATCHER_CACHE.pop(key, None)
+    return len(stale)
+
+
+def clear_matcher_cache() -> None:
+    _MATCHER_CACHE.clear()
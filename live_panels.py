@@ -0,0 +1,89 @@
+"""Panels of the live interview page that refresh without rerunning the script.
+
+The countdown is a client-side timer in an HTML iframe. The page renders it
+once per script run, seeded with the time already spent on the question, and
+the browser ticks it from there. It costs no server reruns, so the script, the question card, live
+scoring and the engine only run when the candidate types or submits, as they
+did before the countdown moved on its own. The decision trace panel is a
+fragment. Its HTML is cached in session state until the trace changes, so
+full-page reruns (each keystroke batch in the answer box) no longer re-render
+every event. A trace only changes when an answer is submitted, and that reruns
+the whole page anyway.
+"""
+import time
+from typing import Optional
+import streamlit as st
+from decision_trace import DecisionTrace
+
+TIMER_WARNING_SECONDS = 10
+TIMER_HEIGHT = 48
+
+_TIMER_TEMPLATE = """
+<div style="display: flex; align-items: center; gap: 16px; font-family: sans-serif;">
+  <div style="flex: 4; height: 8px; border-radius: 4px; background: rgba(100, 116, 139, 0.25);">
+    <div id="bar" style="height: 100%; width: 0; border-radius: 4px; background: #60a5fa;"></div>
+  </div>
+  <p id="label" style="flex: 1; margin: 0; color: #64748b; font-weight: 700;"></p>
+</div>
+<script>
+  const limit = __LIMIT__, elapsedAtRender = __ELAPSED__, warning = __WARNING__;
+  const t0 = performance.now();
+  const bar = document.getElementById("bar"), label = document.getElementById("label");
+  function tick() {
+    const elapsed = elapsedAtRender + (performance.now() - t0) / 1000;
+    const remaining = Math.max(0, limit - elapsed);
+    bar.style.width = Math.min(100, 100 * elapsed / limit) + "%";
+    if (remaining === 0) {
+      label.textContent = "\u23f1\ufe0f TIME EXCEEDED";
+      label.style.color = "#ef4444";
+      return;
+    }
+    label.textContent = (remaining <= warning ? "\u26a0\ufe0f " : "\u23f1\ufe0f ") + Math.floor(remaining) + "s";
+    if (remaining <= warning) label.style.color = "#ef4444";
+    setTimeout(tick, 250);
+  }
+  tick();
+</script>
+"""
+
+
+def timer_html(time_limit: int, elapsed: float) -> str:
+    """Countdown markup for a question with `elapsed` of its `time_limit` seconds already spent."""
+    return (_TIMER_TEMPLATE
+            .replace("__LIMIT__", str(int(time_limit)))
+            .replace("__ELAPSED__", f"{max(0.0, elapsed):.3f}")
+            .replace("__WARNING__", str(TIMER_WARNING_SECONDS)))
+
+
+def trace_html(trace: DecisionTrace) -> str:
+    """render_html() of `trace`, memoized in session state until an event is added."""
+    # Every append grows the buffer or, once it is full, the dropped count
+    key = (len(trace), trace.dropped)
+    cached = st.session_state.get("_trace_html")
+    if cached is None or cached[0] is not trace or cached[1] != key:
+        cached = st.session_state["_trace_html"] = (trace, key, trace.render_html())
+    return cached[2]
+
+
+def render_trace(trace: DecisionTrace):
+    with st.expander("🛠️ Decision Trace (BETA)"):
+        st.markdown('<p style="font-family: Courier; color: #10b981;">Engine internal logs are generated on every transition.</p>', unsafe_allow_html=True)
+        st.markdown(f'<div class="log-container">{trace_html(trace)}</div>', unsafe_allow_html=True)
+
+
+def timer_panel(time_limit: int, now: Optional[float] = None):
+    """FEATURE: Live countdown that ticks in the browser between script runs."""
+    start_time = st.session_state.get("start_time")
+    if start_time is not None:
+        elapsed = (time.time() if now is None else now) - start_time
+        html = timer_html(time_limit, elapsed)
+        if hasattr(st, "iframe"):
+            st.iframe(html, height=TIMER_HEIGHT)
+        else:  # Streamlit before st.iframe
+            import streamlit.components.v1 as components
+            components.html(html, height=TIMER_HEIGHT)
+
+
+@st.fragment
+def trace_panel(trace: DecisionTrace):
+    render_trace(trace)
@@ -0,0 +1,175 @@
+"""Incremental answer analysis while the candidate is still typing.
+
+LiveScorer keeps the state of text_analysis.analyze() for a growing answer:
+a stack of committed tokens (with running word and filler counts at each
+token), topic-term counts over the committed tokens, and the first-occurrence
+offset of every expected keyword. An edit
+rewinds the stacks to the last token that ends before the edit, and only the
+text after that point is tokenized and searched again, so the Python-level
+work per update is proportional to the delta rather than to the answer.
+
+Only whitespace-terminated tokens are committed. The trailing token may still
+grow, so it is re-read on every update. Lowercasing is done per segment, always
+split at whitespace, so the result matches lowercasing the whole answer (even
+for context-sensitive cases such as a final sigma).
+
+`stats()` is always equal to `analyze(question, text)`.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+from models import Question
+from keyword_matcher import get_matcher
+from text_analysis import FILLER_WORDS, FILLER_PHRASES, PUNCTUATION, TextStats
+from relevance import TERM_RE, STOP_WORDS
+
+_TOKEN_RE = re.compile(r"\S+")
+_PHRASE_TAILS: Dict[str, Tuple[str, ...]] = {}
+for _head, _tail in FILLER_PHRASES:
+    _PHRASE_TAILS[_tail] = _PHRASE_TAILS.get(_tail, ()) + (_head,)
+
+
+def _token_fillers(token: str, previous: Optional[str]) -> int:
+    """Fillers a lowercased token adds, given the token before it (same rules as the analyzer regex)."""
+    if token.strip(PUNCTUATION) in FILLER_WORDS:
+        return 1
+    # A phrase is "head tail" with punctuation allowed only before the head and after the tail
+    heads = _PHRASE_TAILS.get(token.rstrip(PUNCTUATION))
+    if heads and previous is not None and previous.lstrip(PUNCTUATION) in heads:
+        return 1
+    return 0
+
+
+def _token_terms(token: str) -> List[str]:
+    return [t for t in TERM_RE.findall(token) if t not in STOP_WORDS]
+
+
+class LiveScorer:
+    """FEATURE: Per-question incremental analyzer fed with text edits."""
+
+    __slots__ = (
+        "question", "_matcher", "_keywords", "text", "_lowered",
+        "_ends", "_low_ends", "_tokens", "_fillers", "_hits", "_terms",
+        "_open_token", "_open_fillers"
+    )
+
+    def __init__(self, question: Question):
+        self.question = question
+        self._matcher = get_matcher(question)
+        self._keywords = self._matcher.lowered
+        self.text = ""
+        self._lowered = ""
+        # Committed token stack: raw end, lowered end, lowered token, running filler count
+        self._ends: List[int] = []
+        self._low_ends: List[int] = []
+        self._tokens: List[str] = []
+        self._fillers: List[int] = []
+        # Lowercased keyword -> lowered end offset of its first occurrence
+        self._hits: Dict[str, int] = {}
+        # Topic-term counts of the committed tokens (terms never span whitespace)
+        self._terms: Dict[str, int] = {}
+        self._open_token: Optional[str] = None
+        self._open_fillers = 0
+
+    def update(self, text: str) -> TextStats:
+        """Bring the scorer to `text` (the full current answer) and return its stats."""
+        old = self.text
+        if text == old:
+            return self.stats()
+        if text.startswith(old):
+            return self.append(text[len(old):])
+        # Longest common prefix by bisection; each probe is a C-level compare
+        lo, hi = 0, min(len(old), len(text))
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if old[:mid] == text[:mid]:
+                lo = mid
+            else:
+                hi = mid - 1
+        self._rewind(lo)
+        return self._scan(text)
+
+    def append(self, delta: str) -> TextStats:
+        """Append typed text."""
+        if delta:
+            self._rewind(len(self.text))
+            self._scan(self.text + delta)
+        return self.stats()
+
+    def edit(self, start: int, end: int, replacement: str = "") -> TextStats:
+        """Replace text[start:end] with `replacement`."""
+        text = self.text[:start] + replacement + self.text[end:]
+        self._rewind(start)
+        return self._scan(text)
+
+    def _rewind(self, changed_at: int):
+        # Drop every token whose end is at or after the first changed character. A
+        # change right after a token can merge it with the next one, so that token goes too.
+        ends = self._ends
+        terms = self._terms
+        while ends and ends[-1] >= changed_at:
+            ends.pop()
+            self._low_ends.pop()
+            for term in _token_terms(self._tokens.pop()):
+                if terms[term] == 1:
+                    del terms[term]
+                else:
+                    terms[term] -= 1
+            self._fillers.pop()
+        cut = self._low_ends[-1] if self._low_ends else 0
+        self._lowered = self._lowered[:cut]
+        for kw in [kw for kw, end in self._hits.items() if end > cut]:
+            del self._hits[kw]
+        self._open_token = None
+        self._open_fillers = 0
+
+    def _scan(self, text: str) -> TextStats:
+        raw_cut = self._ends[-1] if self._ends else 0
+        low_cut = len(self._lowered)
+        segment = text[raw_cut:]
+        self._lowered += segment.lower()
+
+        previous = self._tokens[-1] if self._tokens else None
+        fillers = self._fillers[-1] if self._fillers else 0
+        terms = self._terms
+        closed = bool(segment) and segment[-1].isspace()
+        # Walk raw tokens; whitespace lowercases to itself, so lowered offsets advance by
+        # the gap plus each lowered token
+        low_pos, raw_pos = low_cut, 0
+        for m in _TOKEN_RE.finditer(segment):
+            token = m.group().lower()
+            low_pos += (m.start() - raw_pos) + len(token)
+            raw_pos = m.end()
+            added = _token_fillers(token, previous)
+            if raw_pos == len(segment) and not closed:
+                self._open_token = token
+                self._open_fillers = added
+                break
+            fillers += added
+            for term in _token_terms(token):
+                terms[term] = terms.get(term, 0) + 1
+            self._tokens.append(token)
+            self._fillers.append(fillers)
+            self._ends.append(raw_cut + raw_pos)
+            self._low_ends.append(low_pos)
+            previous = token
+        self.text = text
+
+        # Keywords not yet seen can only end inside the new segment, possibly starting up to
+        # len(keyword) - 1 characters before it
+        lowered = self._lowered
+        for kw in self._keywords:
+            if kw not in self._hits:
+                i = lowered.find(kw, max(0, low_cut - len(kw) + 1))
+                if i >= 0:
+                    self._hits[kw] = i + len(kw)
+        return self.stats()
+
+    def stats(self) -> TextStats:
+        words = len(self._tokens) + (1 if self._open_token is not None else 0)
+        fillers = (self._fillers[-1] if self._fillers else 0) + self._open_fillers
+        found = self._matcher.ordered(self._hits) if self._hits else []
+        terms = dict(self._terms)
+        if self._open_token is not None:
+            for term in _token_terms(self._open_token):
+                terms[term] = terms.get(term, 0) + 1
+        return TextStats(words=words, fillers=fillers, found=found, chars=len(self.text), terms=terms)
@@ -0,0 +1,316 @@
+"""The adaptive interview policy as a transition table, plus a vectorized Monte-Carlo.
+
+InterviewEngine's adaptive rules depend only on a small discrete state:
+
+    (difficulty, strong streak, weak streak)
+
+and on the band of each answer's overall score (strong >= STRONG_SCORE,
+weak < WEAK_SCORE, otherwise neutral). compile_policy() enumerates that state
+space for an InterviewConfig and tabulates the next state for every
+(state, band) pair. Streaks are capped at the largest value any rule looks at,
+so the table stays small (3 x 3 x 3 states at the defaults). The
+min-average-score rule needs the running score sum, which simulate() tracks as
+one float column per trajectory.
+
+simulate() advances millions of trajectories together, one question per NumPy
+step, and returns per-trajectory outcomes. The engine also stops when no unasked
+question is left at the current difficulty: it serves None and the session
+stays IN_PROGRESS. Given the bank's pool sizes (bank_pool_sizes()), simulate()
+tracks asked counts per difficulty and ends such trajectories as exhausted.
+verify_against_engine() replays the same score sequences through the scalar
+engine, on the live bank, and reports any disagreement.
+
+Run from the repo root to sweep configs:
+
+    python policy.py --max-questions 5,8 --threshold 2,3 --min-score 30,40
+    python policy.py --live-bank            # include running out of questions in the current bank
+"""
+import argparse
+import json
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+from models import Difficulty, InterviewConfig, InterviewStatus
+from history import DIFFICULTY_CODES
+
+if TYPE_CHECKING:
+    import numpy as np
+
+STRONG_SCORE = 80       # Overall score that extends the strong streak
+WEAK_SCORE = 40         # Overall score below this extends the weak streak
+RAMP_STREAK = 2         # Consecutive strong (or weak) answers that shift difficulty
+SENIOR_LEVELS = ("Senior", "Lead")
+
+BAND_NEUTRAL, BAND_STRONG, BAND_WEAK = 0, 1, 2
+
+# Outcomes.status codes
+STATUS_COMPLETED, STATUS_TERMINATED, STATUS_EXHAUSTED = 0, 1, 2
+
+# Termination rules, named as in InterviewEngine._termination_rule
+RULES = ("consecutive_failures", "min_average_score")
+RULE_NONE, RULE_CONSECUTIVE, RULE_AVERAGE = -1, 0, 1
+
+# (trajectory rows, their difficulty codes, question number) -> overall scores for those rows
+ScoreFn = Callable[["np.ndarray", "np.ndarray", int], "np.ndarray"]
+
+
+def entry_difficulty(experience_level: str) -> Difficulty:
+    """Seniority-based entry difficulty."""
+    return Difficulty.MEDIUM if experience_level in SENIOR_LEVELS else Difficulty.EASY
+
+
+class PolicyTable(NamedTuple):
+    """Transition table over encoded states (difficulty, strong, weak)."""
+    config: InterviewConfig
+    streak: int
+    strong_cap: int
+    weak_cap: int
+    next_state: "np.ndarray"    # [state, band] -> state
+    difficulty: "np.ndarray"    # [state] -> difficulty code
+    weak: "np.ndarray"          # [state] -> weak streak (capped)
+
+    def encode(self, difficulty: int, strong: int, weak: int) -> int:
+        return (difficulty * (self.strong_cap + 1) + min(strong, self.strong_cap)) * (self.weak_cap + 1) + min(weak, self.weak_cap)
+
+
+def compile_policy(config: InterviewConfig) -> PolicyTable:
+    """FEATURE: Tabulate the engine's adaptive rules for `config`."""
+    import numpy as np  # Deferred: the engine imports this module's thresholds on every cold start
+    # The engine does not read config.ramp_rate; every config shifts after RAMP_STREAK answers
+    streak = RAMP_STREAK
+    strong_cap = streak
+    weak_cap = max(streak, config.early_termination_threshold_count)
+    top = len(DIFFICULTY_CODES) - 1
+    n_states = len(DIFFICULTY_CODES) * (strong_cap + 1) * (weak_cap + 1)
+    next_state = np.empty((n_states, 3), dtype=np.int32)
+    difficulty = np.empty(n_states, dtype=np.int8)
+    weak_of = np.empty(n_states, dtype=np.int32)
+    table = PolicyTable(config, streak, strong_cap, weak_cap, next_state, difficulty, weak_of)
+
+    for d in range(len(DIFFICULTY_CODES)):
+        for s in range(strong_cap + 1):
+            for w in range(weak_cap + 1):
+                state = table.encode(d, s, w)
+                difficulty[state] = d
+                weak_of[state] = w
+                for band in (BAND_NEUTRAL, BAND_STRONG, BAND_WEAK):
+                    # Same order of operations as InterviewEngine._apply_adaptive_rules
+                    nd, ns, nw = d, 0, 0
+                    if band == BAND_STRONG:
+                        ns = s + 1
+                    elif band == BAND_WEAK:
+                        nw = w + 1
+                    if ns >= streak and nd < top:
+                        nd, ns = nd + 1, 0
+                    if nw >= streak and nd > 0:
+                        nd, nw = nd - 1, 0
+                    next_state[state, band] = table.encode(nd, ns, nw)
+    return table
+
+
+class Outcomes(NamedTuple):
+    """Per-trajectory results of simulate()."""
+    status: "np.ndarray"            # int8: STATUS_* (completed, early terminated, question pool exhausted)
+    rule: "np.ndarray"              # int8: RULE_* code, RULE_NONE unless early terminated
+    length: "np.ndarray"            # int16: questions answered
+    final_difficulty: "np.ndarray"  # int8: difficulty code when the interview ended
+    final_score: "np.ndarray"       # float64: average overall score
+
+    def summary(self) -> Dict[str, object]:
+        import numpy as np
+        n = len(self.status)
+        rules = np.bincount(self.rule + 1, minlength=len(RULES) + 1)
+        difficulties = np.bincount(self.final_difficulty, minlength=len(DIFFICULTY_CODES))
+        return {
+            "trajectories": n,
+            "completion_rate": float((self.status == STATUS_COMPLETED).mean()) if n else 0.0,
+            "exhaustion_rate": float((self.status == STATUS_EXHAUSTED).mean()) if n else 0.0,
+            "termination_rates": {rule: float(rules[i + 1] / n) for i, rule in enumerate(RULES)} if n else {},
+            "final_difficulty": {d.value: float(difficulties[i] / n) for i, d in enumerate(DIFFICULTY_CODES)} if n else {},
+            "expected_length": float(self.length.mean()) if n else 0.0,
+            "mean_final_score": float(self.final_score.mean()) if n else 0.0,
+        }
+
+
+def bank_pool_sizes(index) -> List[int]:
+    """Questions per difficulty code in a bank index, the limits simulate() exhausts."""
+    return [len(index.pool(d)) for d in DIFFICULTY_CODES]
+
+
+def simulate(
+    table: PolicyTable,
+    scores: Union["np.ndarray", ScoreFn],
+    n: Optional[int] = None,
+    entry: Union[Difficulty, "np.ndarray"] = Difficulty.EASY,
+    pool_sizes: Optional[Sequence[int]] = None
+) -> Outcomes:
+    """Run trajectories through the policy table, one vectorized step per question.
+
+    `scores` is either an (n, max_questions) matrix of overall scores, answered
+    in column order, or a ScoreFn that draws scores given each trajectory's
+    current difficulty (then `n` is required). `entry` is the starting
+    difficulty, for all trajectories or per trajectory as difficulty codes.
+    `pool_sizes` are the questions per difficulty code; a trajectory whose
+    current difficulty has none left unasked ends as STATUS_EXHAUSTED. Without
+    it the bank is treated as unlimited.
+    """
+    import numpy as np
+    config = table.config
+    max_q = config.max_questions
+    if callable(scores):
+        if n is None:
+            raise ValueError("n is required when scores is a ScoreFn")
+        score_at = scores
+    else:
+        scores = np.asarray(scores, dtype=np.float64)
+        n = len(scores)
+        if scores.shape[1] < max_q:
+            raise ValueError(f"score matrix has {scores.shape[1]} columns; max_questions is {max_q}")
+        score_at = lambda rows, _difficulty, k: scores[rows, k]
+
+    entry_codes = (
+        np.full(n, DIFFICULTY_CODES.index(entry), dtype=np.int8) if isinstance(entry, Difficulty)
+        else np.asarray(entry, dtype=np.int8)
+    )
+    state = (entry_codes.astype(np.int32) * (table.strong_cap + 1)) * (table.weak_cap + 1)
+    total = np.zeros(n)
+    length = np.zeros(n, dtype=np.int16)
+    status = np.zeros(n, dtype=np.int8)
+    rule = np.full(n, RULE_NONE, dtype=np.int8)
+    final_difficulty = entry_codes.copy()
+    active = np.arange(n)
+    if pool_sizes is not None:
+        pools = np.asarray(pool_sizes, dtype=np.int32)
+        asked = np.zeros((n, len(DIFFICULTY_CODES)), dtype=np.int32)
+
+    for k in range(max_q):
+        if pool_sizes is not None and len(active):
+            # InterviewEngine.next_question returns None: the session ends without a status change
+            d = table.difficulty[state[active]]
+            exhausted = asked[active, d] >= pools[d]
+            status[active[exhausted]] = STATUS_EXHAUSTED
+            final_difficulty[active[exhausted]] = d[exhausted]
+            active = active[~exhausted]
+        if not len(active):
+            break
+        current = state[active]
+        if pool_sizes is not None:
+            asked[active, table.difficulty[current]] += 1
+        score = np.asarray(score_at(active, table.difficulty[current], k), dtype=np.float64)
+        band = np.where(score >= STRONG_SCORE, BAND_STRONG, np.where(score < WEAK_SCORE, BAND_WEAK, BAND_NEUTRAL))
+        current = table.next_state[current, band]
+        state[active] = current
+        total[active] += score
+        answered = k + 1
+        length[active] = answered
+
+        consecutive = table.weak[current] >= config.early_termination_threshold_count
+        average = (total[active] / answered < config.min_score_threshold) if answered >= 2 else np.zeros(len(active), dtype=bool)
+        stopped = consecutive | average
+        if answered >= max_q:
+            stopped[:] = True
+        ended = active[stopped]
+        status[ended] = np.where(consecutive | average, STATUS_TERMINATED, STATUS_COMPLETED)[stopped]
+        rule[ended] = np.where(consecutive, RULE_CONSECUTIVE, np.where(average, RULE_AVERAGE, RULE_NONE))[stopped]
+        final_difficulty[ended] = table.difficulty[current[stopped]]
+        active = active[~stopped]
+
+    final_score = np.divide(total, length, out=np.zeros(n), where=length > 0)
+    return Outcomes(status, rule, length, final_difficulty, final_score)
+
+
+def normal_score_model(
+    n: int, rng: "np.random.Generator", means: Sequence[float] = (72.0, 62.0, 52.0),
+    answer_sd: float = 15.0, ability_sd: float = 12.0
+) -> ScoreFn:
+    """Scores ~ clip(mean[difficulty] + candidate ability + noise, 0, 100), ability fixed per trajectory."""
+    import numpy as np
+    ability = rng.normal(0.0, ability_sd, n)
+    means = np.asarray(means, dtype=np.float64)
+
+    def score(rows: "np.ndarray", difficulty: "np.ndarray", _k: int) -> "np.ndarray":
+        return np.clip(means[difficulty] + ability[rows] + rng.normal(0.0, answer_sd, len(rows)), 0, 100)
+
+    return score
+
+
+def verify_against_engine(
+    config: InterviewConfig, scores: "np.ndarray", experience_levels: Sequence[str]
+) -> List[int]:
+    """Rows of `scores` whose scalar-engine outcome differs from simulate(); empty when they agree.
+
+    The engine serves its own questions from the live bank, so sessions that
+    run out of questions are covered too.
+    """
+    import numpy as np
+    from engine import InterviewEngine
+    from history import Scores
+    from models import CandidateProfile, JobDescription
+    import question_bank
+
+    entry = np.array([DIFFICULTY_CODES.index(entry_difficulty(level)) for level in experience_levels], dtype=np.int8)
+    outcomes = simulate(
+        compile_policy(config), scores, entry=entry, pool_sizes=bank_pool_sizes(question_bank.QUESTION_INDEX)
+    )
+    jd = JobDescription(required_skills=["Python"], difficulty_expectation=Difficulty.MEDIUM)
+    statuses = {InterviewStatus.COMPLETED: STATUS_COMPLETED, InterviewStatus.EARLY_TERMINATED: STATUS_TERMINATED}
+    mismatches = []
+    for i, row in enumerate(scores):
+        engine = InterviewEngine(CandidateProfile(name="sim", experience_level=experience_levels[i], skills=[]), jd, config, seed=i)
+        k = iter(row.tolist())
+        # Fixed overall scores in place of answer analysis; every other rule runs unchanged
+        engine._score_components = lambda *_args, **_kw: Scores(0.0, 0.0, 0.0, 0.0, next(k), 0.0)
+        question = engine.start_interview()
+        while question is not None:
+            question = engine.process_response(question, "answer", 30.0)
+        result = engine.generate_final_report()
+        expected_rule = RULES.index(engine._termination_rule) if engine._termination_rule else RULE_NONE
+        if (
+            statuses.get(result.status, STATUS_EXHAUSTED) != outcomes.status[i]
+            or expected_rule != outcomes.rule[i]
+            or len(engine.records) != outcomes.length[i]
+            or DIFFICULTY_CODES.index(engine.current_difficulty) != outcomes.final_difficulty[i]
+            or result.final_score != outcomes.final_score[i]
+        ):
+            mismatches.append(i)
+    return mismatches
+
+
+def _ints(text: str) -> List[int]:
+    return [int(v) for v in text.split(",")]
+
+
+def _floats(text: str) -> List[float]:
+    return [float(v) for v in text.split(",")]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import numpy as np
+    defaults = InterviewConfig()
+    parser = argparse.ArgumentParser(description="Monte-Carlo sweep of the adaptive interview policy")
+    parser.add_argument("--trajectories", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--senior-share", type=float, default=0.3, help="Fraction of trajectories entering at medium")
+    parser.add_argument("--max-questions", type=_ints, default=[defaults.max_questions])
+    parser.add_argument("--threshold", type=_ints, default=[defaults.early_termination_threshold_count])
+    parser.add_argument("--min-score", type=_floats, default=[defaults.min_score_threshold])
+    parser.add_argument("--live-bank", action="store_true",
+                        help="End trajectories when the current question bank runs out (default: unlimited bank)")
+    args = parser.parse_args(argv)
+    pool_sizes = None
+    if args.live_bank:
+        import question_bank
+        pool_sizes = bank_pool_sizes(question_bank.QUESTION_INDEX)
+
+    for max_q in args.max_questions:
+        for threshold in args.threshold:
+            for min_score in args.min_score:
+                config = InterviewConfig(
+                    max_questions=max_q, early_termination_threshold_count=threshold, min_score_threshold=min_score
+                )
+                rng = np.random.default_rng(args.seed)
+                entry = (rng.random(args.trajectories) < args.senior_share).astype(np.int8)
+                model = normal_score_model(args.trajectories, rng)
+                outcomes = simulate(compile_policy(config), model, n=args.trajectories, entry=entry, pool_sizes=pool_sizes)
+                print(json.dumps({"config": config.model_dump(), **outcomes.summary()}))
+
+if __name__ == "__main__":
+    main()
@@ -1,81 +1,255 @@
-from typing import List, Optional
+"""Question bank loading.
+
+Workers load the pre-built artifact question_bank.json in a single pydantic
+validate_json pass instead of executing a large Python module. The artifact
+records a hash of question_bank_source.py; when the source is present and the
+hash no longer matches (or the artifact is missing), the bank is built from
+the source instead so a stale artifact is never served.
+
+Very large banks can be packed into a memory-mapped bank file (see
+bank_store.py) and selected with the QUESTION_BANK_PATH environment variable;
+questions are then decoded only when selected.
+
+The bank can be reloaded while sessions are running (reload_bank(), or a
+BankWatcher polling the files). A reload builds a new QuestionIndex off the
+hot path and then swaps QUESTION_INDEX in one assignment. Each engine keeps
+the index it started with, so in-flight interviews finish on their snapshot
+and only new sessions see the new bank. The snapshot is copy-on-write:
+unchanged questions keep their objects, so their keyword matchers, sampler
+alias tables and relevance vectors are reused. Only added and edited
+questions get new ones.
+
+    python question_bank.py build             # validate the source and rewrite the artifact
+    python question_bank.py pack bank.qbank   # write the current bank as a mapped bank file
+                                              # (plus its bank.qbank.idf.json relevance sidecar)
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import threading
+from typing import Callable, List, NamedTuple, Optional, Tuple
+from pydantic import TypeAdapter
 from models import Question, Difficulty
+from question_index import QuestionIndex
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(_HERE, "question_bank_source.py")
+ARTIFACT_PATH = os.path.join(_HERE, "question_bank.json")
+ARTIFACT_VERSION = 1
+BANK_PATH_ENV = "QUESTION_BANK_PATH"
+
+_QUESTION_LIST = TypeAdapter(List[Question])
+
+
+def source_digest(path: str = SOURCE_PATH) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def validate_source() -> List[Question]:
+    """Full validation of the authoring source, including duplicate ids."""
+    from question_bank_source import QUESTION_SOURCE
+    questions = [Question(**entry) for entry in QUESTION_SOURCE]
+    seen = set()
+    for q in questions:
+        if q.id in seen:
+            raise ValueError(f"Duplicate question id {q.id!r} in question bank source.")
+        seen.add(q.id)
+    return questions
+
+
+def build_artifact(path: str = ARTIFACT_PATH) -> int:
+    questions = validate_source()
+    header = json.dumps({"version": ARTIFACT_VERSION, "source_sha256": source_digest()})
+    body = _QUESTION_LIST.dump_json(questions).decode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(header + "\n" + body + "\n")
+    os.replace(tmp, path)
+    return len(questions)
+
+
+def load_artifact(path: str = ARTIFACT_PATH) -> Optional[List[Question]]:
+    """Questions from the artifact, or None if it is missing or out of date."""
+    try:
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            body = f.read()
+    except FileNotFoundError:
+        return None
+    if header.get("version") != ARTIFACT_VERSION:
+        return None
+    digest = source_digest()
+    if digest is not None and header.get("source_sha256") != digest:
+        return None
+    return _QUESTION_LIST.validate_json(body)
+
+
+def load_question_bank() -> List[Question]:
+    questions = load_artifact()
+    return questions if questions is not None else validate_source()
+
+
+_MAPPED_BANK_PATH = os.environ.get(BANK_PATH_ENV)
+if _MAPPED_BANK_PATH:
+    from bank_store import MappedQuestionIndex
+    QUESTION_INDEX = MappedQuestionIndex(_MAPPED_BANK_PATH)
+else:
+    QUESTION_BANK: List[Question] = load_question_bank()
+    QUESTION_INDEX = QuestionIndex(QUESTION_BANK)
+
+
+def __getattr__(name: str):
+    # A mapped bank is never materialized up front; QUESTION_BANK decodes it on first access
+    if name == "QUESTION_BANK":
+        bank = list(QUESTION_INDEX)
+        globals()["QUESTION_BANK"] = bank
+        return bank
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-QUESTION_BANK: List[Question] = [
-    # PYTHON & BACKEND
-    Question(
-        id="py_01", skill="Python", difficulty=Difficulty.EASY,
-        question_text="Describe the difference between Python's list and dictionary data structures and their use cases.",
-        expected_keywords=["order", "key-value", "o(1)", "indexing", "hash table"],
-        time_limit=45
-    ),
-    Question(
-        id="py_02", skill="Python", difficulty=Difficulty.MEDIUM,
-        question_text="What are decorators and how do they differ from simple higher-order functions?",
-        expected_keywords=["wrapper", "@", "metadata", "function modification", "encapsulation"],
-        time_limit=90
-    ),
-    Question(
-        id="py_03", skill="Python", difficulty=Difficulty.HARD,
-        question_text="Explain Python's memory management, including reference counting and garbage collection for cyclic references.",
-        expected_keywords=["refcount", "generational gc", "cycle detector", "mem-leak", "slots"],
-        time_limit=150
-    ),
-    # SYSTEM DESIGN
-    Question(
-        id="sd_01", skill="System Design", difficulty=Difficulty.EASY,
-        question_text="What is a Content Delivery Network (CDN) and how does it improve system latency?",
-        expected_keywords=["edge location", "caching", "geographic", "static content", "low latency"],
-        time_limit=60
-    ),
-    Question(
-        id="sd_02", skill="System Design", difficulty=Difficulty.MEDIUM,
-        question_text="Discuss the trade-offs between Vertical and Horizontal scaling in a high-traffic environment.",
-        expected_keywords=["ram/cpu", "sharding", "statelessness", "load balancing", "single point of failure"],
-        time_limit=120
-    ),
-    Question(
-        id="sd_03", skill="System Design", difficulty=Difficulty.HARD,
-        question_text="Design a distributed logging system that can handle 1 million events per second with high availability.",
-        expected_keywords=["kafka", "eventual consistency", "sharding", "indexing", "retention policy", "heartbeat"],
-        time_limit=180
-    ),
-    # DATA STRUCTURES
-    Question(
-        id="ds_01", skill="Data Structures", difficulty=Difficulty.EASY,
-        question_text="Explain the 'Double Ended Queue' (deque) and its primary advantages over a standard list.",
-        expected_keywords=["o(1) pop", "left", "right", "collections module", "thread safe"],
-        time_limit=45
-    ),
-    Question(
-        id="ds_02", skill="Data Structures", difficulty=Difficulty.MEDIUM,
-        question_text="How does a Bloom Filter work and what are its performance trade-offs?",
-        expected_keywords=["probabilistic", "false positive", "set membership", "hashing", "memory efficient"],
-        time_limit=100
-    ),
-    Question(
-        id="ds_03", skill="Data Structures", difficulty=Difficulty.HARD,
-        question_text="Compare the time and space complexity of Dijkstra's vs A* search algorithms.",
-        expected_keywords=["heuristic", "greedy", "shortest path", "manhattan distance", "priority queue"],
-        time_limit=150
-    ),
-    # SECURITY & DATABASES
-    Question(
-        id="sec_01", skill="Security", difficulty=Difficulty.MEDIUM,
-        question_text="What is SQL Injection and how can prepared statements prevent it?",
-        expected_keywords=["parameterized queries", "input sanitization", "orm", "validation"],
-        time_limit=60
-    ),
-    Question(
-        id="db_01", skill="Databases", difficulty=Difficulty.HARD,
-        question_text="Explain the CAP theorem and provide an example of a system that prioritizes AP over CP.",
-        expected_keywords=["consistency", "availability", "partition tolerance", "cassandra", "dynamodb"],
-        time_limit=120
-    )
-]
 
 def get_questions_by_difficulty(difficulty: Difficulty, category: Optional[str] = None) -> List[Question]:
-    filtered = [q for q in QUESTION_BANK if q.difficulty == difficulty]
-    if category:
-        filtered = [q for q in filtered if q.skill == category]
-    return filtered
+    return list(QUESTION_INDEX.pool(difficulty, category or None))
+
+
+class BankDiff(NamedTuple):
+    """What a reload changed, by question id."""
+    added: List[Question]
+    removed: List[Question]
+    changed: List[Tuple[Question, Question]]   # (old, new) pairs sharing an id
+    unchanged: int
+
+
+def diff_bank(old: List[Question], new: List[Question]) -> Tuple[List[Question], BankDiff]:
+    """`new` with each unchanged question replaced by its `old` object, and the diff between them."""
+    old_by_id = {q.id: q for q in old}
+    merged, added, changed = [], [], []
+    for q in new:
+        previous = old_by_id.pop(q.id, None)
+        if previous is None:
+            added.append(q)
+        elif previous != q:
+            changed.append((previous, q))
+        else:
+            q = previous
+        merged.append(q)
+    return merged, BankDiff(added, list(old_by_id.values()), changed, len(merged) - len(added) - len(changed))
+
+
+_RELOAD_LOCK = threading.Lock()
+
+
+def _load_fresh() -> List[Question]:
+    questions = load_artifact()
+    if questions is not None:
+        return questions
+    import question_bank_source
+    importlib.reload(question_bank_source)
+    return validate_source()
+
+
+def reload_bank(questions: Optional[List[Question]] = None) -> Optional[BankDiff]:
+    """FEATURE: Hot reload; build the new bank snapshot, then swap it in atomically.
+
+    `questions` defaults to the artifact (or the source if the artifact is
+    stale). A mapped bank is simply reopened from its file and returns None,
+    since its questions are decoded lazily anyway. The old mapping stays open
+    while sessions still use it; it is unmapped and its file closed when the
+    last of them lets go of the old index.
+    """
+    global QUESTION_BANK, QUESTION_INDEX
+    from keyword_matcher import clear_matcher_cache, get_matcher, prune_matcher_cache
+    import relevance
+    import sampling
+    with _RELOAD_LOCK:
+        old_index = QUESTION_INDEX
+        if _MAPPED_BANK_PATH and questions is None:
+            from bank_store import MappedQuestionIndex
+            index = MappedQuestionIndex(_MAPPED_BANK_PATH)
+            globals().pop("QUESTION_BANK", None)
+            QUESTION_INDEX = index
+            # Questions decode lazily, so matchers are rebuilt as the new mapping is used
+            clear_matcher_cache()
+            return None
+        merged, diff = diff_bank(list(old_index), questions if questions is not None else _load_fresh())
+        ids = set()
+        for q in merged:
+            if q.id in ids:
+                raise ValueError(f"Duplicate question id {q.id!r} in reloaded question bank.")
+            ids.add(q.id)
+        index = QuestionIndex(merged)
+        # Derived structures for the new snapshot, built before anyone can see it
+        removed = diff.removed + [old for old, _ in diff.changed]
+        added = diff.added + [new for _, new in diff.changed]
+        for q in added:
+            get_matcher(q)
+        sampling.carry_over(old_index, index)
+        relevance.carry_over(old_index, index, removed, added)
+        QUESTION_BANK = merged
+        QUESTION_INDEX = index
+        prune_matcher_cache(index)
+        return diff
+
+
+class BankWatcher:
+    """Reloads the bank whenever its files change, polling every `interval` seconds."""
+
+    def __init__(self, interval: float = 2.0, on_reload: Optional[Callable[[Optional[BankDiff]], None]] = None):
+        self.interval = interval
+        self.on_reload = on_reload
+        self.reloads = 0
+        self.last_error: Optional[Exception] = None
+        self._stop = threading.Event()
+        self._stamp = self._files_stamp()
+        self._thread = threading.Thread(target=self._run, name="bank-watcher", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _files_stamp() -> tuple:
+        paths = (_MAPPED_BANK_PATH,) if _MAPPED_BANK_PATH else (SOURCE_PATH, ARTIFACT_PATH)
+        return tuple(os.stat(p).st_mtime_ns if os.path.exists(p) else None for p in paths)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            stamp = self._files_stamp()
+            if stamp == self._stamp:
+                continue
+            self._stamp = stamp
+            try:
+                diff = reload_bank()
+            except Exception as e:  # A bad edit keeps the current bank live
+                self.last_error = e
+                continue
+            self.reloads += 1
+            self.last_error = None
+            if self.on_reload is not None:
+                self.on_reload(diff)
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Question bank tools")
+    parser.add_argument("command", choices=["build", "check", "pack"])
+    parser.add_argument("output", nargs="?", help="Output path for `pack`")
+    args = parser.parse_args()
+    if args.command == "build":
+        print(f"✅ Wrote {build_artifact()} questions to {ARTIFACT_PATH}")
+    elif args.command == "pack":
+        if not args.output:
+            parser.error("pack requires an output path")
+        from bank_store import write_bank
+        from relevance import SIDECAR_SUFFIX, IdfTable
+        print(f"✅ Wrote {write_bank(QUESTION_INDEX, args.output)} questions to {args.output}")
+        IdfTable.build(QUESTION_INDEX).save(args.output + SIDECAR_SUFFIX)
+        print(f"✅ Wrote IDF sidecar {args.output + SIDECAR_SUFFIX}")
+    else:
+        fresh = load_artifact() is not None
+        print(f"{'✅' if fresh else '⚠️'} {ARTIFACT_PATH} is {'up to date' if fresh else 'missing or stale'}")
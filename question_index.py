@@ -0,0 +1,42 @@
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from models import Question, Difficulty
+
+
+class QuestionIndex:
+    """FEATURE: Pre-built lookup structure over the question bank.
+
+    Pools are keyed by (difficulty, skill) and built once, so selecting the
+    next question never rescans the full bank.
+    """
+
+    def __init__(self, questions: Iterable[Question]):
+        self.questions: Tuple[Question, ...] = tuple(questions)
+        self.by_id: Dict[str, Question] = {q.id: q for q in self.questions}
+
+        by_difficulty: Dict[Difficulty, List[Question]] = {d: [] for d in Difficulty}
+        by_key: Dict[Tuple[Difficulty, str], List[Question]] = {}
+        for q in self.questions:
+            by_difficulty[q.difficulty].append(q)
+            by_key.setdefault((q.difficulty, q.skill), []).append(q)
+
+        self._by_difficulty: Dict[Difficulty, Tuple[Question, ...]] = {
+            d: tuple(pool) for d, pool in by_difficulty.items()
+        }
+        self._by_key: Dict[Tuple[Difficulty, str], Tuple[Question, ...]] = {
+            key: tuple(pool) for key, pool in by_key.items()
+        }
+        self.skills: FrozenSet[str] = frozenset(q.skill for q in self.questions)
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self.questions)
+
+    def get(self, question_id: str) -> Optional[Question]:
+        return self.by_id.get(question_id)
+
+    def pool(self, difficulty: Difficulty, skill: Optional[str] = None) -> Tuple[Question, ...]:
+        if skill is None:
+            return self._by_difficulty.get(difficulty, ())
+        return self._by_key.get((difficulty, skill), ())
@@ -0,0 +1,226 @@
+"""TF-IDF relevance between an answer and its question's topic vocabulary.
+
+Each question has a topic document: its question text plus its expected
+keywords, which are counted KEYWORD_BOOST times, plus an optional reference
+answer. Document frequencies come from the whole bank. Both sides are weighted
+with sublinear tf, (1 + log tf) * idf. Answer terms the bank has never seen
+get the largest idf, so off-topic padding increases the answer's norm and
+lowers its cosine instead of being ignored.
+
+Per-question vectors are L2-normalized once and cached per question id. The
+IDF table is built once per bank index. It can also be precomputed into an
+<bank>.idf.json sidecar next to a mapped bank file, which saves decoding every
+record on startup.
+
+similarities() is the single kernel used by the engine (as a batch of one) and
+by scoring.score_batch. It sorts each answer's terms, so the summation order
+never depends on how the counts were built (a full analysis or the live
+scorer's incremental one). Per-row dot products and norms are accumulated
+with np.bincount, which adds in input order. A row's result is therefore
+bit-identical whether it is scored alone or inside a large batch.
+"""
+import hashlib
+import json
+import math
+import os
+import re
+import weakref
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Optional, Sequence, Set, Tuple
+from models import Question
+
+if TYPE_CHECKING:
+    import numpy as np
+
+TERM_RE = re.compile(r"[^\W_]+")
+KEYWORD_BOOST = 2
+STOP_WORDS = frozenset("""
+a an and are as at be but by can do does for from has have how i if in into is it its of on or so
+that the their then there these this to was we what when where which while who why will with you your
+""".split())
+SIDECAR_SUFFIX = ".idf.json"
+
+
+def term_counts(lowered: str) -> Counter:
+    """Counts of the non-stop-word terms in already-lowercased text."""
+    return Counter(t for t in TERM_RE.findall(lowered) if t not in STOP_WORDS)
+
+
+def topic_terms(question: Question, reference: Optional[str] = None) -> Counter:
+    counts = term_counts(question.question_text.lower())
+    for kw in question.expected_keywords:
+        for term, n in term_counts(kw.lower()).items():
+            counts[term] += n * KEYWORD_BOOST
+    if reference:
+        counts.update(term_counts(reference.lower()))
+    return counts
+
+
+class IdfTable:
+    """Smoothed inverse document frequencies, log((1 + N) / (1 + df)) + 1."""
+
+    def __init__(self, documents: int, df: Mapping[str, int], idf: Optional[Dict[str, float]] = None):
+        self.documents = documents
+        self.df = dict(df)
+        self.unseen = math.log(1 + documents) + 1
+        self._idf: Dict[str, float] = idf if idf is not None else {
+            term: self._smoothed(n) for term, n in self.df.items()
+        }
+
+    def _smoothed(self, n: int) -> float:
+        return math.log((1 + self.documents) / (1 + n)) + 1
+
+    def __getitem__(self, term: str) -> float:
+        return self._idf.get(term, self.unseen)
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of the document frequencies; changes whenever the bank's vocabulary does."""
+        fp = getattr(self, "_fingerprint", None)
+        if fp is None:
+            payload = json.dumps([self.documents, sorted(self.df.items())], separators=(",", ":"))
+            fp = self._fingerprint = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return fp
+
+    @classmethod
+    def build(cls, questions: Iterable[Question], references: Optional[Mapping[str, str]] = None) -> "IdfTable":
+        df: Counter = Counter()
+        documents = 0
+        for q in questions:
+            df.update(topic_terms(q, references.get(q.id) if references else None).keys())
+            documents += 1
+        return cls(documents, df)
+
+    def updated(
+        self, removed: Iterable[Question], added: Iterable[Question], references: Optional[Mapping[str, str]] = None
+    ) -> Tuple["IdfTable", Set[str]]:
+        """A copy with `removed` documents taken out and `added` counted in, plus the terms whose df changed.
+
+        Only the changed documents are tokenized. If the document count stays
+        the same (edits only), only those terms get a new idf. Otherwise the
+        smoothing shifts every idf and the table is recomputed.
+        """
+        df = dict(self.df)
+        documents = self.documents
+        touched: Set[str] = set()
+        for sign, questions in ((-1, removed), (1, added)):
+            for q in questions:
+                documents += sign
+                for term in topic_terms(q, references.get(q.id) if references else None):
+                    n = df.get(term, 0) + sign
+                    if n:
+                        df[term] = n
+                    else:
+                        del df[term]
+                    touched.add(term)
+        touched = {t for t in touched if df.get(t) != self.df.get(t)}
+        if documents != self.documents:
+            return IdfTable(documents, df), touched
+        table = IdfTable(documents, df, dict(self._idf))
+        for term in touched:
+            if term in df:
+                table._idf[term] = table._smoothed(df[term])
+            else:
+                del table._idf[term]
+        return table, touched
+
+    def save(self, path: str):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"documents": self.documents, "df": self.df}, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IdfTable":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["documents"], data["df"])
+
+
+class RelevanceModel:
+    """FEATURE: Cached per-question TF-IDF vectors and the batch similarity kernel."""
+
+    def __init__(self, idf: IdfTable, references: Optional[Mapping[str, str]] = None):
+        self.idf = idf
+        self.references = dict(references or {})
+        # Question id -> (source fields the vector was built from, term -> normalized weight)
+        self._vectors: Dict[str, Tuple[tuple, Dict[str, float]]] = {}
+
+    def vector(self, question: Question) -> Dict[str, float]:
+        source = (question.question_text, tuple(question.expected_keywords))
+        cached = self._vectors.get(question.id)
+        if cached is not None and cached[0] == source:
+            return cached[1]
+        idf = self.idf
+        weights = {
+            term: (1 + math.log(n)) * idf[term]
+            for term, n in topic_terms(question, self.references.get(question.id)).items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        vector = {term: w / norm for term, w in weights.items()} if norm else {}
+        self._vectors[question.id] = (source, vector)
+        return vector
+
+    def similarities(self, questions: Sequence[Question], counts: Sequence[Mapping[str, int]]) -> "np.ndarray":
+        """Cosine similarity of each answer's term counts to its question's topic vector."""
+        import numpy as np  # Deferred: the engine imports this module on every cold start
+
+        rows, tfs, idfs, topic = [], [], [], []
+        idf = self.idf
+        for i, (q, answer_counts) in enumerate(zip(questions, counts)):
+            vector = self.vector(q)
+            for term in sorted(answer_counts):
+                rows.append(i)
+                tfs.append(answer_counts[term])
+                idfs.append(idf[term])
+                topic.append(vector.get(term, 0.0))
+        n = len(questions)
+        if not rows:
+            return np.zeros(n)
+        rows = np.array(rows, dtype=np.intp)
+        weights = (1 + np.log(np.array(tfs, dtype=np.float64))) * np.array(idfs)
+        dot = np.bincount(rows, weights=weights * np.array(topic), minlength=n)
+        norm = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n))
+        return np.divide(dot, norm, out=np.zeros(n), where=norm > 0)
+
+    def similarity(self, question: Question, counts: Mapping[str, int]) -> float:
+        return float(self.similarities((question,), (counts,))[0])
+
+
+_MODELS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_model(index) -> RelevanceModel:
+    """The relevance model for a bank index, built on first use (or loaded from its IDF sidecar)."""
+    model = _MODELS.get(index)
+    if model is None:
+        path = getattr(index, "path", None)
+        sidecar = path + SIDECAR_SUFFIX if path else None
+        idf = IdfTable.load(sidecar) if sidecar and os.path.exists(sidecar) else None
+        if idf is None or idf.documents != len(index):
+            idf = IdfTable.build(index)
+        model = _MODELS[index] = RelevanceModel(idf)
+    return model
+
+
+def carry_over(old_index, new_index, removed: Sequence[Question], added: Sequence[Question]) -> Optional[RelevanceModel]:
+    """Derive `new_index`'s model from the old index's after a bank reload.
+
+    `removed` and `added` are the questions that left and entered the bank (an
+    edit is one of each). The IDF table is patched from them alone. A cached
+    vector is kept unless its question changed, the document count moved, or
+    one of its terms had its idf changed.
+    """
+    old = _MODELS.get(old_index)
+    if old is None:
+        return None
+    idf, touched = old.idf.updated(removed, added, old.references)
+    model = _MODELS[new_index] = RelevanceModel(idf, old.references)
+    if idf.documents == old.idf.documents:
+        gone = {q.id for q in removed}
+        # list(): serving threads may be adding vectors to the old model while a reload runs
+        model._vectors = {
+            qid: entry for qid, entry in list(old._vectors.items())
+            if qid not in gone and touched.isdisjoint(entry[1])
+        }
+    return model
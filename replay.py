@@ -0,0 +1,298 @@
+"""Bulk re-evaluation of archived interview transcripts.
+
+Streams a JSONL file of transcripts through InterviewEngine with the current
+scoring code and a (possibly changed) InterviewConfig, and writes one JSONL
+record per session with the re-scored InterviewResult and a diff against the
+archived outcome. Each input line is one session:
+
+    {"session_id": "...", "candidate": {...}, "job_description": {...},
+     "turns": [{"question_id": "py_01", "answer": "...", "time_taken": 12.5}, ...],
+     "outcome": {"status": "COMPLETED", "final_score": 71.2, "questions_asked": 5}}
+
+Questions are replayed in their archived order; only scoring, adaptive
+difficulty and termination are re-decided. A session that would now end early
+stops at that turn, and one whose transcript runs out before the new config
+would finish keeps its in-progress status.
+
+Input is read in fixed-size chunks with a bounded number of chunks in flight,
+so memory does not grow with the file. Finished chunks are appended in input
+order and a checkpoint (<output>.ckpt) records the input and output offsets, so
+an interrupted run resumes where it stopped:
+
+    python replay.py transcripts.jsonl rescored.jsonl --workers 4 --min-score 40
+
+Per-answer scores do not depend on the config, so sweeping configs over the
+same transcripts can share a score cache file (see score_cache.py):
+
+    python replay.py transcripts.jsonl rescored.jsonl --score-cache scores.db
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+from pydantic import BaseModel
+from models import CandidateProfile, JobDescription, InterviewConfig, InterviewStatus
+from engine import InterviewEngine
+import score_cache
+
+CHECKPOINT_VERSION = 1
+DEFAULT_CHUNK_SIZE = 200
+
+
+class ReplaySummary(BaseModel):
+    sessions: int = 0
+    changed: int = 0
+    status_changed: int = 0
+    skipped: int = 0
+    score_delta_sum: float = 0.0
+    transitions: Dict[str, int] = {}   # "old -> new" status -> count
+    wall_seconds: float = 0.0
+    resumed_from: int = 0              # Sessions already done when this run started
+
+    @property
+    def mean_score_delta(self) -> float:
+        replayed = self.sessions - self.skipped
+        return self.score_delta_sum / replayed if replayed else 0.0
+
+
+def engine_transcript(engine: InterviewEngine, session_id: str) -> dict:
+    """Transcript record for a live or finished engine, in the replay input format."""
+    records = engine.records
+    result = engine.generate_final_report()
+    return {
+        "session_id": session_id,
+        "candidate": engine.candidate.model_dump(mode="json"),
+        "job_description": engine.jd.model_dump(mode="json"),
+        "turns": [
+            {"question_id": records.questions[i].id, "answer": records.answers[i], "time_taken": records.time_taken(i)}
+            for i in range(len(records))
+        ],
+        "outcome": {
+            "status": result.status.value,
+            "final_score": result.final_score,
+            "questions_asked": len(records),
+            "termination_reason": result.termination_reason
+        }
+    }
+
+
+def replay_session(transcript: dict, config: InterviewConfig) -> dict:
+    """Re-run one transcript and diff the new outcome against the archived one."""
+    engine = InterviewEngine(
+        CandidateProfile(**transcript["candidate"]),
+        JobDescription(**transcript["job_description"]),
+        config
+    )
+    engine.start_interview()
+    for turn in transcript["turns"]:
+        if engine.state not in (InterviewStatus.IN_PROGRESS, InterviewStatus.ADAPTIVE_MODE):
+            break
+        question = engine.index.get(turn["question_id"])
+        if question is None:
+            raise KeyError(f"Unknown question id {turn['question_id']!r}")
+        engine.process_response(question, turn["answer"], float(turn["time_taken"]))
+
+    result = engine.generate_final_report()
+    old = transcript.get("outcome") or {}
+    old_status = old.get("status")
+    old_score = old.get("final_score")
+    diff = {
+        "status": [old_status, result.status.value],
+        "final_score": [old_score, result.final_score],
+        "score_delta": result.final_score - old_score if old_score is not None else None,
+        "questions_asked": [old.get("questions_asked"), len(engine.records)],
+    }
+    diff["changed"] = (
+        old_status != result.status.value
+        or old.get("questions_asked") != len(engine.records)
+        or old_score is None
+        or abs(diff["score_delta"]) > 1e-9
+    )
+    return {"session_id": transcript.get("session_id"), "result": result.model_dump(mode="json"), "diff": diff}
+
+
+def _replay_chunk(lines: List[bytes], config: dict) -> Tuple[List[str], dict]:
+    """Worker entry point: replay a chunk of raw JSONL lines."""
+    interview_config = InterviewConfig(**config)
+    out, stats = [], ReplaySummary()
+    for line in lines:
+        if not line.strip():
+            continue
+        stats.sessions += 1
+        transcript = None
+        try:
+            transcript = json.loads(line)
+            record = replay_session(transcript, interview_config)
+        except Exception as e:  # Recorded against this session; one bad transcript never aborts the run
+            stats.skipped += 1
+            session_id = transcript.get("session_id") if isinstance(transcript, dict) else None
+            out.append(json.dumps({"session_id": session_id, "error": str(e)}))
+            continue
+        diff = record["diff"]
+        stats.changed += diff["changed"]
+        if diff["status"][0] != diff["status"][1]:
+            stats.status_changed += 1
+            key = f"{diff['status'][0]} -> {diff['status'][1]}"
+            stats.transitions[key] = stats.transitions.get(key, 0) + 1
+        stats.score_delta_sum += diff["score_delta"] or 0.0
+        out.append(json.dumps(record))
+    if score_cache.ACTIVE is not None:
+        score_cache.ACTIVE.flush()
+    return out, stats.model_dump()
+
+
+def _merge(total: ReplaySummary, part: dict):
+    total.sessions += part["sessions"]
+    total.changed += part["changed"]
+    total.status_changed += part["status_changed"]
+    total.skipped += part["skipped"]
+    total.score_delta_sum += part["score_delta_sum"]
+    for key, n in part["transitions"].items():
+        total.transitions[key] = total.transitions.get(key, 0) + n
+
+
+def _chunks(f, chunk_size: int) -> Iterator[Tuple[List[bytes], int]]:
+    """Yield (lines, input offset after the chunk) from a binary file handle."""
+    lines = []
+    for line in iter(f.readline, b""):
+        lines.append(line)
+        if len(lines) >= chunk_size:
+            yield lines, f.tell()
+            lines = []
+    if lines:
+        yield lines, f.tell()
+
+
+def _config_digest(config: dict) -> str:
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _write_checkpoint(path: str, state: dict):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def replay_file(
+    input_path: str,
+    output_path: str,
+    config: Optional[InterviewConfig] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    score_cache_path: Optional[str] = None
+) -> ReplaySummary:
+    """FEATURE: Stream-replay a transcript file, checkpointing after every chunk.
+
+    With `score_cache_path`, every worker memoizes answer scores in that
+    SQLite file, so later replays of the same transcripts skip scoring.
+    """
+    config_dict = (config or InterviewConfig()).model_dump(mode="json")
+    digest = _config_digest(config_dict)
+    checkpoint_path = output_path + ".ckpt"
+    summary = ReplaySummary()
+    input_offset = output_offset = 0
+
+    if resume and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != CHECKPOINT_VERSION or state.get("config_sha256") != digest:
+            raise ValueError(f"{checkpoint_path} was written for a different config; remove it or pass resume=False.")
+        input_offset, output_offset = state["input_offset"], state["output_offset"]
+        summary = ReplaySummary(**state["summary"])
+        summary.resumed_from = summary.sessions
+    elif os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    workers = workers or os.cpu_count() or 1
+    max_inflight = workers * 2
+    t0 = time.perf_counter()
+    with open(input_path, "rb") as src, open(output_path, "a+b") as out:
+        # Drop any output written after the last checkpoint
+        out.truncate(output_offset)
+        out.seek(output_offset)
+        src.seek(input_offset)
+
+        def commit(lines: List[str], stats: dict, end_offset: int):
+            if lines:
+                out.write(("\n".join(lines) + "\n").encode("utf-8"))
+            out.flush()
+            os.fsync(out.fileno())
+            _merge(summary, stats)
+            _write_checkpoint(checkpoint_path, {
+                "version": CHECKPOINT_VERSION,
+                "config_sha256": digest,
+                "input_offset": end_offset,
+                "output_offset": out.tell(),
+                "summary": summary.model_dump()
+            })
+
+        if workers <= 1:
+            previous = score_cache.ACTIVE
+            if score_cache_path:
+                score_cache.ACTIVE = score_cache.ScoreCache(path=score_cache_path)
+            try:
+                for lines, end_offset in _chunks(src, chunk_size):
+                    commit(*_replay_chunk(lines, config_dict), end_offset)
+            finally:
+                if score_cache.ACTIVE is not previous:
+                    score_cache.ACTIVE.close()
+                    score_cache.ACTIVE = previous
+        else:
+            init = dict(initializer=score_cache.enable, initargs=(score_cache.DEFAULT_CAPACITY, score_cache_path)) if score_cache_path else {}
+            with ProcessPoolExecutor(max_workers=workers, **init) as pool:
+                pending = deque()
+                for lines, end_offset in _chunks(src, chunk_size):
+                    pending.append((pool.submit(_replay_chunk, lines, config_dict), end_offset))
+                    if len(pending) >= max_inflight:
+                        future, offset = pending.popleft()
+                        commit(*future.result(), offset)
+                while pending:
+                    future, offset = pending.popleft()
+                    commit(*future.result(), offset)
+
+    summary.wall_seconds = time.perf_counter() - t0
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    defaults = InterviewConfig()
+    parser = argparse.ArgumentParser(description="Replay archived transcripts through the current engine")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--no-resume", action="store_true", help="Ignore an existing checkpoint and start over")
+    parser.add_argument("--score-cache", metavar="PATH", help="SQLite file memoizing answer scores across runs")
+    parser.add_argument("--max-questions", type=int, default=defaults.max_questions)
+    parser.add_argument("--termination-count", type=int, default=defaults.early_termination_threshold_count)
+    parser.add_argument("--min-score", type=float, default=defaults.min_score_threshold)
+    parser.add_argument("--ramp-rate", type=float, default=defaults.ramp_rate)
+    args = parser.parse_args(argv)
+
+    config = InterviewConfig(
+        max_questions=args.max_questions,
+        early_termination_threshold_count=args.termination_count,
+        min_score_threshold=args.min_score,
+        ramp_rate=args.ramp_rate
+    )
+    summary = replay_file(
+        args.input, args.output, config,
+        workers=args.workers, chunk_size=args.chunk_size, resume=not args.no_resume,
+        score_cache_path=args.score_cache
+    )
+    print(f"🔁 Replayed {summary.sessions} sessions in {summary.wall_seconds:.2f}s"
+          f"{f' (resumed after {summary.resumed_from})' if summary.resumed_from else ''}")
+    print(f"📊 Changed {summary.changed}, status changed {summary.status_changed}, "
+          f"skipped {summary.skipped}, mean score delta {summary.mean_score_delta:+.2f}")
+    for transition, n in sorted(summary.transitions.items()):
+        print(f"   {transition}: {n}")
+
+
+if __name__ == "__main__":
+    main()
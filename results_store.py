@@ -0,0 +1,374 @@
+"""Columnar, append-only store for cohorts of interview results.
+
+Two tables of NumPy columns:
+
+    sessions  one row per InterviewResult: recorded_at, final_score, confidence,
+              status, termination reason, readiness category, first answer row
+    answers   one row per QuestionResult: session row, question, skill,
+              difficulty, state, timeout flag, time_taken and the six scores
+
+Strings (question ids, skills, termination reasons, readiness categories) are
+dictionary-encoded as int32 codes. Termination reasons are stored with their
+numbers masked ("Average score (#%) dropped below ..."), so each rule maps to a
+single code rather than one code per observed average. Status and difficulty use the fixed code
+tables from history.py. Appends go to array.array staging buffers, and those
+are concatenated onto the NumPy columns the next time a query or save needs
+them. Ingesting a session therefore never copies the whole table.
+
+Aggregates run over the codes with bincount. Quantiles partition each group
+when there are only a few groups, and use one lexsort when there are many. No
+pandas or pydantic objects are involved, so group-by and filter queries over a
+million answers take milliseconds. save()/load() write an .npz
+archive that holds the columns plus a JSON header with the dictionaries.
+"""
+import json
+import re
+import time
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+import numpy as np
+from models import InterviewResult, InterviewStatus, Difficulty
+from history import STATUS_CODES, DIFFICULTY_CODES
+
+FORMAT_VERSION = 1
+NO_REASON = -1
+UNKNOWN = -2   # Lookup result for a string never stored; matches no row, not even NO_REASON
+FEW_GROUPS = 8   # Up to this many groups, quantiles are computed per group instead of by one sort
+
+# Column name -> array typecode (staging) / NumPy dtype
+SESSION_COLUMNS: Dict[str, str] = {
+    "recorded_at": "d", "final_score": "d", "confidence": "d",
+    "status": "B", "reason": "i", "readiness": "i", "first_answer": "q",
+}
+ANSWER_COLUMNS: Dict[str, str] = {
+    "session": "i", "question": "i", "skill": "i", "difficulty": "B", "state": "B", "timeout": "B",
+    "time_taken": "d", "accuracy": "d", "relevance": "d", "clarity": "d",
+    "time_efficiency": "d", "overall": "d", "bonus": "d",
+}
+SCORE_FIELDS = ("accuracy", "relevance", "clarity", "time_efficiency", "overall", "bonus")
+
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+_STATUS_INDEX = {s: i for i, s in enumerate(STATUS_CODES)}
+_DIFFICULTY_INDEX = {d: i for i, d in enumerate(DIFFICULTY_CODES)}
+
+Filter = Union[None, str, Sequence[str]]
+
+
+class GroupStats(NamedTuple):
+    count: int
+    mean: float
+    std: float
+
+
+class Dictionary:
+    """String <-> dense int32 code mapping; codes are assigned in first-seen order."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for value in values:
+            self.encode(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int:
+        """Code of `value`, or UNKNOWN if it has never been stored."""
+        return self._codes.get(value, UNKNOWN)
+
+
+class _Table:
+    """Columns in capacity-doubling NumPy buffers fed from array.array staging buffers."""
+
+    __slots__ = ("_buffers", "_staged", "_length")
+
+    def __init__(self, schema: Dict[str, str]):
+        self._buffers: Dict[str, np.ndarray] = {
+            name: np.empty(0, dtype=np.dtype(code)) for name, code in schema.items()
+        }
+        self._staged: Dict[str, array] = {name: array(code) for name, code in schema.items()}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length + len(next(iter(self._staged.values())))
+
+    def flush(self):
+        staged = self._staged
+        pending = len(next(iter(staged.values())))
+        if not pending:
+            return
+        start, end = self._length, self._length + pending
+        for name, buf in staged.items():
+            column = self._buffers[name]
+            if end > len(column):
+                grown = np.empty(max(end, 2 * len(column), 1024), dtype=column.dtype)
+                grown[:start] = column[:start]
+                self._buffers[name] = column = grown
+            column[start:end] = np.frombuffer(buf, dtype=column.dtype)
+            staged[name] = array(buf.typecode)
+        self._length = end
+
+    def column(self, name: str) -> np.ndarray:
+        """The first len(self) values of a column (a view; later appends are not reflected)."""
+        self.flush()
+        return self._buffers[name][:self._length]
+
+    def load(self, name: str, values: np.ndarray):
+        self._buffers[name] = values
+        self._length = len(values)
+
+
+class ResultsStore:
+    """FEATURE: Columnar cohort analytics over interview results."""
+
+    def __init__(self):
+        self.sessions = _Table(SESSION_COLUMNS)
+        self.answers = _Table(ANSWER_COLUMNS)
+        self.questions = Dictionary()
+        self.skills = Dictionary()
+        self.reasons = Dictionary()
+        self.readiness = Dictionary()
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    @property
+    def n_answers(self) -> int:
+        return len(self.answers)
+
+    # --- Ingestion ---
+
+    def append(self, result: InterviewResult, recorded_at: Optional[float] = None):
+        """Append one finished (or abandoned) interview."""
+        a = self.answers._staged
+        session = len(self.sessions)
+        first = len(self.answers)
+        for item in result.timeline:
+            question, score = item.question, item.score
+            a["session"].append(session)
+            a["question"].append(self.questions.encode(question.id))
+            a["skill"].append(self.skills.encode(question.skill))
+            a["difficulty"].append(_DIFFICULTY_INDEX[item.difficulty_at_time])
+            a["state"].append(_STATUS_INDEX[item.state_at_time])
+            a["timeout"].append(1 if item.response.is_timeout else 0)
+            a["time_taken"].append(item.response.time_taken)
+            for field in SCORE_FIELDS:
+                a[field].append(getattr(score, field))
+        self._append_session(result, first, recorded_at)
+
+    def append_engine(self, engine, recorded_at: Optional[float] = None):
+        """Append an engine's session straight from its array history (no timeline materialization)."""
+        records = engine.records
+        a = self.answers._staged
+        session = len(self.sessions)
+        first = len(self.answers)
+        for i in range(len(records)):
+            question = records.questions[i]
+            a["session"].append(session)
+            a["question"].append(self.questions.encode(question.id))
+            a["skill"].append(self.skills.encode(question.skill))
+            a["difficulty"].append(_DIFFICULTY_INDEX[records.difficulty(i)])
+            a["state"].append(_STATUS_INDEX[records.state(i)])
+            a["timeout"].append(1 if records.is_timeout(i) else 0)
+            a["time_taken"].append(records.time_taken(i))
+            for field, value in zip(SCORE_FIELDS, records.scores(i)):
+                a[field].append(value)
+        self._append_session(engine.generate_final_report(), first, recorded_at)
+
+    def _append_session(self, result: InterviewResult, first: int, recorded_at: Optional[float]):
+        s = self.sessions._staged
+        s["recorded_at"].append(time.time() if recorded_at is None else recorded_at)
+        s["final_score"].append(result.final_score)
+        s["confidence"].append(result.confidence_score)
+        s["status"].append(_STATUS_INDEX[result.status])
+        reason = result.termination_reason
+        s["reason"].append(NO_REASON if reason is None else self.reasons.encode(reason_key(reason)))
+        s["readiness"].append(self.readiness.encode(result.readiness_category))
+        s["first_answer"].append(first)
+
+    # --- Filters ---
+
+    def session_mask(
+        self, status: Filter = None, reason: Filter = None, readiness: Filter = None,
+        since: Optional[float] = None, until: Optional[float] = None
+    ) -> np.ndarray:
+        """Boolean mask over sessions. Each filter takes one value or a list of values."""
+        mask = np.ones(len(self.sessions), dtype=bool)
+        if status is not None:
+            mask &= _isin(self.sessions.column("status"), [_STATUS_INDEX[InterviewStatus(v)] for v in _listed(status)])
+        if reason is not None:
+            mask &= _isin(self.sessions.column("reason"), [self.reasons.lookup(reason_key(v)) for v in _listed(reason)])
+        if readiness is not None:
+            mask &= _isin(self.sessions.column("readiness"), [self.readiness.lookup(v) for v in _listed(readiness)])
+        if since is not None:
+            mask &= self.sessions.column("recorded_at") >= since
+        if until is not None:
+            mask &= self.sessions.column("recorded_at") < until
+        return mask
+
+    def answer_mask(
+        self, skill: Filter = None, question: Filter = None, difficulty: Filter = None,
+        timeout: Optional[bool] = None, sessions: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Boolean mask over answers; `sessions` is a session_mask() to restrict to."""
+        mask = np.ones(len(self.answers), dtype=bool)
+        if skill is not None:
+            mask &= _isin(self.answers.column("skill"), [self.skills.lookup(v) for v in _listed(skill)])
+        if question is not None:
+            mask &= _isin(self.answers.column("question"), [self.questions.lookup(v) for v in _listed(question)])
+        if difficulty is not None:
+            mask &= _isin(self.answers.column("difficulty"), [_DIFFICULTY_INDEX[Difficulty(v)] for v in _listed(difficulty)])
+        if timeout is not None:
+            mask &= self.answers.column("timeout") == (1 if timeout else 0)
+        if sessions is not None:
+            mask &= sessions[self.answers.column("session")]
+        return mask
+
+    # --- Aggregates ---
+
+    def _answer_keys(self, by: str) -> Tuple[np.ndarray, List[str]]:
+        if by == "skill":
+            return self.answers.column("skill"), self.skills.values
+        if by == "question":
+            return self.answers.column("question"), self.questions.values
+        if by == "difficulty":
+            return self.answers.column("difficulty"), [d.value for d in DIFFICULTY_CODES]
+        if by == "state":
+            return self.answers.column("state"), [s.value for s in STATUS_CODES]
+        if by == "status":
+            return self.sessions.column("status")[self.answers.column("session")], [s.value for s in STATUS_CODES]
+        raise ValueError(f"Unknown answer grouping {by!r}; expected skill, question, difficulty, state or status.")
+
+    def group_stats(self, by: str, value: str = "overall", mask: Optional[np.ndarray] = None) -> Dict[str, GroupStats]:
+        """Count, mean and standard deviation of an answer column per group."""
+        keys, labels = self._answer_keys(by)
+        values = self.answers.column(value)
+        if mask is not None:
+            keys, values = keys[mask], values[mask]
+        size = len(labels)
+        counts = np.bincount(keys, minlength=size)
+        sums = np.bincount(keys, weights=values, minlength=size)
+        squares = np.bincount(keys, weights=values * values, minlength=size)
+        out: Dict[str, GroupStats] = {}
+        for code in np.flatnonzero(counts):
+            n = int(counts[code])
+            mean = sums[code] / n
+            out[labels[code]] = GroupStats(n, float(mean), float(np.sqrt(max(0.0, squares[code] / n - mean * mean))))
+        return out
+
+    def skill_averages(self, mask: Optional[np.ndarray] = None) -> Dict[str, float]:
+        return {skill: s.mean for skill, s in self.group_stats("skill", "overall", mask).items()}
+
+    def group_quantiles(
+        self, by: str, value: str = "time_taken", quantiles: Sequence[float] = (0.5, 0.9),
+        mask: Optional[np.ndarray] = None
+    ) -> Dict[str, List[float]]:
+        """Per-group quantiles with linear interpolation, matching np.quantile."""
+        keys, labels = self._answer_keys(by)
+        values = self.answers.column(value)
+        if mask is not None:
+            keys, values = keys[mask], values[mask]
+        counts = np.bincount(keys, minlength=len(labels))
+        present = np.flatnonzero(counts)
+        if len(present) <= FEW_GROUPS:
+            # A handful of groups (difficulty, state): one O(n) partition-based quantile per group
+            return {labels[code]: np.quantile(values[keys == code], quantiles).tolist() for code in present}
+        # Many groups (question, skill): a single lexsort, then index each group's sorted run
+        ordered = values[np.lexsort((values, keys))]
+        starts = (np.cumsum(counts) - counts)[present]
+        last = starts + counts[present] - 1
+        columns = []
+        for q in quantiles:
+            pos = starts + q * (counts[present] - 1)
+            lo = np.floor(pos).astype(np.int64)
+            hi = np.minimum(lo + 1, last)
+            columns.append(ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo))
+        return {labels[code]: [float(c[i]) for c in columns] for i, code in enumerate(present)}
+
+    def time_by_difficulty(self, mask: Optional[np.ndarray] = None) -> Dict[str, Dict[str, float]]:
+        stats = self.group_stats("difficulty", "time_taken", mask)
+        quantiles = self.group_quantiles("difficulty", "time_taken", (0.5, 0.9), mask)
+        return {
+            d: {"count": s.count, "mean": s.mean, "p50": quantiles[d][0], "p90": quantiles[d][1]}
+            for d, s in stats.items()
+        }
+
+    def score_histograms(
+        self, by: str = "question", value: str = "overall", bins: int = 10,
+        lo: float = 0.0, hi: float = 100.0, mask: Optional[np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
+        """Per-group histogram of an answer column over `bins` equal-width bins of [lo, hi]."""
+        keys, labels = self._answer_keys(by)
+        values = self.answers.column(value)
+        if mask is not None:
+            keys, values = keys[mask], values[mask]
+        bucket = np.clip(((values - lo) * (bins / (hi - lo))).astype(np.int64), 0, bins - 1)
+        grid = np.bincount(keys.astype(np.int64) * bins + bucket, minlength=len(labels) * bins).reshape(len(labels), bins)
+        return {labels[code]: grid[code] for code in np.flatnonzero(grid.sum(axis=1))}
+
+    def termination_rates(self, mask: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """Share of sessions per termination reason ("none" for sessions without one)."""
+        reasons = self.sessions.column("reason")
+        if mask is not None:
+            reasons = reasons[mask]
+        if not len(reasons):
+            return {}
+        counts = np.bincount(reasons + 1, minlength=len(self.reasons) + 1)
+        labels = ["none"] + self.reasons.values
+        return {labels[i]: float(counts[i] / len(reasons)) for i in np.flatnonzero(counts)}
+
+    # --- Persistence ---
+
+    def save(self, path: str, compress: bool = True):
+        """Write every column plus a JSON header (version, dictionaries) to an .npz archive at `path`."""
+        header = {
+            "version": FORMAT_VERSION,
+            "questions": self.questions.values, "skills": self.skills.values,
+            "reasons": self.reasons.values, "readiness": self.readiness.values,
+        }
+        arrays = {f"sessions.{k}": self.sessions.column(k) for k in SESSION_COLUMNS}
+        arrays.update({f"answers.{k}": self.answers.column(k) for k in ANSWER_COLUMNS})
+        arrays["header"] = np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8)
+        with open(path, "wb") as f:
+            (np.savez_compressed if compress else np.savez)(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "ResultsStore":
+        store = cls()
+        with np.load(path) as data:
+            header = json.loads(data["header"].tobytes())
+            if header.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported results store version {header.get('version')!r} in {path}.")
+            for table, schema, prefix in ((store.sessions, SESSION_COLUMNS, "sessions."), (store.answers, ANSWER_COLUMNS, "answers.")):
+                for name, code in schema.items():
+                    table.load(name, data[prefix + name].astype(np.dtype(code), copy=False))
+        store.questions = Dictionary(header["questions"])
+        store.skills = Dictionary(header["skills"])
+        store.reasons = Dictionary(header["reasons"])
+        store.readiness = Dictionary(header["readiness"])
+        return store
+
+
+def reason_key(reason: str) -> str:
+    """Termination reason with its numbers masked, as stored and as accepted by reason filters."""
+    return _NUMBER_RE.sub("#", reason)
+
+
+def _listed(value) -> List:
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _isin(column: np.ndarray, codes: List[int]) -> np.ndarray:
+    if len(codes) == 1:
+        return column == codes[0]
+    return np.isin(column, codes)
@@ -0,0 +1,234 @@
+"""Weighted question selection with alias tables.
+
+A draw picks a skill first and then a question within that skill's
+(difficulty, skill) pool:
+
+* Skill weights are per session and are recomputed on every draw. They combine
+  JD priority (earlier required skills weigh more), resume overlap, and
+  coverage (skills already asked about weigh less). They are then scaled by the
+  pool's total question weight, so the two-step draw matches a direct draw over
+  all questions. A JD lists a handful of skills, so this step costs O(#JD
+  skills).
+* Question weights are freshness, 1 / (1 + exposures), from exposure counts
+  supplied via QuestionSampler.set_exposures() (e.g. refreshed from the
+  archive). Each pool keeps a Vose alias table over them, so drawing a
+  question is O(1) however large the pool is.
+
+Asked questions are excluded by rejection: a handful of O(1) probes, then an
+exact weighted scan of the unasked remainder. That fallback only runs once the
+eligible pools are nearly exhausted.
+
+Draws use the engine's SessionRandom, whose whole state is a single 64-bit
+integer. A session is therefore reproducible from its seed and survives a
+snapshot round trip exactly.
+"""
+import hashlib
+import os
+import random
+import weakref
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from models import Question, Difficulty
+
+JD_PRIORITY_WEIGHT = 1.0      # Extra weight for the first required skill, tapering to 0 for the last
+OVERLAP_WEIGHT = 2.0          # Multiplier for JD skills that also appear on the resume
+COVERAGE_DECAY = 1.0          # Skill weight is divided by (1 + COVERAGE_DECAY * answers in that skill)
+MAX_REJECTION_DRAWS = 8
+
+_MASK64 = (1 << 64) - 1
+
+
+class SessionRandom(random.Random):
+    """random.Random driven by SplitMix64, so the full state fits in one integer."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._state = 0
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        elif not isinstance(a, int):
+            # A digest, not hash(): str/bytes hashing is randomized per process (PYTHONHASHSEED)
+            data = a if isinstance(a, (bytes, bytearray)) else str(a).encode("utf-8")
+            a = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+        self._state = a & _MASK64
+
+    def _next64(self) -> int:
+        self._state = z = (self._state + 0x9E3779B97F4A7C15) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / 9007199254740992.0)
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 64:
+            return self._next64() >> (64 - k)
+        bits, result = 0, 0
+        while bits < k:
+            result |= self._next64() << bits
+            bits += 64
+        return result & ((1 << k) - 1)
+
+    def getstate(self) -> int:
+        return self._state
+
+    def setstate(self, state: int):
+        self._state = state & _MASK64
+
+
+class AliasTable:
+    """Vose's alias method: O(n) build, O(1) weighted draws."""
+
+    __slots__ = ("prob", "alias", "total")
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        self.total = float(sum(weights))
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        if n == 0 or self.total <= 0:
+            return
+        scaled = [w * n / self.total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to rounding error and keep prob 1.0
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def draw(self, rng) -> int:
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class _PoolTable:
+    __slots__ = ("pool", "ids", "weights", "table")
+
+    def __init__(self, pool: Sequence[Question], exposures: Dict[str, int]):
+        self.pool = pool
+        id_at = getattr(pool, "id_at", None) or (lambda i: pool[i].id)
+        self.ids: Tuple[str, ...] = tuple(id_at(i) for i in range(len(pool)))
+        self.weights = [1.0 / (1 + exposures.get(qid, 0)) for qid in self.ids]
+        self.table = AliasTable(self.weights)
+
+
+class QuestionSampler:
+    """FEATURE: Per-index alias tables for weighted, constant-time question draws."""
+
+    def __init__(self, index, exposures: Optional[Dict[str, int]] = None):
+        # Weak: the sampler is the index's value in _SAMPLERS, so a strong reference would keep its own key alive
+        self._index = weakref.ref(index)
+        self.exposures: Dict[str, int] = dict(exposures or {})
+        self._tables: Dict[Tuple[Difficulty, str], _PoolTable] = {}
+
+    @property
+    def index(self):
+        return self._index()
+
+    def set_exposures(self, exposures: Dict[str, int]):
+        """Replace exposure counts; alias tables are rebuilt lazily on next use."""
+        self.exposures = dict(exposures)
+        self._tables.clear()
+
+    def table(self, difficulty: Difficulty, skill: str) -> _PoolTable:
+        key = (difficulty, skill)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = _PoolTable(self.index.pool(difficulty, skill), self.exposures)
+        return table
+
+    def draw(
+        self, difficulty: Difficulty, skill_weights: Dict[str, float], asked_ids: Set[str], rng
+    ) -> Optional[Question]:
+        """Weighted draw of an unasked question from the skills in `skill_weights`."""
+        tables, weights, total = [], [], 0.0
+        for skill, weight in skill_weights.items():
+            table = self.table(difficulty, skill)
+            mass = weight * table.table.total
+            if mass > 0:
+                tables.append(table)
+                weights.append(mass)
+                total += mass
+        if not tables:
+            return None
+
+        for _ in range(MAX_REJECTION_DRAWS):
+            table = tables[_pick(weights, total, rng)]
+            i = table.table.draw(rng)
+            if table.ids[i] not in asked_ids:
+                return table.pool[i]
+
+        # Nearly exhausted: weighted draw over exactly the unasked questions
+        candidates: List[Tuple[_PoolTable, int]] = []
+        candidate_weights: List[float] = []
+        for table, mass in zip(tables, weights):
+            scale = mass / table.table.total
+            for i, qid in enumerate(table.ids):
+                if qid not in asked_ids:
+                    candidates.append((table, i))
+                    candidate_weights.append(scale * table.weights[i])
+        if not candidates:
+            return None
+        table, i = candidates[_pick(candidate_weights, sum(candidate_weights), rng)]
+        return table.pool[i]
+
+
+def _pick(weights: Sequence[float], total: float, rng) -> int:
+    """Linear weighted pick; only used over a short list of skills or the exhausted remainder."""
+    r = rng.random() * total
+    for i, w in enumerate(weights):
+        r -= w
+        if r < 0:
+            return i
+    return len(weights) - 1
+
+
+def session_skill_weights(required_skills: Sequence[str], resume_skills: Sequence[str]) -> Dict[str, float]:
+    """Static per-session skill weights: JD priority by position, boosted by resume overlap."""
+    resume = set(resume_skills)
+    n = len(required_skills)
+    weights: Dict[str, float] = {}
+    for pos, skill in enumerate(dict.fromkeys(required_skills)):
+        weight = 1.0 + JD_PRIORITY_WEIGHT * (n - 1 - pos) / max(1, n - 1)
+        if skill in resume:
+            weight *= OVERLAP_WEIGHT
+        weights[skill] = weight
+    return weights
+
+
+_SAMPLERS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_sampler(index) -> QuestionSampler:
+    """The shared sampler for a bank index (one set of alias tables per index)."""
+    sampler = _SAMPLERS.get(index)
+    if sampler is None:
+        sampler = _SAMPLERS[index] = QuestionSampler(index)
+    return sampler
+
+
+def carry_over(old_index, new_index) -> Optional[QuestionSampler]:
+    """Seed `new_index`'s sampler from the old one after a bank reload.
+
+    Exposures carry over, and so does every alias table whose pool holds the
+    very same question objects (a reload reuses unchanged ones), so only
+    pools with an added, removed or edited question are rebuilt.
+    """
+    old = _SAMPLERS.get(old_index)
+    if old is None:
+        return None
+    sampler = _SAMPLERS[new_index] = QuestionSampler(new_index, old.exposures)
+    # list(): serving threads may be adding tables to the old sampler while a reload runs
+    for (difficulty, skill), table in list(old._tables.items()):
+        pool = new_index.pool(difficulty, skill)
+        if len(pool) == len(table.pool) and all(a is b for a, b in zip(pool, table.pool)):
+            sampler._tables[(difficulty, skill)] = table
+    return sampler
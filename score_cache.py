@@ -0,0 +1,242 @@
+"""Content-addressed memoization of per-answer scores and feedback.
+
+Scoring is deterministic, so a replayed, retried or re-submitted answer can
+reuse its earlier (Scores, feedback) instead of re-analyzing the text. A key
+digests everything the result depends on:
+
+* the scoring version: SCORING_REVISION plus every scoring constant, the
+  filler and stop-word tables and the feedback templates;
+* the bank version: the relevance IDF fingerprint, since topic similarity
+  depends on the whole bank;
+* the question id and the question fields scoring reads (text, expected
+  keywords, time limit);
+* the lowercased answer, because every score is a function of it;
+* a time key. Up to GUESS_TIME, and from there up to FAST_FRACTION of the
+  limit, the time score is flat, so the times in each range share a band. Elsewhere it changes
+  continuously with the time taken, so the exact value is used. Only the
+  bonus-window flag is kept on top. A cached result therefore always equals
+  a fresh computation.
+
+Editing a question, reloading the bank or changing a weight changes the key,
+so stale entries are simply never hit again. The in-memory tier is a bounded
+LRU. The optional SQLite tier is shared across processes and restarts and
+drops its rows on open when the scoring version differs. New rows are
+written behind in batches of FLUSH_ROWS, one transaction each. Call flush()
+or close() to persist the rest. The disk tier never fails a submission. If
+another writer holds the database past BUSY_TIMEOUT, or a read or write
+fails, the batch is rolled back and counted in `disk_errors`, and scoring
+carries on from memory.
+
+The cache is off by default: ACTIVE is None and the engine scores every answer.
+"""
+import hashlib
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from models import Question
+from history import Scores
+import history
+import relevance
+import scoring
+import text_analysis
+from relevance import get_model
+from scoring import BONUS_TIME_FRACTION, FAST_FRACTION, GUESS_TIME
+
+DEFAULT_CAPACITY = 50_000
+FLUSH_ROWS = 512
+BUSY_TIMEOUT = 5.0   # Seconds to wait for another process's write transaction
+Entry = Tuple[Scores, str]   # (scores, feedback)
+_SCORES = struct.Struct("<6d")
+
+
+def _scoring_version() -> str:
+    parts = [
+        {k: v for k, v in vars(scoring).items() if k.isupper() and isinstance(v, (int, float))},
+        sorted(text_analysis.FILLER_WORDS), text_analysis.FILLER_PHRASES, text_analysis.PUNCTUATION,
+        sorted(relevance.STOP_WORDS), relevance.KEYWORD_BOOST, relevance.TERM_RE.pattern,
+        {k: v for k, v in vars(history).items() if k.startswith("FEEDBACK_")},
+    ]
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+SCORING_VERSION = _scoring_version()
+
+
+def time_key(question: Question, time_taken: float) -> str:
+    """Times with identical time efficiency and bonus eligibility share a key (see the engine)."""
+    if time_taken <= GUESS_TIME:
+        band = "guess"
+    elif time_taken <= question.time_limit * FAST_FRACTION:
+        band = "fast"
+    else:
+        band = float(time_taken).hex()
+    return f"{band}:{int(time_taken < question.time_limit * BONUS_TIME_FRACTION)}"
+
+
+class ScoreCache:
+    """FEATURE: Bounded LRU of scoring results with an optional SQLite tier."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, path: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        self._entries: "OrderedDict[bytes, Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = self._open(path) if path else None
+        self._pending: Dict[bytes, bytes] = {}   # Rows not yet written to the disk tier
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_errors = 0
+        self.last_error: Optional[Exception] = None
+
+    @staticmethod
+    def _open(path: str):
+        import sqlite3  # Deferred: only the disk tier needs it
+        db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=BUSY_TIMEOUT)
+        # WAL lets replay workers in other processes read while one of them writes
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        db.execute("CREATE TABLE IF NOT EXISTS scores (key BLOB PRIMARY KEY, value BLOB) WITHOUT ROWID")
+        row = db.execute("SELECT value FROM meta WHERE name = 'scoring_version'").fetchone()
+        if row is None or row[0] != SCORING_VERSION:
+            db.execute("DELETE FROM scores")
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('scoring_version', ?)", (SCORING_VERSION,))
+        return db
+
+    def key(self, index, question: Question, answer: str, time_taken: float) -> bytes:
+        h = hashlib.blake2b(digest_size=20)
+        for part in (
+            SCORING_VERSION, get_model(index).idf.fingerprint,
+            question.id, question.question_text, repr(question.expected_keywords), repr(question.time_limit),
+            time_key(question, time_taken),
+        ):
+            h.update(part.encode())
+            h.update(b"\0")
+        h.update(answer.lower().encode("utf-8", "surrogatepass"))
+        return h.digest()
+
+    def get(self, key: bytes) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if self._db is not None:
+                blob = self._pending.get(key)
+                if blob is None:
+                    blob = self._read(key)
+                if blob is not None:
+                    entry = _decode(blob)
+                    self._insert(key, entry)
+                    self.disk_hits += 1
+                    return entry
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, scores: Scores, feedback: str):
+        with self._lock:
+            self._insert(key, (scores, feedback))
+            if self._db is not None:
+                self._pending[key] = _encode(scores, feedback)
+                if len(self._pending) >= FLUSH_ROWS:
+                    self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _read(self, key: bytes) -> Optional[bytes]:
+        import sqlite3
+        try:
+            row = self._db.execute("SELECT value FROM scores WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            self._disk_error(e)
+            return None
+        return row[0] if row is not None else None
+
+    def _flush(self):
+        import sqlite3
+        if self._db is None or not self._pending:
+            return
+        try:
+            self._db.execute("BEGIN")
+            self._db.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?)", self._pending.items())
+            self._db.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._db.in_transaction:
+                self._db.execute("ROLLBACK")
+            self._disk_error(e)
+        # Written or not, the rows stay in the memory tier; never retry an unbounded backlog
+        self._pending.clear()
+
+    def _disk_error(self, error: Exception):
+        self.disk_errors += 1
+        self.last_error = error
+
+    def _insert(self, key: bytes, entry: Entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM scores")
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._flush()
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_errors": self.disk_errors,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+def _encode(scores: Scores, feedback: str) -> bytes:
+    return _SCORES.pack(*scores) + feedback.encode()
+
+
+def _decode(blob: bytes) -> Entry:
+    # Feedback strings are few and repeat across answers; intern so loaded entries share them
+    return Scores(*_SCORES.unpack_from(blob)), sys.intern(blob[_SCORES.size:].decode())
+
+
+ACTIVE: Optional[ScoreCache] = None
+
+
+def enable(capacity: int = DEFAULT_CAPACITY, path: Optional[str] = None) -> ScoreCache:
+    global ACTIVE
+    if ACTIVE is not None:
+        ACTIVE.close()
+    ACTIVE = ScoreCache(capacity, path)
+    return ACTIVE
+
+
+def disable():
+    global ACTIVE
+    if ACTIVE is not None:
+        ACTIVE.close()
+    ACTIVE = None
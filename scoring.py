@@ -0,0 +1,113 @@
+from typing import TYPE_CHECKING, List, NamedTuple, Sequence
+from models import Question, ScoreBreakdown
+from text_analysis import FILLER_WORDS, FILLER_PHRASES, analyze  # Filler tables re-exported with the other knobs
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Bump whenever a scoring or feedback formula changes; cached scores (score_cache.py) are keyed on it
+SCORING_REVISION = 1
+
+# Scoring weights shared by the scalar engine path and the batch path
+ACCURACY_WEIGHT = 0.4
+RELEVANCE_WEIGHT = 0.2
+CLARITY_WEIGHT = 0.2
+TIME_WEIGHT = 0.2
+
+NO_KEYWORD_ACCURACY = 80      # Accuracy granted when a question has no expected keywords
+RELEVANCE_TARGET_WORDS = 20   # Word count that earns full relevance depth
+SIMILARITY_TARGET = 0.5       # Topic similarity (see relevance.py) that earns full relevance
+FILLER_PENALTY = 10           # Clarity points lost per filler word or phrase
+GUESS_TIME = 5                # Answers at or under this many seconds are treated as guesses
+GUESS_EFFICIENCY = 10
+FAST_FRACTION = 0.4           # Full time efficiency up to this fraction of the limit
+SPEED_BONUS = 5.0
+BONUS_ACCURACY = 80
+BONUS_TIME_FRACTION = 0.5
+OVERTIME_BASE = 50
+OVERTIME_PENALTY = 2          # Points lost per second beyond the limit
+
+
+class BatchScores(NamedTuple):
+    """Column-wise score arrays, one entry per scored answer."""
+    accuracy: "np.ndarray"
+    relevance: "np.ndarray"
+    clarity: "np.ndarray"
+    time_efficiency: "np.ndarray"
+    overall: "np.ndarray"
+    bonus: "np.ndarray"
+
+    def breakdown(self, i: int) -> ScoreBreakdown:
+        return ScoreBreakdown(
+            accuracy=float(self.accuracy[i]),
+            relevance=float(self.relevance[i]),
+            clarity=float(self.clarity[i]),
+            time_efficiency=float(self.time_efficiency[i]),
+            overall=float(self.overall[i]),
+            bonus=float(self.bonus[i])
+        )
+
+    def breakdowns(self) -> List[ScoreBreakdown]:
+        return [self.breakdown(i) for i in range(len(self.overall))]
+
+
+def score_batch(
+    questions: Sequence[Question], answers: Sequence[str], times: Sequence[float], index=None
+) -> BatchScores:
+    """FEATURE: Batch scoring over many (question, answer, time) triples.
+
+    Text statistics come from the same analyzer as the engine, then every
+    scoring dimension is computed as a NumPy array. Topic similarity uses the
+    relevance model of `index` (the default bank if None), as the engine does.
+    Results match InterviewEngine._evaluate_response exactly.
+    """
+    import numpy as np  # Deferred: the engine imports this module's constants on every cold start
+    from relevance import get_model
+    if index is None:
+        from question_bank import QUESTION_INDEX as index
+
+    n = len(questions)
+    if len(answers) != n or len(times) != n:
+        raise ValueError("questions, answers and times must have the same length")
+
+    found, n_keywords, n_words, n_fillers, limits, terms = [], [], [], [], [], []
+    for q, answer in zip(questions, answers):
+        stats = analyze(q, answer)
+        terms.append(stats.terms)
+        found.append(len(stats.found))
+        n_keywords.append(len(q.expected_keywords))
+        n_words.append(stats.words)
+        n_fillers.append(stats.fillers)
+        limits.append(q.time_limit)
+    found = np.array(found, dtype=np.float64)
+    n_keywords = np.array(n_keywords, dtype=np.float64)
+    n_words = np.array(n_words, dtype=np.float64)
+    n_fillers = np.array(n_fillers, dtype=np.float64)
+    limits = np.array(limits, dtype=np.float64)
+    t = np.asarray(times, dtype=np.float64)
+    similarity = get_model(index).similarities(questions, terms)
+
+    # 1. Accuracy
+    has_keywords = n_keywords > 0
+    accuracy = np.full(n, float(NO_KEYWORD_ACCURACY))
+    accuracy[has_keywords] = (found[has_keywords] / n_keywords[has_keywords]) * 100
+
+    # 2. Relevance
+    relevance = np.minimum(100, (similarity / SIMILARITY_TARGET) * 100) * np.minimum(1.0, n_words / RELEVANCE_TARGET_WORDS)
+
+    # 3. Clarity
+    clarity = np.maximum(0, 100 - (n_fillers * FILLER_PENALTY))
+
+    # 4. Time Efficiency
+    time_efficiency = np.select(
+        [t <= GUESS_TIME, t <= limits * FAST_FRACTION, t <= limits],
+        [GUESS_EFFICIENCY, 100, 100 - ((t / limits) * 30)],
+        default=np.maximum(0, OVERTIME_BASE - ((t - limits) * OVERTIME_PENALTY))
+    ).astype(np.float64)
+
+    bonus = np.where((accuracy > BONUS_ACCURACY) & (t < limits * BONUS_TIME_FRACTION), SPEED_BONUS, 0.0)
+
+    overall = (accuracy * ACCURACY_WEIGHT) + (relevance * RELEVANCE_WEIGHT) + (clarity * CLARITY_WEIGHT) + (time_efficiency * TIME_WEIGHT) + bonus
+    overall = np.minimum(100, overall)
+
+    return BatchScores(accuracy, relevance, clarity, time_efficiency, overall, bonus)
@@ -0,0 +1,327 @@
+"""Asyncio session service hosting many InterviewEngine sessions in one process.
+
+The request API is a small dict protocol (`InterviewService.handle`) that is
+served over newline-delimited JSON by `serve()`, or called directly through
+`InProcessClient` for local use and testing:
+
+    python service.py --port 8765
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import time
+import uuid
+from typing import Any, Dict, Optional
+from models import (
+    CandidateProfile, JobDescription, InterviewConfig, InterviewResult, Question
+)
+from engine import InterviewEngine
+import instrumentation
+import question_bank
+import score_cache
+
+
+class SessionNotFound(KeyError):
+    pass
+
+
+class ServiceOverloaded(RuntimeError):
+    pass
+
+
+class _Session:
+    __slots__ = ("engine", "question", "served_at", "last_seen", "lock")
+
+    def __init__(self, engine: InterviewEngine, now: float):
+        self.engine = engine
+        self.question: Optional[Question] = None
+        self.served_at = now
+        self.last_seen = now
+        self.lock = asyncio.Lock()
+
+
+class InterviewService:
+    """FEATURE: Stateful interview sessions behind an async request API.
+
+    Idle sessions are evicted after `session_ttl` seconds. Engine work runs on
+    the event loop. A request counts as in flight from admission until it
+    completes, which includes waiting on its session's lock and on earlier
+    requests. Backpressure rejects a request with ServiceOverloaded when
+    `max_inflight` requests are already in flight, or when `max_sessions`
+    sessions are live.
+    With an `archive` (see archive.py), each session is queued for archiving
+    by the submit that finishes it.
+    """
+
+    def __init__(
+        self,
+        session_ttl: float = 1800.0,
+        max_sessions: int = 10_000,
+        max_inflight: int = 1_000,
+        sweep_interval: float = 30.0,
+        clock=time.monotonic,
+        archive=None
+    ):
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
+        self.max_inflight = max_inflight
+        self.sweep_interval = sweep_interval
+        self.clock = clock
+        self.archive = archive
+        self.sessions: Dict[str, _Session] = {}
+        self.inflight = 0
+        self.evicted = 0
+        self.rejected = 0
+        self._sweeper: Optional[asyncio.Task] = None
+
+    # --- lifecycle ---
+    async def start(self):
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+
+    async def stop(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep_forever(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.evict_expired()
+
+    def evict_expired(self) -> int:
+        cutoff = self.clock() - self.session_ttl
+        expired = [sid for sid, s in self.sessions.items() if s.last_seen < cutoff and not s.lock.locked()]
+        for sid in expired:
+            del self.sessions[sid]
+        self.evicted += len(expired)
+        return len(expired)
+
+    # --- session operations ---
+    @contextlib.asynccontextmanager
+    async def _admitted(self):
+        if self.inflight >= self.max_inflight:
+            self.rejected += 1
+            raise ServiceOverloaded(f"{self.inflight} requests in flight (limit {self.max_inflight}).")
+        self.inflight += 1
+        try:
+            # Engine work is synchronous and stays on the loop (its caches are single-threaded).
+            # Yielding once after admission lets requests that arrive together all be admitted
+            # and counted before any of them runs, so a burst beyond max_inflight is shed.
+            await asyncio.sleep(0)
+            yield
+        finally:
+            self.inflight -= 1
+
+    def _get(self, session_id: str) -> _Session:
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise SessionNotFound(session_id)
+        session.last_seen = self.clock()
+        return session
+
+    async def start_session(
+        self, candidate: CandidateProfile, jd: JobDescription, config: Optional[InterviewConfig] = None,
+        seed: Optional[int] = None
+    ) -> str:
+        async with self._admitted():
+            if len(self.sessions) >= self.max_sessions and not self.evict_expired():
+                self.rejected += 1
+                raise ServiceOverloaded(f"Session limit ({self.max_sessions}) reached.")
+            session = _Session(InterviewEngine(candidate, jd, config or InterviewConfig(), seed), self.clock())
+            session_id = uuid.uuid4().hex
+            # Registered before the engine starts, so concurrent starts count toward max_sessions
+            self.sessions[session_id] = session
+            async with session.lock:
+                try:
+                    session.question = session.engine.start_interview()
+                except BaseException:
+                    self.sessions.pop(session_id, None)
+                    raise
+            return session_id
+
+    async def next_question(self, session_id: str) -> Optional[Question]:
+        return self._get(session_id).question
+
+    async def submit_answer(self, session_id: str, answer: str, time_taken: Optional[float] = None) -> Optional[Question]:
+        async with self._admitted():
+            session = self._get(session_id)
+            async with session.lock:
+                if session.question is None:
+                    return None
+                if time_taken is None:
+                    time_taken = self.clock() - session.served_at
+                session.question = session.engine.process_response(session.question, answer, time_taken)
+                session.served_at = self.clock()
+                if session.question is None and self.archive is not None:
+                    self.archive.submit(session.engine, session_id)
+                return session.question
+
+    async def get_report(self, session_id: str) -> InterviewResult:
+        async with self._admitted():
+            session = self._get(session_id)
+            async with session.lock:
+                return session.engine.generate_final_report()
+
+    async def end_session(self, session_id: str) -> bool:
+        return self.sessions.pop(session_id, None) is not None
+
+    def metrics(self, format: str = "json") -> Any:
+        """Engine metrics as a JSON snapshot or Prometheus text; None when instrumentation is off."""
+        registry = instrumentation.ACTIVE
+        if registry is None:
+            return None
+        if format == "prometheus":
+            return registry.to_prometheus()
+        if format == "json":
+            return registry.snapshot()
+        raise ValueError(f"Unknown metrics format: {format!r}")
+
+    async def reload_bank(self) -> Optional[Dict[str, int]]:
+        """Hot-reload the question bank off the event loop; running sessions keep their snapshot."""
+        diff = await asyncio.get_running_loop().run_in_executor(None, question_bank.reload_bank)
+        if diff is None:
+            return None
+        return {"added": len(diff.added), "removed": len(diff.removed),
+                "changed": len(diff.changed), "unchanged": diff.unchanged}
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self.sessions),
+            "inflight": self.inflight,
+            "evicted": self.evicted,
+            "rejected": self.rejected,
+        }
+
+    # --- request API ---
+    async def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch one request dict: {"op": "start" | "submit" | "next" | "report" | "end" | "stats" | "metrics" | "reload", ...}."""
+        op = request.get("op")
+        try:
+            if op == "start":
+                session_id = await self.start_session(
+                    CandidateProfile(**request["candidate"]),
+                    JobDescription(**request["jd"]),
+                    InterviewConfig(**request["config"]) if request.get("config") else None,
+                    request.get("seed")
+                )
+                question = await self.next_question(session_id)
+                return {"ok": True, "session_id": session_id, "question": _dump(question)}
+            if op == "submit":
+                question = await self.submit_answer(request["session_id"], request["answer"], request.get("time_taken"))
+                return {"ok": True, "question": _dump(question)}
+            if op == "next":
+                return {"ok": True, "question": _dump(await self.next_question(request["session_id"]))}
+            if op == "report":
+                report = await self.get_report(request["session_id"])
+                return {"ok": True, "report": report.model_dump(mode="json")}
+            if op == "end":
+                return {"ok": True, "ended": await self.end_session(request["session_id"])}
+            if op == "stats":
+                return {"ok": True, "stats": self.stats()}
+            if op == "metrics":
+                return {"ok": True, "metrics": self.metrics(request.get("format", "json"))}
+            if op == "reload":
+                return {"ok": True, "reload": await self.reload_bank()}
+            return {"ok": False, "error": "bad_request", "detail": f"Unknown op: {op!r}"}
+        except SessionNotFound as e:
+            return {"ok": False, "error": "session_not_found", "detail": str(e)}
+        except ServiceOverloaded as e:
+            return {"ok": False, "error": "overloaded", "detail": str(e)}
+        except (KeyError, TypeError, ValueError) as e:
+            return {"ok": False, "error": "bad_request", "detail": str(e)}
+
+
+def _dump(question: Optional[Question]) -> Optional[Dict[str, Any]]:
+    return question.model_dump(mode="json") if question is not None else None
+
+
+class InProcessClient:
+    """Calls the service's request API directly, without a socket."""
+
+    def __init__(self, service: InterviewService):
+        self.service = service
+
+    async def start(self, candidate: dict, jd: dict, config: Optional[dict] = None, seed: Optional[int] = None) -> dict:
+        return await self.service.handle({"op": "start", "candidate": candidate, "jd": jd, "config": config, "seed": seed})
+
+    async def submit(self, session_id: str, answer: str, time_taken: Optional[float] = None) -> dict:
+        return await self.service.handle({"op": "submit", "session_id": session_id, "answer": answer, "time_taken": time_taken})
+
+    async def next(self, session_id: str) -> dict:
+        return await self.service.handle({"op": "next", "session_id": session_id})
+
+    async def report(self, session_id: str) -> dict:
+        return await self.service.handle({"op": "report", "session_id": session_id})
+
+    async def end(self, session_id: str) -> dict:
+        return await self.service.handle({"op": "end", "session_id": session_id})
+
+    async def metrics(self, format: str = "json") -> dict:
+        return await self.service.handle({"op": "metrics", "format": format})
+
+    async def reload(self) -> dict:
+        return await self.service.handle({"op": "reload"})
+
+
+async def serve(service: InterviewService, host: str = "127.0.0.1", port: int = 8765):
+    """Serve the request API as newline-delimited JSON over TCP."""
+    async def on_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    response = {"ok": False, "error": "bad_request", "detail": str(e)}
+                else:
+                    response = await service.handle(request)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    await service.start()
+    server = await asyncio.start_server(on_client, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="InterviewEngine session service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ttl", type=float, default=1800.0)
+    parser.add_argument("--max-sessions", type=int, default=10_000)
+    parser.add_argument("--metrics", action="store_true", help="Enable engine instrumentation (op: metrics)")
+    parser.add_argument("--score-cache", action="store_true", help="Memoize answer scores (retries, re-submissions)")
+    parser.add_argument("--score-cache-db", metavar="PATH", help="Also keep memoized scores in this SQLite file")
+    parser.add_argument("--archive", metavar="PATH", help="Archive finished sessions to this SQLite file")
+    parser.add_argument("--watch-bank", type=float, metavar="SECONDS",
+                        help="Reload the question bank when its files change (op: reload reloads on demand)")
+    args = parser.parse_args()
+    if args.metrics:
+        instrumentation.enable()
+    if args.score_cache or args.score_cache_db:
+        score_cache.enable(path=args.score_cache_db)
+    archive = None
+    if args.archive:
+        from archive import SessionArchive
+        archive = SessionArchive(args.archive)
+    watcher = question_bank.BankWatcher(args.watch_bank) if args.watch_bank else None
+    service = InterviewService(session_ttl=args.ttl, max_sessions=args.max_sessions, archive=archive)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    finally:
+        score_cache.disable()
+        if watcher is not None:
+            watcher.stop()
+        if archive is not None:
+            archive.close()
@@ -0,0 +1,217 @@
+"""Headless interview simulator for throughput and capacity testing.
+
+Drives InterviewEngine through start_interview -> process_response ->
+generate_final_report with synthetic candidates, fanned out over a process
+pool. Run from the repo root:
+
+    python simulator.py --candidates 2000 --workers 4 --profile mixed
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from pydantic import BaseModel
+from models import (
+    CandidateProfile, JobDescription, InterviewConfig, Difficulty, Question
+)
+from engine import InterviewEngine
+import question_bank
+
+PADDING_WORDS = [
+    "the", "system", "handles", "requests", "by", "using", "a", "layer", "that", "stores",
+    "data", "and", "then", "returns", "results", "to", "clients", "with", "low", "overhead"
+]
+FILLERS = ["basically", "um", "ah", "like", "actually", "just"]
+EXPERIENCE_LEVELS = ["Entry", "Mid-Level", "Senior", "Lead"]
+
+
+class AnswerProfile(BaseModel):
+    """Knobs for one population of synthetic candidates."""
+    name: str
+    keyword_coverage: float       # Probability each expected keyword appears
+    filler_rate: float            # Probability a word is replaced by a filler
+    min_words: int = 10
+    max_words: int = 60
+    time_fraction_mean: float     # Mean answer time as a fraction of the limit
+    time_fraction_sd: float = 0.2
+
+
+PROFILES: Dict[str, AnswerProfile] = {
+    "strong": AnswerProfile(name="strong", keyword_coverage=0.9, filler_rate=0.01, min_words=25, max_words=80, time_fraction_mean=0.35),
+    "average": AnswerProfile(name="average", keyword_coverage=0.55, filler_rate=0.05, time_fraction_mean=0.7),
+    "weak": AnswerProfile(name="weak", keyword_coverage=0.15, filler_rate=0.15, min_words=0, max_words=25, time_fraction_mean=1.1, time_fraction_sd=0.4),
+}
+
+
+class AnswerGenerator:
+    """Builds a synthetic (answer, time_taken) pair for a question."""
+
+    def __init__(self, profile: AnswerProfile, rng: random.Random):
+        self.profile = profile
+        self.rng = rng
+
+    def generate(self, question: Question) -> Tuple[str, float]:
+        p, rng = self.profile, self.rng
+        words = [
+            rng.choice(FILLERS) if rng.random() < p.filler_rate else rng.choice(PADDING_WORDS)
+            for _ in range(rng.randint(p.min_words, p.max_words))
+        ]
+        for kw in question.expected_keywords:
+            if rng.random() < p.keyword_coverage:
+                words.insert(rng.randint(0, len(words)), kw)
+        fraction = max(0.01, rng.gauss(p.time_fraction_mean, p.time_fraction_sd))
+        return " ".join(words), fraction * question.time_limit
+
+
+class SimulationSummary(BaseModel):
+    candidates: int
+    workers: int
+    wall_seconds: float
+    interviews_per_sec: float
+    latency_ms: Dict[str, Dict[str, float]]   # call -> percentile -> milliseconds
+    final_score: Dict[str, float]
+    status_counts: Dict[str, int]
+    questions_asked: Dict[str, float]
+
+
+def _random_candidate(rng: random.Random) -> Tuple[CandidateProfile, JobDescription]:
+    skills = sorted(question_bank.QUESTION_INDEX.skills)
+    candidate = CandidateProfile(
+        name=f"sim-{rng.randrange(10**9)}",
+        experience_level=rng.choice(EXPERIENCE_LEVELS),
+        skills=rng.sample(skills, rng.randint(1, len(skills)))
+    )
+    jd = JobDescription(
+        required_skills=rng.sample(skills, rng.randint(1, min(3, len(skills)))),
+        difficulty_expectation=rng.choice(list(Difficulty))
+    )
+    return candidate, jd
+
+
+def _run_shard(n: int, seed: int, profile_names: List[str], config: dict) -> dict:
+    """Worker entry point: run `n` interviews with RNGs seeded from `seed`."""
+    rng = random.Random(seed)
+    generators = [AnswerGenerator(PROFILES[name], rng) for name in profile_names]
+    interview_config = InterviewConfig(**config)
+    latencies = {"start_interview": [], "process_response": [], "generate_final_report": []}
+    scores, statuses, asked = [], [], []
+    clock = time.perf_counter
+
+    for _ in range(n):
+        candidate, jd = _random_candidate(rng)
+        generator = rng.choice(generators)
+        engine = InterviewEngine(candidate, jd, interview_config, seed=rng.getrandbits(64))
+
+        t0 = clock()
+        question = engine.start_interview()
+        latencies["start_interview"].append(clock() - t0)
+        while question is not None:
+            answer, time_taken = generator.generate(question)
+            t0 = clock()
+            question = engine.process_response(question, answer, time_taken)
+            latencies["process_response"].append(clock() - t0)
+
+        t0 = clock()
+        result = engine.generate_final_report()
+        latencies["generate_final_report"].append(clock() - t0)
+        scores.append(result.final_score)
+        statuses.append(result.status.value)
+        asked.append(len(result.timeline))
+
+    return {"latencies": latencies, "scores": scores, "statuses": statuses, "asked": asked}
+
+
+def _percentiles(values: List[float], scale: float = 1.0) -> Dict[str, float]:
+    if not values:
+        return {}
+    arr = np.asarray(values) * scale
+    p50, p90, p99 = np.percentile(arr, [50, 90, 99])
+    return {"p50": float(p50), "p90": float(p90), "p99": float(p99), "max": float(arr.max()), "mean": float(arr.mean())}
+
+
+def run_simulation(
+    candidates: int,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    profiles: Optional[List[str]] = None,
+    config: Optional[InterviewConfig] = None
+) -> SimulationSummary:
+    """FEATURE: Run `candidates` synthetic interviews and summarize throughput and outcomes."""
+    workers = workers or os.cpu_count() or 1
+    profiles = profiles or list(PROFILES)
+    config_dict = (config or InterviewConfig()).model_dump()
+    shard_sizes = [candidates // workers + (1 if i < candidates % workers else 0) for i in range(workers)]
+    shard_sizes = [size for size in shard_sizes if size > 0]
+    # Distinct, reproducible seed per worker shard
+    seeds = [seed * 1_000_003 + i for i in range(len(shard_sizes))]
+
+    t0 = time.perf_counter()
+    if len(shard_sizes) <= 1:
+        shards = [_run_shard(size, s, profiles, config_dict) for size, s in zip(shard_sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(shard_sizes)) as pool:
+            futures = [pool.submit(_run_shard, size, s, profiles, config_dict) for size, s in zip(shard_sizes, seeds)]
+            shards = [f.result() for f in futures]
+    wall = time.perf_counter() - t0
+
+    latencies: Dict[str, List[float]] = {}
+    scores, statuses, asked = [], [], []
+    for shard in shards:
+        for call, values in shard["latencies"].items():
+            latencies.setdefault(call, []).extend(values)
+        scores.extend(shard["scores"])
+        statuses.extend(shard["statuses"])
+        asked.extend(shard["asked"])
+
+    status_counts: Dict[str, int] = {}
+    for s in statuses:
+        status_counts[s] = status_counts.get(s, 0) + 1
+
+    return SimulationSummary(
+        candidates=candidates,
+        workers=len(shard_sizes),
+        wall_seconds=wall,
+        interviews_per_sec=candidates / wall if wall > 0 else 0.0,
+        latency_ms={call: _percentiles(values, 1000.0) for call, values in latencies.items()},
+        final_score=_percentiles(scores),
+        status_counts=status_counts,
+        questions_asked=_percentiles(asked)
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless InterviewEngine simulator")
+    parser.add_argument("--candidates", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", choices=list(PROFILES) + ["mixed"], default="mixed")
+    parser.add_argument("--max-questions", type=int, default=InterviewConfig().max_questions)
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = run_simulation(
+        args.candidates,
+        workers=args.workers,
+        seed=args.seed,
+        profiles=None if args.profile == "mixed" else [args.profile],
+        config=InterviewConfig(max_questions=args.max_questions)
+    )
+    if args.json:
+        print(json.dumps(summary.model_dump(), indent=2))
+        return
+
+    print(f"🏁 {summary.candidates} interviews on {summary.workers} workers in {summary.wall_seconds:.2f}s "
+          f"({summary.interviews_per_sec:,.0f} interviews/sec)")
+    for call, pct in summary.latency_ms.items():
+        print(f"   {call:<22} p50 {pct['p50']:.3f}ms  p90 {pct['p90']:.3f}ms  p99 {pct['p99']:.3f}ms")
+    fs = summary.final_score
+    print(f"📊 Final score p50 {fs['p50']:.1f}  p90 {fs['p90']:.1f}  mean {fs['mean']:.1f}")
+    print(f"🚩 Status: {', '.join(f'{k}={v}' for k, v in sorted(summary.status_counts.items()))}")
+
+
+if __name__ == "__main__":
+    main()
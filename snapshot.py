@@ -0,0 +1,211 @@
+"""Compact, versioned binary encoding of InterviewEngine state.
+
+Layout: MAGIC | version (u8) | flags (u8) | body. The body is zlib-compressed
+when FLAG_ZLIB is set. Integers are unsigned LEB128 varints, floats are
+little-endian float64, strings are varint-length-prefixed UTF-8. History
+stores question ids; questions are resolved against the bank index on restore.
+
+The decision trace is stored as structured events (type, timestamp, JSON
+fields), followed by the session RNG state, so a restored session draws the
+same questions it would have drawn. Version 4 adds the termination rule
+that ended an early-terminated session. Version 3 snapshots restore with no
+rule recorded.
+"""
+import json
+import sys
+import struct
+import zlib
+from typing import List, Optional
+from decision_trace import DecisionTrace, TraceEvent
+from history import STATUS_CODES, DIFFICULTY_CODES, Scores
+from models import Question, CandidateProfile, JobDescription, InterviewConfig
+
+MAGIC = b"IESN"
+VERSION = 4
+SUPPORTED_VERSIONS = (3, 4)
+FLAG_ZLIB = 0x01
+
+_F64 = struct.Struct("<d")
+_SCORES = struct.Struct("<6d")
+
+
+class _Writer:
+    def __init__(self):
+        self.buf = bytearray()
+
+    def uint(self, value: int):
+        if value < 0:
+            raise ValueError(f"Cannot encode negative integer {value}")
+        while value >= 0x80:
+            self.buf.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buf.append(value)
+
+    def f64(self, value: float):
+        self.buf += _F64.pack(value)
+
+    def str(self, value: str):
+        data = value.encode("utf-8")
+        self.uint(len(data))
+        self.buf += data
+
+    def opt_str(self, value: Optional[str]):
+        self.buf.append(0 if value is None else 1)
+        if value is not None:
+            self.str(value)
+
+    def str_list(self, values: List[str]):
+        self.uint(len(values))
+        for v in values:
+            self.str(v)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def uint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def byte(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def f64(self) -> float:
+        value = _F64.unpack_from(self.data, self.pos)[0]
+        self.pos += 8
+        return value
+
+    def str(self) -> str:
+        n = self.uint()
+        value = str(self.data[self.pos:self.pos + n], "utf-8")
+        self.pos += n
+        return value
+
+    def opt_str(self) -> Optional[str]:
+        return self.str() if self.byte() else None
+
+    def str_list(self) -> List[str]:
+        return [self.str() for _ in range(self.uint())]
+
+
+def encode_engine(engine, compress: bool = True) -> bytes:
+    w = _Writer()
+    c, jd, cfg = engine.candidate, engine.jd, engine.config
+    w.str(c.name)
+    w.str(c.experience_level)
+    w.str_list(c.skills)
+    w.str(jd.role_type)
+    w.str_list(jd.required_skills)
+    w.uint(DIFFICULTY_CODES.index(jd.difficulty_expectation))
+    w.uint(cfg.max_questions)
+    w.uint(cfg.early_termination_threshold_count)
+    w.f64(cfg.min_score_threshold)
+    w.f64(cfg.ramp_rate)
+
+    w.uint(STATUS_CODES.index(engine.state))
+    w.uint(DIFFICULTY_CODES.index(engine.current_difficulty))
+    w.uint(engine.current_question_index)
+    w.uint(engine.consecutive_strong_answers)
+    w.uint(engine.consecutive_weak_answers)
+    w.f64(engine.total_score_sum)
+    w.opt_str(engine.termination_reason)
+    w.opt_str(engine._termination_rule)
+
+    records = engine.records
+    w.uint(len(records))
+    for i in range(len(records)):
+        w.str(records.questions[i].id)
+        w.str(records.answers[i])
+        w.f64(records.time_taken(i))
+        w.buf.append(1 if records.is_timeout(i) else 0)
+        w.buf += _SCORES.pack(*records.scores(i))
+        w.buf.append(STATUS_CODES.index(records.state(i)))
+        w.buf.append(DIFFICULTY_CODES.index(records.difficulty(i)))
+        w.str(records.feedback[i])
+
+    trace = engine.trace
+    w.uint(trace.events.maxlen)
+    w.uint(trace.dropped)
+    w.uint(len(trace.events))
+    for event in trace.events:
+        w.str(event.type)
+        w.f64(event.ts)
+        w.str(json.dumps(event.fields, separators=(",", ":"), ensure_ascii=False))
+    w.uint(engine.rng.getstate())
+
+    body = bytes(w.buf)
+    flags = 0
+    if compress:
+        body = zlib.compress(body, 1)
+        flags |= FLAG_ZLIB
+    return MAGIC + bytes([VERSION, flags]) + body
+
+
+def decode_into(engine_cls, data: bytes, index):
+    """Rebuild an engine from `encode_engine` output, resolving questions through `index`."""
+    if data[:4] != MAGIC:
+        raise ValueError("Not an InterviewEngine snapshot.")
+    version, flags = data[4], data[5]
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError(f"Unsupported snapshot version {version} (expected one of {SUPPORTED_VERSIONS}).")
+    body = data[6:]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+    r = _Reader(body)
+
+    candidate = CandidateProfile.model_construct(name=r.str(), experience_level=r.str(), skills=r.str_list())
+    jd = JobDescription.model_construct(
+        role_type=r.str(), required_skills=r.str_list(), difficulty_expectation=DIFFICULTY_CODES[r.uint()]
+    )
+    config = InterviewConfig.model_construct(
+        max_questions=r.uint(), early_termination_threshold_count=r.uint(),
+        min_score_threshold=r.f64(), ramp_rate=r.f64()
+    )
+    engine = engine_cls(candidate, jd, config)
+    engine.index = index
+
+    engine.state = STATUS_CODES[r.uint()]
+    engine.current_difficulty = DIFFICULTY_CODES[r.uint()]
+    engine.current_question_index = r.uint()
+    engine.consecutive_strong_answers = r.uint()
+    engine.consecutive_weak_answers = r.uint()
+    total_score_sum = r.f64()
+    engine.termination_reason = r.opt_str()
+    if version >= 4:
+        engine._termination_rule = r.opt_str()
+
+    for _ in range(r.uint()):
+        qid = r.str()
+        question: Optional[Question] = index.get(qid)
+        if question is None:
+            raise ValueError(f"Snapshot references unknown question id {qid!r}.")
+        answer = r.str()
+        time_taken = r.f64()
+        is_timeout = bool(r.byte())
+        scores = _SCORES.unpack_from(r.data, r.pos)
+        r.pos += _SCORES.size
+        state_at_time = STATUS_CODES[r.byte()]
+        difficulty_at_time = DIFFICULTY_CODES[r.byte()]
+        engine._record(
+            question, answer, time_taken, is_timeout, Scores(*scores),
+            state_at_time, difficulty_at_time, sys.intern(r.str())
+        )
+    # Keep the stored sum bit-exact rather than re-accumulated
+    engine.total_score_sum = total_score_sum
+    trace = DecisionTrace(capacity=r.uint())
+    trace.dropped = r.uint()
+    for _ in range(r.uint()):
+        trace.events.append(TraceEvent(r.str(), r.f64(), json.loads(r.str())))
+    engine.trace = trace
+    engine.rng.setstate(r.uint())
+    return engine
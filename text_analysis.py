@@ -0,0 +1,57 @@
+"""Answer analysis shared by every text-based scoring dimension.
+
+An answer is lowercased once; that one string feeds the word count and topic
+terms (relevance), filler detection (clarity) and keyword matching (accuracy).
+
+Fillers are whole tokens, where a token is a whitespace-separated chunk with
+any surrounding punctuation ignored, so "like," and "(um)" count but
+"like-minded" does not. Filler phrases are consecutive tokens, e.g. "you know"
+or "sort of,". All fillers are found by one compiled regex scan, which keeps
+long answers on the C side instead of looping over tokens in Python
+(benchmarks/bench_text.py times it against a tokenizer with the same rules).
+"""
+import re
+import string
+from typing import Dict, List, NamedTuple, Tuple
+from models import Question
+from keyword_matcher import get_matcher
+from relevance import term_counts
+
+FILLER_WORDS = frozenset(["basically", "um", "ah", "like", "actually", "just"])
+FILLER_PHRASES: Tuple[Tuple[str, ...], ...] = (("you", "know"), ("sort", "of"), ("kind", "of"), ("i", "mean"))
+PUNCTUATION = string.punctuation
+
+
+def _filler_pattern() -> "re.Pattern":
+    punct = f"[{re.escape(PUNCTUATION)}]*"
+    # Phrases first so "sort of" is never split into two shorter alternatives
+    alternatives = [r"\s+".join(map(re.escape, phrase)) for phrase in FILLER_PHRASES]
+    alternatives += [re.escape(word) for word in sorted(FILLER_WORDS, key=len, reverse=True)]
+    # Anchored on a leading whitespace character (the answer is padded with one space on each
+    # side) rather than a lookbehind, so the scan can skip straight between token boundaries
+    return re.compile(rf"\s{punct}(?:{'|'.join(alternatives)}){punct}(?=\s)")
+
+
+_FILLER_RE = _filler_pattern()
+
+
+class TextStats(NamedTuple):
+    """Everything the scorers need from one answer."""
+    words: int               # Whitespace-separated tokens
+    fillers: int             # Filler words plus filler phrases
+    found: List[str]         # Expected keywords present, in question order
+    chars: int
+    terms: Dict[str, int]    # Topic-term counts for relevance (see relevance.py)
+
+
+def analyze(question: Question, answer: str) -> TextStats:
+    """FEATURE: One analysis pass over an answer for accuracy, relevance and clarity."""
+    lowered = answer.lower()
+    matcher = get_matcher(question)
+    return TextStats(
+        words=len(lowered.split()),
+        fillers=len(_FILLER_RE.findall(f" {lowered} ")),
+        found=matcher.found_lowered(lowered) if matcher.keywords else [],
+        chars=len(answer),
+        terms=term_counts(lowered)
+    )